@@ -1,89 +1,513 @@
-from flask import Flask, request, render_template, redirect, url_for, flash, session
+from flask import Flask, request, render_template, redirect, url_for, flash, get_flashed_messages, session, make_response, g, has_request_context, send_from_directory, abort, Response, stream_with_context
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from flask_mysqldb import MySQL
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_session import Session
+from flask_session.sessions import RedisSessionInterface
 import socket
 import redis
+import MySQLdb
+import MySQLdb.cursors
 import json
+import mimetypes
 from datetime import datetime
+import hashlib
+import zlib
+import multiprocessing
 import logging
 import os
 import time
 import threading
+import itertools
+import queue
 from functools import wraps
+from collections import OrderedDict, namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FuturesTimeoutError
+from board_common import (
+    parse_replica_hosts, config_from_gcp_secret, config_from_aws_secret, load_local_config,
+    probe_ec2_metadata, probe_gcp_metadata, hostname_suggests_aws, build_cloud_status, STATUS_CHANNEL, sse_message,
+    CompactSessionSerializer, password_hash_prefix, BoardPage, encode_board_cursor, decode_board_cursor, clamp_page_size,
+    newer_board_page_query, older_board_page_query, newer_board_page, older_board_page,
+    BOARD_CACHE_VERSION_KEY, board_cache_key, serialize_board_page, deserialize_board_page,
+    POST_META_QUERY, POST_VIEW_QUERY, template_fingerprint, make_post_etag, is_not_modified,
+    set_private_etag, set_post_cache_headers, dumps_json, POST_API_FIELDS, POST_LIST_FIELDS,
+    POST_LIST_DEFAULT_FIELDS, POST_DETAIL_DEFAULT_FIELDS, POST_API_META_QUERY, parse_post_fields,
+    post_list_query, post_list_body, post_detail_query, post_detail_etag,
+    ASSET_MAX_AGE, build_asset_manifest, manifest_fingerprint, unhashed_asset_path
+)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 선택: Prometheus 메트릭 (prometheus_client 미설치 시 계측은 no-op, /metrics는 503)
+# 여러 워커 프로세스를 합산하려면 PROMETHEUS_MULTIPROC_DIR 를 지정한다
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess as prometheus_multiprocess
+except ImportError:
+    prometheus_client = None
+
+class _NoopMetric:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def observe(self, amount):
+        pass
+
+def _metric(kind, name, documentation, labelnames=(), **kwargs):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return getattr(prometheus_client, kind)(name, documentation, labelnames, **kwargs)
+
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+REQUEST_LATENCY = _metric('Histogram', 'flask_request_duration_seconds', 'Request latency',
+                          ('endpoint', 'method', 'status'))
+REQUESTS_IN_FLIGHT = _metric('Gauge', 'flask_requests_in_flight', 'Requests currently being served',
+                             ('endpoint',), multiprocess_mode='livesum')
+DB_QUERY_LATENCY = _metric('Histogram', 'mysql_query_duration_seconds', 'MySQL query latency',
+                           ('endpoint',), buckets=FAST_BUCKETS)
+DB_QUERIES_PER_REQUEST = _metric('Histogram', 'mysql_queries_per_request', 'MySQL queries per request',
+                                 ('endpoint',), buckets=(0, 1, 2, 3, 5, 10, 20, 50))
+REDIS_CALL_LATENCY = _metric('Histogram', 'redis_call_duration_seconds', 'Redis call latency',
+                             ('command',), buckets=FAST_BUCKETS)
+PROVIDER_SWITCHES = _metric('Counter', 'provider_switches_total', 'Cloud provider switches',
+                            ('from_provider', 'to_provider', 'warm_standby'))
+SESSION_BYTES = _metric('Histogram', 'session_payload_bytes', 'Serialized session size written to Redis',
+                       buckets=(32, 64, 128, 256, 512, 1024, 2048, 4096, 8192))
+SESSION_OPS = _metric('Counter', 'session_store_operations_total', 'Session store operations', ('op',))
+COMPRESSION_BYTES = _metric('Counter', 'response_compression_bytes_total', 'Response bytes before/after compression',
+                           ('encoding', 'stage'))
+COMPRESSION_CPU = _metric('Histogram', 'response_compression_cpu_seconds', 'CPU time spent compressing a response',
+                          ('encoding',), buckets=FAST_BUCKETS)
+HEALTH_PROBE_LATENCY = _metric('Histogram', 'health_probe_duration_seconds', 'Background health probe latency',
+                               ('check', 'ok'))
+
+def metrics_endpoint_label():
+    """요청 중이면 Flask endpoint 이름, 백그라운드 스레드면 'background'"""
+    if has_request_context():
+        return request.endpoint or 'unknown'
+    return 'background'
+
 # 환경 변수로 우선순위 결정 (GCP: primary, AWS: secondary)
-PREFERRED_CLOUD = os.getenv('PREFERRED_CLOUD', 'GCP')  # GCP 또는 AWS
+PREFERRED_CLOUD = os.getenv('PREFERRED_CLOUD', 'GCP')  # GCP, AWS 또는 LOCAL
+
+# LOCAL 프로바이더 설정 파일 (JSON, GCP 시크릿과 같은 키). 없으면 환경 변수 사용
+LOCAL_CONFIG_FILE = os.getenv('LOCAL_CONFIG_FILE')
+
+# 프로바이더 점검 전체 제한 시간 (초), 메타데이터 감지 제한 시간 (초)
+BOOTSTRAP_TIMEOUT = float(os.getenv('BOOTSTRAP_TIMEOUT', '8'))
+METADATA_PROBE_TIMEOUT = float(os.getenv('METADATA_PROBE_TIMEOUT', '2'))
+
+# 시크릿 캐시 설정 (TTL 초, TTL 중 이 비율이 지나면 백그라운드에서 미리 갱신)
+SECRET_CACHE_TTL = int(os.getenv('SECRET_CACHE_TTL', '300'))
+SECRET_REFRESH_AHEAD = float(os.getenv('SECRET_REFRESH_AHEAD', '0.8'))
+# 갱신 실패 후 캐시된 설정으로 버티며 다시 시도하기까지 대기 시간 (초)
+SECRET_RETRY_BACKOFF = float(os.getenv('SECRET_RETRY_BACKOFF', '30'))
+# 선택: 암호화된 디스크 스냅샷 (재시작 시 캐시 복원, cryptography 패키지 필요)
+SECRET_CACHE_FILE = os.getenv('SECRET_CACHE_FILE')
+SECRET_CACHE_KEY = os.getenv('SECRET_CACHE_KEY')
+
+# 시크릿 필드별로 영향을 받는 연결
+MYSQL_CONFIG_FIELDS = ('mysql_host', 'mysql_user', 'mysql_password', 'mysql_db')
+# 레플리카 풀은 primary 자격 증명을 공유하므로 둘 중 하나라도 바뀌면 다시 만든다
+MYSQL_REPLICA_FIELDS = MYSQL_CONFIG_FIELDS + ('mysql_replicas',)
+REDIS_CONFIG_FIELDS = ('redis_host',)
+
+# 대기(standby) 클라우드에 소규모 연결을 미리 열어 두고 failover 시 즉시 전환
+WARM_STANDBY = os.getenv('WARM_STANDBY', 'false').lower() == 'true'
+
+# pre-fork 서버(preload)용: import 시 연결 워밍업과 백그라운드 스레드를 미루고 fork 이후 워커마다 start_worker() 호출
+DEFER_STARTUP = os.getenv('APP_DEFER_STARTUP', 'false').lower() == 'true'
+
+# 서킷 브레이커 설정 (연속 실패 횟수, 열린 뒤 half-open 시도까지 대기 시간)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', '10'))
+
+# 연결 장애로 볼 MySQL 오류 코드 (SQL 오류 등은 제외)
+MYSQL_CONNECTION_ERROR_CODES = {1040, 1045, 1053, 1129, 2002, 2003, 2005, 2006, 2013, 2055}
+
+# 이름별 서킷 브레이커 (상태 조회용), 서킷이 열릴 때 호출할 listener(breaker)
+circuit_breakers = {}
+circuit_open_listeners = []
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 의존성을 호출하지 않고 즉시 실패"""
+
+    def __init__(self, name):
+        super().__init__(f"Circuit '{name}' is open")
+        self.name = name
+
+class CircuitBreaker:
+    """의존성별 서킷 브레이커 (closed -> open -> half_open -> closed)
+
+    open 상태에서는 호출 없이 CircuitOpenError를 내고, reset_timeout이 지나면
+    호출 하나만 시험(probe)으로 통과시켜 결과에 따라 닫거나 다시 연다.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, name, dependency, failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout=CIRCUIT_RESET_TIMEOUT):
+        self.name = name
+        self.dependency = dependency
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self.rejected = 0
+        self.lock = threading.Lock()
+        circuit_breakers[name] = self
+
+    def before_call(self):
+        """호출 전 확인: 열려 있으면 CircuitOpenError"""
+        if self.state == self.CLOSED:
+            return
+        with self.lock:
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.probe_started_at = now
+                logger.info(f"Circuit '{self.name}' half-open, probing")
+                return
+            # half-open 시험 호출이 응답 없이 오래 걸리면 다음 호출에 시험 기회를 넘긴다
+            if self.state == self.HALF_OPEN and now - self.probe_started_at >= self.reset_timeout:
+                self.probe_started_at = now
+                return
+            if self.state != self.CLOSED:
+                self.rejected += 1
+                raise CircuitOpenError(self.name)
+
+    def record_success(self):
+        if self.state == self.CLOSED and not self.failures:
+            return
+        with self.lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                opened = True
+            else:
+                opened = False
+        if opened:
+            logger.warning(f"Circuit '{self.name}' opened after {self.failures} failures")
+            for listener in circuit_open_listeners:
+                listener(self)
+
+    def call(self, func, *args, **kwargs):
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if classify_dependency_error(e) == self.dependency:
+                self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def reset(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def get_state(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'rejected': self.rejected,
+            'opened_at': self.opened_at if self.state != self.CLOSED else None
+        }
+
+def classify_dependency_error(error):
+    """예외 타입으로 장애 의존성 분류 -> 'mysql' / 'mysql_replica' / 'redis' / 'secrets' / None"""
+    # 커서/풀에서 의존성을 표시한 예외 (레플리카 장애가 프로바이더 failover로 이어지지 않도록)
+    dependency = getattr(error, 'dependency', None)
+    if dependency is not None:
+        return dependency
+    if isinstance(error, CircuitOpenError):
+        return circuit_breakers[error.name].dependency
+    if isinstance(error, (PoolTimeoutError, MySQLdb.InterfaceError)):
+        return 'mysql'
+    if isinstance(error, MySQLdb.OperationalError):
+        code = error.args[0] if error.args else None
+        return 'mysql' if code in MYSQL_CONNECTION_ERROR_CODES else None
+    if isinstance(error, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)):
+        return 'redis'
+    if isinstance(error, SecretFetchError):
+        return 'secrets'
+    return None
+
+class PoolTimeoutError(Exception):
+    """풀에서 제한 시간 안에 연결을 얻지 못함"""
+
+class SecretFetchError(Exception):
+    """시크릿 서비스 호출 실패"""
 
 class CloudProvider:
     """클라우드 제공업체별 설정 관리"""
     
     def __init__(self):
-        self.gcp_available = True
-        self.aws_available = True
+        # LOCAL 모드에서는 클라우드 시크릿/메타데이터를 전혀 사용하지 않는다
+        self.gcp_available = PREFERRED_CLOUD != 'LOCAL'
+        self.aws_available = PREFERRED_CLOUD != 'LOCAL'
         self.current_provider = PREFERRED_CLOUD
         self.last_health_check = time.time()
         self.current_config = None
+        self.last_check_timings = {}
+        self.bootstrap_checks = None
+        # 프로바이더별 시크릿 캐시: {'config', 'version', 'fetched_at'}
+        self.secret_cache = {}
+        self.secret_clients = {}
+        self.secret_lock = threading.Lock()
+        self.secret_refreshing = set()
+        # 워커 시작(start_worker) 전에는 갱신 스레드를 띄우지 않고 갱신할 프로바이더만 기록
+        # (pre-fork master에서 띄운 스레드는 fork 시점에 락을 잡고 있을 수 있고 결과도 워커에 전달되지 않음)
+        self.refresh_ahead = False
+        self.deferred_refresh = set()
+        # 현재 프로바이더의 시크릿이 교체(rotation)되었을 때 호출: listener(config, changed_fields)
+        self.rotation_listeners = []
+        # 프로바이더 전환 후 호출: listener(last_switch)
+        self.switch_listeners = []
+        # 앱이 실제로 사용 중인 연결 묶음, 미리 연결해 둔 대기 연결 묶음
+        self.active = None
+        self.standby = None
+        self.switch_lock = threading.Lock()
+        self.last_switch = None
+        self.secret_breakers = {name: CircuitBreaker(f'secrets:{name}', 'secrets') for name in ('GCP', 'AWS')}
+        self.config_loaders = {'GCP': self.get_gcp_config, 'AWS': self.get_aws_config, 'LOCAL': self.get_local_config}
+        self._load_secret_snapshot()
         
+    def _secret_client(self, provider):
+        """시크릿 API 클라이언트 재사용 (매 호출마다 채널을 새로 만들지 않음)"""
+        client = self.secret_clients.get(provider)
+        if client is None:
+            # import를 함수 안에서 수행하여 다른 클라우드 환경에서 오류 방지
+            if provider == 'GCP':
+                from google.cloud import secretmanager
+                client = secretmanager.SecretManagerServiceClient()
+            else:
+                import boto3
+                session_aws = boto3.session.Session()
+                client = session_aws.client('secretsmanager', region_name="us-east-2")
+            self.secret_clients[provider] = client
+        return client
+    
+    def _fetch_gcp_secret(self):
+        """GCP Secret Manager에서 최신 시크릿 조회 -> (config, version)"""
+        client = self._secret_client('GCP')
+        name = client.secret_version_path("hifrodo-05", "project-secrets", "latest")
+        response = client.access_secret_version(request={"name": name})
+        return config_from_gcp_secret(json.loads(response.payload.data.decode("UTF-8"))), response.name
+    
+    def _get_gcp_secret_version(self):
+        """GCP 최신 시크릿 버전 이름만 조회 (payload 없음)"""
+        client = self._secret_client('GCP')
+        name = client.secret_version_path("hifrodo-05", "project-secrets", "latest")
+        return client.get_secret_version(request={"name": name}).name
+    
+    def _fetch_aws_secret(self):
+        """AWS Secrets Manager에서 최신 시크릿 조회 -> (config, version)"""
+        client = self._secret_client('AWS')
+        response = client.get_secret_value(SecretId='flask/app')
+        return config_from_aws_secret(json.loads(response['SecretString'])), response.get('VersionId')
+    
+    def _get_aws_secret_version(self):
+        """AWS 현재(AWSCURRENT) 시크릿 버전 ID만 조회"""
+        client = self._secret_client('AWS')
+        response = client.describe_secret(SecretId='flask/app')
+        for version_id, stages in response.get('VersionIdsToStages', {}).items():
+            if 'AWSCURRENT' in stages:
+                return version_id
+        return None
+    
     def get_gcp_config(self):
-        """GCP Secret Manager에서 설정 로드"""
-        try:
-            # import를 try 블록 안에서 수행하여 AWS 환경에서 오류 방지
-            from google.cloud import secretmanager
-            client = secretmanager.SecretManagerServiceClient()
-            name = client.secret_version_path("hifrodo-05", "project-secrets", "latest")
-            response = client.access_secret_version(request={"name": name})
-            config = json.loads(response.payload.data.decode("UTF-8"))
-            
-            return {
-                'flask_secret': config['flask_secret'],
-                'redis_host': config['redis_host'],
-                'mysql_host': config['mysql_host'],
-                'mysql_user': config['mysql_user'],
-                'mysql_password': config['mysql_password'],
-                'mysql_db': config['mysql_db'],
-                'provider': 'GCP'
-            }
-        except ImportError as ie:
-            logger.warning(f"GCP library not available (running on AWS?): {ie}")
-            self.gcp_available = False
-            return None
-        except Exception as e:
-            logger.error(f"GCP config load failed: {e}")
-            self.gcp_available = False
-            return None
+        """GCP Secret Manager에서 설정 로드 (캐시 사용)"""
+        return self._get_secret_config('GCP')
     
     def get_aws_config(self):
-        """AWS Secrets Manager에서 설정 로드"""
+        """AWS Secrets Manager에서 설정 로드 (캐시 사용)"""
+        return self._get_secret_config('AWS')
+    
+    def get_local_config(self):
+        """로컬 MySQL/Redis 설정 (LOCAL_CONFIG_FILE 또는 환경 변수)
+
+        redis_host를 'embedded'로 지정하면 fakeredis(설치된 경우)를 사용한다.
+        """
+        return load_local_config(LOCAL_CONFIG_FILE)
+    
+    def _get_secret_config(self, provider):
+        """캐시된 설정 반환, TTL의 SECRET_REFRESH_AHEAD 비율이 지나면 백그라운드 갱신"""
+        entry = self.secret_cache.get(provider)
+        if entry:
+            if time.time() < entry.get('retry_after', 0):
+                # 직전 갱신이 실패했으면 SECRET_RETRY_BACKOFF 동안 다시 호출하지 않는다
+                return entry['config']
+            age = time.time() - entry['fetched_at']
+            if age < SECRET_CACHE_TTL * SECRET_REFRESH_AHEAD:
+                return entry['config']
+            if age < SECRET_CACHE_TTL:
+                if self.refresh_ahead:
+                    self._refresh_secret_async(provider)
+                else:
+                    self.deferred_refresh.add(provider)
+                return entry['config']
+        return self._refresh_secret(provider)
+    
+    def start_secret_refresh(self):
+        """백그라운드 시크릿 갱신 시작 (부트스트랩 중 미룬 갱신, 예: 스냅샷에서 복원한 항목을 실행)"""
+        self.refresh_ahead = True
+        for provider in sorted(self.deferred_refresh):
+            self._refresh_secret_async(provider)
+        self.deferred_refresh.clear()
+    
+    def _refresh_secret_async(self, provider):
+        with self.secret_lock:
+            if provider in self.secret_refreshing:
+                return
+            self.secret_refreshing.add(provider)
+    
+        def refresh():
+            try:
+                self._refresh_secret(provider)
+            finally:
+                with self.secret_lock:
+                    self.secret_refreshing.discard(provider)
+    
+        threading.Thread(target=refresh, name=f'secret-refresh-{provider}', daemon=True).start()
+    
+    def _call_secret_api(self, provider, func):
+        """시크릿 API 호출을 서킷 브레이커로 보호 (열려 있으면 즉시 실패)"""
+        breaker = self.secret_breakers[provider]
+        breaker.before_call()
         try:
-            import boto3
-            session_aws = boto3.session.Session()
-            client = session_aws.client('secretsmanager', region_name="us-east-2")
-            response = client.get_secret_value(SecretId='flask/app')
-            config = json.loads(response['SecretString'])
-            
-            return {
-                'flask_secret': config['flask_secret'],
-                'redis_host': config['redis_host'],
-                'mysql_host': config['host'],
-                'mysql_user': config['username'],
-                'mysql_password': config['password'],
-                'mysql_db': config['dbname'],
-                'provider': 'AWS'
-            }
+            result = func()
+        except ImportError:
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            raise SecretFetchError(f"{provider} secret API call failed: {e}") from e
+        breaker.record_success()
+        return result
+    
+    def _refresh_secret(self, provider):
+        """시크릿 갱신: 버전이 같으면 payload를 다시 받지 않고 캐시 유효기간만 연장"""
+        entry = self.secret_cache.get(provider)
+        fetch = self._fetch_gcp_secret if provider == 'GCP' else self._fetch_aws_secret
+        get_version = self._get_gcp_secret_version if provider == 'GCP' else self._get_aws_secret_version
+        try:
+            if entry and entry['version']:
+                try:
+                    version = self._call_secret_api(provider, get_version)
+                except ImportError:
+                    raise
+                except Exception as e:
+                    # 버전 조회 권한이 없거나(versions.get/DescribeSecret) 실패해도 payload 조회로 갱신
+                    logger.warning(f"{provider} secret version check failed, fetching payload: {e}")
+                    version = None
+                if version == entry['version']:
+                    self.secret_cache[provider] = dict(entry, fetched_at=time.time())
+                    return entry['config']
+    
+            config, version = self._call_secret_api(provider, fetch)
+            self.secret_cache[provider] = {'config': config, 'version': version, 'fetched_at': time.time()}
+            if entry and entry['config'] != config:
+                logger.info(f"{provider} secret rotated to version {version}")
+                self._apply_rotation(provider, entry['config'], config)
+            self._save_secret_snapshot()
+            return config
         except ImportError as ie:
-            logger.warning(f"AWS library not available (running on GCP?): {ie}")
-            self.aws_available = False
+            logger.warning(f"{provider} library not available (running on another cloud?): {ie}")
+            self._mark_unavailable(provider)
             return None
         except Exception as e:
-            logger.error(f"AWS config load failed: {e}")
+            if entry:
+                # 시크릿 서비스 일시 장애 시 마지막으로 받은 설정을 계속 사용
+                logger.warning(f"{provider} secret refresh failed, using cached config: {e}")
+                self.secret_cache[provider] = dict(entry, retry_after=time.time() + SECRET_RETRY_BACKOFF)
+                return entry['config']
+            logger.error(f"{provider} config load failed: {e}")
+            self._mark_unavailable(provider)
+            return None
+    
+    def _mark_unavailable(self, provider):
+        if provider == 'GCP':
+            self.gcp_available = False
+        else:
             self.aws_available = False
+    
+    def _apply_rotation(self, provider, old_config, new_config):
+        """현재 프로바이더의 시크릿 교체를 반영 (바뀐 필드에 해당하는 연결만 테스트)"""
+        if provider != self.current_provider or self.current_config != old_config:
+            return
+        changed = {key for key in new_config if new_config.get(key) != old_config.get(key)}
+        if changed & set(MYSQL_CONFIG_FIELDS) and not self.test_database_connection(new_config):
+            logger.error(f"Rotated {provider} database credentials failed connection test, keeping current config")
+            return
+        if changed & set(REDIS_CONFIG_FIELDS) and not self.test_redis_connection(new_config):
+            logger.error(f"Rotated {provider} Redis settings failed connection test, keeping current config")
+            return
+        self.current_config = new_config
+        for listener in self.rotation_listeners:
+            try:
+                listener(new_config, changed)
+            except Exception as e:
+                logger.error(f"Secret rotation listener failed: {e}")
+    
+    def _secret_cipher(self):
+        if not (SECRET_CACHE_FILE and SECRET_CACHE_KEY):
             return None
+        try:
+            from cryptography.fernet import Fernet
+            return Fernet(SECRET_CACHE_KEY)
+        except ImportError:
+            logger.warning("cryptography not installed, secret snapshot disabled")
+        except Exception as e:
+            logger.warning(f"Invalid SECRET_CACHE_KEY, secret snapshot disabled: {e}")
+        return None
+    
+    def _load_secret_snapshot(self):
+        """디스크 스냅샷에서 캐시 복원 (복원된 항목은 워커 시작 시 백그라운드 갱신 대상)"""
+        cipher = self._secret_cipher()
+        if not cipher or not os.path.exists(SECRET_CACHE_FILE):
+            return
+        try:
+            with open(SECRET_CACHE_FILE, 'rb') as f:
+                entries = json.loads(cipher.decrypt(f.read()))
+            refresh_at = time.time() - SECRET_CACHE_TTL * SECRET_REFRESH_AHEAD
+            for provider, entry in entries.items():
+                self.secret_cache[provider] = dict(entry, fetched_at=min(entry['fetched_at'], refresh_at))
+            logger.info(f"Loaded secret snapshot for {', '.join(entries)}")
+        except Exception as e:
+            logger.warning(f"Secret snapshot load failed: {e}")
+    
+    def _save_secret_snapshot(self):
+        cipher = self._secret_cipher()
+        if not cipher:
+            return
+        try:
+            data = cipher.encrypt(json.dumps(self.secret_cache).encode('utf-8'))
+            tmp_path = f"{SECRET_CACHE_FILE}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, SECRET_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"Secret snapshot save failed: {e}")
     
     def test_database_connection(self, config):
         """데이터베이스 연결 테스트"""
@@ -96,6 +520,7 @@ class CloudProvider:
                 user=config['mysql_user'],
                 password=config['mysql_password'],
                 database=config['mysql_db'],
+                port=config.get('mysql_port', 3306),
                 connect_timeout=5
             )
             connection.close()
@@ -104,46 +529,137 @@ class CloudProvider:
             logger.error(f"Database connection test failed for {config['provider']}: {e}")
             return False
     
+    def create_redis_client(self, config, **options):
+        """프로바이더별 Redis 클라이언트 생성 (GCP/LOCAL은 SSL 없이, AWS는 SSL 사용)"""
+        if config['provider'] == 'LOCAL':
+            if config['redis_host'] == 'embedded':
+                # 외부 Redis 없이 실행 (벤치마크/오프라인 개발용)
+                import fakeredis
+                return fakeredis.FakeStrictRedis(server=self._embedded_redis_server())
+            return redis.StrictRedis(host=config['redis_host'], port=config.get('redis_port', 6379), **options)
+        if config['provider'] == 'GCP':
+            return redis.StrictRedis(host=config['redis_host'], port=6379, **options)
+        return redis.StrictRedis(
+            host=config['redis_host'], 
+            port=6379,
+            ssl=True,
+            ssl_cert_reqs=None,
+            **options
+        )
+    
+    def _embedded_redis_server(self):
+        """embedded Redis 클라이언트들이 같은 데이터를 보도록 서버 하나를 공유"""
+        if getattr(self, 'embedded_redis_server', None) is None:
+            import fakeredis
+            self.embedded_redis_server = fakeredis.FakeServer()
+        return self.embedded_redis_server
+    
     def test_redis_connection(self, config):
         """Redis 연결 테스트"""
         if not config:
             return False
         try:
-            # GCP는 SSL 없이, AWS는 SSL 사용
-            if config['provider'] == 'GCP':
-                r = redis.StrictRedis(
-                    host=config['redis_host'], 
-                    port=6379,
-                    socket_connect_timeout=5
-                )
-            else:  # AWS
-                r = redis.StrictRedis(
-                    host=config['redis_host'], 
-                    port=6379,
-                    ssl=True,
-                    ssl_cert_reqs=None,
-                    socket_connect_timeout=5
-                )
+            r = self.create_redis_client(config, socket_connect_timeout=5)
             r.ping()
             return True
         except Exception as e:
             logger.error(f"Redis connection test failed for {config['provider']}: {e}")
             return False
     
+    def _timed(self, timings, name, func, *args):
+        """func 실행 시간을 timings[name]에 ms 단위로 기록"""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = (time.perf_counter() - started) * 1000
+    
+    def _check_provider(self, provider, executor, timings):
+        """설정 로드 후 DB/Redis 연결을 동시에 테스트, 모두 성공하면 설정 반환"""
+        loader = self.config_loaders[provider]
+        key = provider.lower()
+        config = self._timed(timings, f'{key}_secret', loader)
+        if not config:
+            return None
+        db_future = executor.submit(self._timed, timings, f'{key}_mysql', self.test_database_connection, config)
+        redis_future = executor.submit(self._timed, timings, f'{key}_redis', self.test_redis_connection, config)
+        if db_future.result() and redis_future.result():
+            return config
+        return None
+    
     def get_active_config(self):
-        """활성 설정 반환 (AWS 환경에서는 AWS 우선)"""
+        """활성 설정 반환 (AWS 환경에서는 AWS 우선)
+        
+        환경 감지와 프로바이더별 점검을 병렬로 수행하며 BOOTSTRAP_TIMEOUT 안에 끝낸다.
+        current_provider/current_config는 바꾸지 않는다 (부트스트랩 제외, 전환은 activate가 반영).
+        """
+        started = time.perf_counter()
+        timings = {}
+        deadline = time.monotonic() + BOOTSTRAP_TIMEOUT
+        executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='provider-check')
+        try:
+            config = self._select_active_config(executor, timings, deadline)
+            if self.active is None:
+                # 부트스트랩에서 고른 설정은 바로 사용한다 (이후에는 activate로 전환에 성공했을 때만 반영)
+                self._use(config)
+            return config
+        finally:
+            # 제한 시간을 넘긴 점검은 기다리지 않는다 (각 점검은 자체 타임아웃으로 종료).
+            # 단 pre-fork master의 부트스트랩에서는 점검 스레드가 fork 시점에 살아 있으면
+            # 잡고 있던 락/소켓 상태가 워커로 복제되므로 모두 끝날 때까지 기다린다
+            executor.shutdown(wait=DEFER_STARTUP and self.active is None, cancel_futures=True)
+            if self.active is None:
+                # 기다리지 않은 부트스트랩 점검은 start_worker()가 해시 풀을 fork하기 전에 join_bootstrap_checks()로 기다린다
+                self.bootstrap_checks = executor
+            # 끝나지 않은 점검은 원래 dict에 계속 기록하므로 복사본을 기록/저장한다
+            timings = dict(timings)
+            timings['total'] = (time.perf_counter() - started) * 1000
+            self.last_check_timings = timings
+            logger.info("Provider check timings: " + ", ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items()))
+    
+    def join_bootstrap_checks(self):
+        """부트스트랩에서 제한 시간을 넘겨 남겨 둔 점검 스레드가 끝날 때까지 대기 (각 점검은 자체 타임아웃으로 종료)"""
+        if self.bootstrap_checks is not None:
+            self.bootstrap_checks.shutdown(wait=True)
+            self.bootstrap_checks = None
+    
+    def _select_active_config(self, executor, timings, deadline):
+        def wait_for(future, provider):
+            try:
+                return future.result(timeout=max(0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                logger.error(f"{provider} check timed out (BOOTSTRAP_TIMEOUT={BOOTSTRAP_TIMEOUT}s)")
+                return None
+        
+        def start_check(provider):
+            return executor.submit(self._check_provider, provider, executor, timings)
+        
+        if PREFERRED_CLOUD == 'LOCAL':
+            # 로컬 모드: 메타데이터 감지와 클라우드 폴백 없이 로컬 설정만 점검
+            local_config = wait_for(start_check('LOCAL'), 'LOCAL')
+            if not local_config:
+                raise Exception("LOCAL configuration unavailable (check MYSQL_*/REDIS_* or LOCAL_CONFIG_FILE)")
+            logger.info("Using LOCAL configuration")
+            return local_config
+        
+        # 콜드 스타트에서는 환경 감지와 동시에 두 프로바이더 점검을 시작해
+        # 전체 시간이 가장 느린 점검 하나의 시간에 가깝도록 한다
+        started_checks = {}
+        if self.current_config is None:
+            if PREFERRED_CLOUD == 'GCP' and self.gcp_available:
+                started_checks['GCP'] = start_check('GCP')
+            if self.aws_available:
+                started_checks['AWS'] = start_check('AWS')
         
         # AWS 환경에서 실행 중인지 감지 (환경 변수 또는 메타데이터로 확인)
-        running_on_aws = self._detect_aws_environment()
+        running_on_aws = self._timed(timings, 'detect', self._detect_aws_environment, executor)
         
         if running_on_aws:
             logger.info("Detected AWS environment, prioritizing AWS configuration")
             # AWS 환경에서는 AWS만 시도 (GCP는 standby로 표시)
             if self.aws_available:
-                aws_config = self.get_aws_config()
-                if aws_config and self.test_database_connection(aws_config) and self.test_redis_connection(aws_config):
-                    self.current_provider = 'AWS'
-                    self.current_config = aws_config
+                aws_config = wait_for(started_checks.get('AWS') or start_check('AWS'), 'AWS')
+                if aws_config:
                     self.gcp_available = False  # GCP를 standby 상태로 설정
                     logger.info("Using AWS configuration")
                     return aws_config
@@ -156,13 +672,16 @@ class CloudProvider:
         
         else:
             logger.info("Detected GCP environment, prioritizing GCP configuration")
+            gcp_future = started_checks.get('GCP')
+            aws_future = started_checks.get('AWS')
+            if gcp_future is None and PREFERRED_CLOUD == 'GCP' and self.gcp_available:
+                gcp_future = start_check('GCP')
+            
             # GCP 환경에서는 GCP 우선, AWS는 standby
-            if PREFERRED_CLOUD == 'GCP' and self.gcp_available:
-                gcp_config = self.get_gcp_config()
-                if gcp_config and self.test_database_connection(gcp_config) and self.test_redis_connection(gcp_config):
-                    self.current_provider = 'GCP'
-                    self.current_config = gcp_config
-                    # AWS를 standby 상태로 설정 (연결 테스트하지 않음)
+            if gcp_future:
+                gcp_config = wait_for(gcp_future, 'GCP')
+                if gcp_config:
+                    # AWS를 standby 상태로 설정 (연결 테스트 결과와 무관)
                     self.aws_available = True  # 대기 상태로 표시
                     logger.info("Using GCP configuration")
                     return gcp_config
@@ -171,11 +690,11 @@ class CloudProvider:
                     self.gcp_available = False
             
             # GCP 실패 시에만 AWS 대체 시도
-            if self.aws_available:
-                aws_config = self.get_aws_config()
-                if aws_config and self.test_database_connection(aws_config) and self.test_redis_connection(aws_config):
-                    self.current_provider = 'AWS'
-                    self.current_config = aws_config
+            if aws_future is None and self.aws_available:
+                aws_future = start_check('AWS')
+            if aws_future:
+                aws_config = wait_for(aws_future, 'AWS')
+                if aws_config:
                     logger.info("Using AWS configuration (FAILOVER)")
                     return aws_config
                 else:
@@ -185,83 +704,212 @@ class CloudProvider:
             # 모든 클라우드 실패
             raise Exception("Both GCP and AWS are unavailable")
     
-    def _detect_aws_environment(self):
+    def _detect_aws_environment(self, executor):
         """AWS 환경에서 실행 중인지 감지"""
         # 방법 1: 명확한 AWS 환경 변수 확인
         if os.getenv('AWS_EXECUTION_ENV') or os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
             return True
         
-        # 방법 2: EC2 메타데이터 확인 (더 정확한 방법)
-        try:
-            import urllib.request
-            response = urllib.request.urlopen('http://169.254.169.254/latest/meta-data/instance-id', timeout=2)
-            instance_id = response.read().decode('utf-8')
-            # AWS EC2 인스턴스 ID는 i-로 시작
-            if instance_id.startswith('i-'):
+        # 방법 2, 3: EC2 / GCP 메타데이터를 동시에 확인하고 먼저 확인된 쪽을 사용
+        ec2_future = executor.submit(probe_ec2_metadata, METADATA_PROBE_TIMEOUT)
+        gcp_future = executor.submit(probe_gcp_metadata, METADATA_PROBE_TIMEOUT)
+        pending = {ec2_future, gcp_future}
+        deadline = time.monotonic() + METADATA_PROBE_TIMEOUT + 0.5
+        while pending:
+            done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            if ec2_future in done and ec2_future.result():
                 return True
-        except:
-            pass
+            if gcp_future in done and gcp_future.result():
+                # GCP 메타데이터에 접근 가능하면 GCP 환경
+                return False
         
-        # 방법 3: GCP 메타데이터 확인으로 GCP 환경 감지
-        try:
-            import urllib.request
-            req = urllib.request.Request('http://metadata.google.internal/computeMetadata/v1/instance/id')
-            req.add_header('Metadata-Flavor', 'Google')
-            urllib.request.urlopen(req, timeout=2)
-            # GCP 메타데이터에 접근 가능하면 GCP 환경
+        # 방법 4: 호스트명으로 판단 (최후 수단), 기본값은 GCP (기존 동작 유지)
+        return hostname_suggests_aws()
+    
+    def build_backends(self, config, standby=False):
+        """설정으로 MySQL 풀(워밍업 포함)과 Redis 클라이언트를 만든다"""
+        if standby:
+            # 대기 연결은 최소로 유지 (failover 후에는 레플리카 없이 primary만 사용)
+            pool = create_mysql_pool(config, min_size=1, max_size=2)
+            replicas = None
+        else:
+            pool = create_mysql_pool(config)
+            replicas = create_replica_set(config)
+        return Backends(config, pool, self.create_redis_client(config, socket_connect_timeout=5), replicas)
+    
+    def _use(self, config):
+        self.current_config = config
+        self.current_provider = config['provider']
+    
+    def activate(self, backends, app_instance, mysql_instance):
+        """연결 묶음 교체 (포인터 교체만 수행, 새 연결은 미리 준비된 상태)"""
+        started = time.perf_counter()
+        previous = self.active
+        if previous is None or previous.pool is not backends.pool:
+            mysql_instance.swap_pool(backends.pool)
+        if previous is None or previous.replicas is not backends.replicas:
+            mysql_instance.swap_replicas(backends.replicas)
+        app_instance.config['SESSION_REDIS'].swap(backends.redis)
+        self.active = backends
+        self._use(backends.config)
+        if previous is not None and previous.redis is not backends.redis:
+            previous.redis.connection_pool.disconnect()
+        return (time.perf_counter() - started) * 1000
+    
+    def standby_ready(self):
+        standby = self.standby
+        return standby is not None and standby.healthy
+    
+    def refresh_standby(self):
+        """대기 프로바이더 연결을 준비하고 상태를 점검 (헬스 모니터 주기마다 호출)"""
+        if not WARM_STANDBY or self.active is None or self.active.config['provider'] == 'LOCAL':
+            return
+        standby_provider = 'AWS' if self.active.config['provider'] == 'GCP' else 'GCP'
+        config = self.config_loaders[standby_provider]()
+        current = self.standby
+        if not config:
+            if current is not None:
+                self.standby = None
+                current.close()
+            return
+        if current is None or current.config != config:
+            self.standby = self.build_backends(config, standby=True)
+            if current is not None:
+                current.close()
+        self.standby.check()
+    
+    def _record_switch(self, previous, backends, elapsed_ms, warm_standby, followed=False):
+        # followed: 다른 워커가 결정한 전환을 따라간 경우 (알림은 결정한 프로세스만 보냄)
+        self.last_switch = {
+            'from': previous,
+            'to': backends.config['provider'],
+            'warm_standby': warm_standby,
+            'followed': followed,
+            'duration_ms': round(elapsed_ms, 3),
+            'timestamp': time.time()
+        }
+        PROVIDER_SWITCHES.labels(previous, backends.config['provider'], str(warm_standby).lower()).inc()
+        logger.info(f"Switched from {previous} to {backends.config['provider']} in {elapsed_ms:.2f}ms"
+                    f"{' (warm standby)' if warm_standby else ''}")
+        for listener in self.switch_listeners:
+            try:
+                listener(self.last_switch)
+            except Exception as e:
+                logger.error(f"Provider switch listener failed: {e}")
+    
+    def failover_to_standby(self, app_instance, mysql_instance, failed_backends):
+        """요청 경로용 전환: 정상 대기 연결이 있고, 장애 난 연결이 아직 활성일 때만 한 번 수행"""
+        if not self.switch_lock.acquire(blocking=False):
             return False
-        except:
-            pass
-        
-        # 방법 4: 호스트명으로 판단 (최후 수단)
-        hostname = socket.gethostname()
-        if 'amazonaws' in hostname or hostname.startswith('ip-'):
+        try:
+            standby = self.standby
+            if self.active is not failed_backends or standby is None or not standby.healthy:
+                return False
+            self.standby = None
+            previous = self.active.config['provider']
+            self._record_switch(previous, standby, self.activate(standby, app_instance, mysql_instance), True)
             return True
-        if 'gcp' in hostname or 'google' in hostname or hostname.endswith('.internal'):
+        except Exception as e:
+            logger.error(f"Standby failover failed: {e}")
             return False
+        finally:
+            self.switch_lock.release()
+    
+    def switch_provider(self, app_instance, mysql_instance, new_config=None, followed=False):
+        """프로바이더 전환 로직
         
-        # 기본값: GCP로 가정 (기존 동작 유지)
-        return False
-    
-    def switch_provider(self, app_instance, mysql_instance):
-        """프로바이더 전환 로직"""
-        try:
-            new_config = self.get_active_config()
-            if new_config and new_config['provider'] != self.current_config['provider']:
-                logger.info(f"Switching from {self.current_config['provider']} to {new_config['provider']}")
-                
-                # Flask 앱 재설정
-                self.current_config = new_config
-                app_instance.config['MYSQL_HOST'] = new_config['mysql_host']
-                app_instance.config['MYSQL_USER'] = new_config['mysql_user']
-                app_instance.config['MYSQL_PASSWORD'] = new_config['mysql_password']
-                app_instance.config['MYSQL_DB'] = new_config['mysql_db']
-                
-                # Redis 연결 재설정 (클라우드별 SSL 설정)
-                if new_config['provider'] == 'GCP':
-                    app_instance.config['SESSION_REDIS'] = redis.StrictRedis(
-                        host=new_config['redis_host'], 
-                        port=6379
-                    )
-                else:  # AWS
-                    app_instance.config['SESSION_REDIS'] = redis.StrictRedis(
-                        host=new_config['redis_host'], 
-                        port=6379,
-                        ssl=True,
-                        ssl_cert_reqs=None
-                    )
-                
-                # MySQL 연결 재초기화
-                mysql_instance.__init__(app_instance)
-                
-                # 세션 재초기화
-                Session(app_instance)
-                
-                return True
+        new_config가 없으면 현재 프로바이더 장애로 보고, 정상 상태의 대기 연결이 있으면
+        그것으로 즉시 전환한다. 동시에 한 스레드만 전환을 수행한다.
+        """
+        if not self.switch_lock.acquire(blocking=False):
+            logger.info("Provider switch already in progress")
             return False
+        try:
+            previous = self.active.config['provider']
+            standby = self.standby
+            if new_config is None and standby is not None and standby.healthy:
+                self.standby = None
+                backends = standby
+            else:
+                if new_config is None:
+                    new_config = self.get_active_config()
+                if not new_config or new_config['provider'] == previous:
+                    return False
+                backends = self.build_backends(new_config)
+            
+            elapsed_ms = self.activate(backends, app_instance, mysql_instance)
+            self._record_switch(previous, backends, elapsed_ms, backends is standby, followed)
+            return True
         except Exception as e:
             logger.error(f"Provider switch failed: {e}")
             return False
+        finally:
+            self.switch_lock.release()
+    
+    def follow_provider(self, app_instance, mysql_instance, provider):
+        """다른 워커(헬스 리더)가 전환한 프로바이더로 따라 전환 (정상 대기 연결이 있으면 그것 사용)"""
+        if provider == self.active.config['provider']:
+            return False
+        standby = self.standby
+        if standby is not None and standby.config['provider'] == provider and standby.healthy:
+            return self.switch_provider(app_instance, mysql_instance, followed=True)
+        config = self.config_loaders[provider]()
+        return bool(config) and self.switch_provider(app_instance, mysql_instance, config, followed=True)
+
+class Backends:
+    """프로바이더 하나의 연결 묶음 (설정, MySQL 풀, 읽기 레플리카, Redis 클라이언트)"""
+    
+    def __init__(self, config, pool, redis_client, replicas=None):
+        self.config = config
+        self.pool = pool
+        self.redis = redis_client
+        self.replicas = replicas
+        self.healthy = False
+    
+    def check(self):
+        try:
+            self.healthy = self.pool.check() and self.redis.ping()
+        except Exception as e:
+            logger.warning(f"Standby {self.config['provider']} check failed: {e}")
+            self.healthy = False
+        return self.healthy
+    
+    def close(self):
+        self.pool.close()
+        if self.replicas is not None:
+            self.replicas.close()
+        self.redis.connection_pool.disconnect()
+
+class RedisProxy:
+    """현재 활성 Redis 클라이언트로 호출을 위임 (서킷 브레이커 적용)
+
+    SESSION_REDIS에 한 번만 등록하고 전환 시 client만 교체하므로 Session 재초기화가 필요 없다.
+    """
+    
+    def __init__(self, client):
+        self.client = client
+        self.breaker = CircuitBreaker('redis', 'redis')
+    
+    def swap(self, client):
+        self.client = client
+        self.breaker.reset()
+    
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+        breaker = self.breaker
+        
+        def guarded(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return breaker.call(attr, *args, **kwargs)
+            finally:
+                REDIS_CALL_LATENCY.labels(name).observe(time.perf_counter() - started)
+        
+        return guarded
 
 # 전역 클라우드 프로바이더 인스턴스
 cloud_provider = CloudProvider()
@@ -279,76 +927,1040 @@ app.secret_key = active_config['flask_secret']
 
 # Redis 세션 설정 (클라우드별 SSL 설정)
 app.config['SESSION_TYPE'] = 'redis'
-if active_config['provider'] == 'GCP':
-    app.config['SESSION_REDIS'] = redis.StrictRedis(
-        host=active_config['redis_host'], 
-        port=6379
-    )
-else:  # AWS
-    app.config['SESSION_REDIS'] = redis.StrictRedis(
-        host=active_config['redis_host'], 
-        port=6379,
-        ssl=True,
-        ssl_cert_reqs=None
-    )
+app.config['SESSION_REDIS'] = RedisProxy(cloud_provider.create_redis_client(active_config))
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_USE_SIGNER'] = True
 app.config['SESSION_KEY_PREFIX'] = 'session:'
+# 압축 직렬화 + 변경 없는 세션은 Redis에 쓰지 않음 (false면 Flask-Session 기본 동작)
+app.config['SESSION_COMPACT'] = os.getenv('SESSION_COMPACT', 'true').lower() == 'true'
+# 변경이 없어도 이 시간(초)이 지나면 다시 저장해 Redis TTL을 연장
+app.config['SESSION_REFRESH_INTERVAL'] = int(os.getenv('SESSION_REFRESH_INTERVAL', '3600'))
 Session(app)
 
-# MySQL 설정
-app.config['MYSQL_HOST'] = active_config['mysql_host']
-app.config['MYSQL_USER'] = active_config['mysql_user']
-app.config['MYSQL_PASSWORD'] = active_config['mysql_password']
-app.config['MYSQL_DB'] = active_config['mysql_db']
+class CompactRedisSessionInterface(RedisSessionInterface):
+    """Redis 세션 왕복 최소화
+
+    - 세션 쿠키가 없으면 Redis를 읽지 않는다 (Flask-Session 기본 동작과 같음)
+    - 직렬화 결과가 읽은 값과 같고 refresh_interval이 지나지 않았으면 쓰지 않는다
+    - 비어 있는 새 세션은 쓰지도 쿠키를 내리지도 않는다 -> 비로그인 요청은 Redis 호출 0회
+    """
 
-mysql = MySQL(app)
+    def __init__(self, redis, key_prefix, use_signer, permanent, refresh_interval):
+        super().__init__(redis, key_prefix, use_signer, permanent)
+        self.serializer = CompactSessionSerializer()
+        self.refresh_interval = refresh_interval
+        self.stats = {'reads': 0, 'misses': 0, 'writes': 0, 'skipped_writes': 0, 'deletes': 0,
+                      'bytes_written': 0, 'max_bytes': 0}
+
+    def open_session(self, app_instance, request_obj):
+        sid = request_obj.cookies.get(app_instance.config['SESSION_COOKIE_NAME'])
+        if not sid:
+            return self.session_class(sid=self._generate_sid(), permanent=self.permanent)
+        if self.use_signer:
+            try:
+                sid = self._get_signer(app_instance).unsign(sid).decode()
+            except Exception:
+                return self.session_class(sid=self._generate_sid(), permanent=self.permanent)
+
+        self.stats['reads'] += 1
+        SESSION_OPS.labels('read').inc()
+        value = self.redis.get(self.key_prefix + sid)
+        if value is not None:
+            try:
+                data, written_at = self.serializer.loads(value)
+                session_obj = self.session_class(data, sid=sid)
+                session_obj.stored_value = value
+                session_obj.written_at = written_at
+                return session_obj
+            except Exception as e:
+                logger.warning(f"Session decode failed, starting new session: {e}")
+        self.stats['misses'] += 1
+        return self.session_class(sid=sid, permanent=self.permanent)
+
+    def save_session(self, app_instance, session_obj, response):
+        domain = self.get_cookie_domain(app_instance)
+        path = self.get_cookie_path(app_instance)
+        stored_value = getattr(session_obj, 'stored_value', None)
+        if not session_obj:
+            # 저장된 적 있는 세션이 비워진 경우에만 삭제 (새 빈 세션은 아무것도 하지 않음)
+            if stored_value is not None or session_obj.modified:
+                self.redis.delete(self.key_prefix + session_obj.sid)
+                self.stats['deletes'] += 1
+                SESSION_OPS.labels('delete').inc()
+                response.delete_cookie(app_instance.config['SESSION_COOKIE_NAME'], domain=domain, path=path)
+            return
+
+        now = int(time.time())
+        written_at = getattr(session_obj, 'written_at', 0)
+        if stored_value is not None and now - written_at < self.refresh_interval:
+            # 중첩 값 변경도 잡도록 modified 플래그 대신 직렬화 결과를 비교
+            if self.serializer.dumps(dict(session_obj), written_at) == stored_value:
+                self.stats['skipped_writes'] += 1
+                SESSION_OPS.labels('skip').inc()
+                return
+
+        value = self.serializer.dumps(dict(session_obj), now)
+        self.redis.setex(name=self.key_prefix + session_obj.sid, value=value,
+                         time=int(app_instance.permanent_session_lifetime.total_seconds()))
+        self.stats['writes'] += 1
+        self.stats['bytes_written'] += len(value)
+        self.stats['max_bytes'] = max(self.stats['max_bytes'], len(value))
+        SESSION_OPS.labels('write').inc()
+        SESSION_BYTES.observe(len(value))
+        if stored_value is not None and not self.should_set_cookie(app_instance, session_obj):
+            return
+
+        session_id = session_obj.sid
+        if self.use_signer:
+            session_id = self._get_signer(app_instance).sign(session_id.encode()).decode()
+        response.set_cookie(
+            app_instance.config['SESSION_COOKIE_NAME'], session_id,
+            expires=self.get_expiration_time(app_instance, session_obj),
+            httponly=self.get_cookie_httponly(app_instance),
+            domain=domain, path=path,
+            secure=self.get_cookie_secure(app_instance),
+            samesite=self.get_cookie_samesite(app_instance)
+        )
+
+    def get_stats(self):
+        stats = dict(self.stats, serializer=self.serializer.name,
+                     refresh_interval=self.refresh_interval)
+        stats['avg_bytes'] = round(stats['bytes_written'] / stats['writes'], 1) if stats['writes'] else 0.0
+        return stats
+
+if app.config['SESSION_COMPACT']:
+    app.session_interface = CompactRedisSessionInterface(
+        app.config['SESSION_REDIS'],
+        app.config['SESSION_KEY_PREFIX'],
+        app.config['SESSION_USE_SIGNER'],
+        app.config['SESSION_PERMANENT'],
+        app.config['SESSION_REFRESH_INTERVAL']
+    )
+
+# MySQL 커넥션 풀 설정
+app.config['MYSQL_POOL_MIN'] = int(os.getenv('MYSQL_POOL_MIN', '2'))
+app.config['MYSQL_POOL_MAX'] = int(os.getenv('MYSQL_POOL_MAX', '10'))
+app.config['MYSQL_POOL_TIMEOUT'] = float(os.getenv('MYSQL_POOL_TIMEOUT', '5'))  # 체크아웃 최대 대기 (초)
+app.config['MYSQL_POOL_RECYCLE'] = int(os.getenv('MYSQL_POOL_RECYCLE', '1800'))  # 연결 최대 수명 (초)
+app.config['MYSQL_POOL_PING_IDLE'] = int(os.getenv('MYSQL_POOL_PING_IDLE', '30'))  # 이 시간 이상 쉰 연결은 ping 후 사용
+
+# 읽기 레플리카 설정 (프로바이더 설정의 mysql_replicas가 있을 때만 사용)
+app.config['REPLICA_MAX_LAG'] = float(os.getenv('REPLICA_MAX_LAG', '5'))  # 이보다 뒤처진 레플리카는 읽기에서 제외 (초)
+app.config['REPLICA_CHECK_INTERVAL'] = float(os.getenv('REPLICA_CHECK_INTERVAL', '5'))  # 복제 지연 측정 주기 (초)
+app.config['REPLICA_POOL_MAX'] = int(os.getenv('REPLICA_POOL_MAX', str(app.config['MYSQL_POOL_MAX'])))
+# 글을 쓴 세션은 이 시간 동안 primary에서 읽음 (허용 지연 + 측정 주기 사이에 지연이 늘 수 있음)
+app.config['READ_YOUR_WRITES_WINDOW'] = float(os.getenv(
+    'READ_YOUR_WRITES_WINDOW', str(app.config['REPLICA_MAX_LAG'] + app.config['REPLICA_CHECK_INTERVAL'])))
+
+# primary에 쓰기로 기록하지 않는 쿼리 (read-your-writes 판단용)
+READ_QUERY_PREFIXES = ('SELECT', 'SHOW')
+
+class BreakerCursorMixin:
+    """쿼리 결과를 풀의 서킷 브레이커에 기록"""
+    breaker = None
+
+    def execute(self, query, args=None):
+        started = time.perf_counter()
+        try:
+            result = super().execute(query, args)
+        except Exception as e:
+            if classify_dependency_error(e) == 'mysql':
+                e.dependency = self.breaker.dependency
+                self.breaker.record_failure()
+            raise
+        finally:
+            DB_QUERY_LATENCY.labels(metrics_endpoint_label()).observe(time.perf_counter() - started)
+            if has_request_context():
+                g._metrics_db_queries = g.get('_metrics_db_queries', 0) + 1
+                if self.breaker.dependency == 'mysql' and not query.lstrip()[:6].upper().startswith(READ_QUERY_PREFIXES):
+                    g._mysql_wrote = True
+        self.breaker.record_success()
+        return result
+
+class BreakerCursor(BreakerCursorMixin, MySQLdb.cursors.Cursor):
+    """기본 커서 (결과 전체를 클라이언트로 받아 둠)"""
+
+class BreakerSSCursor(BreakerCursorMixin, MySQLdb.cursors.SSCursor):
+    """서버 측 커서 (fetch 시 행 단위로 읽어 결과 크기와 무관하게 메모리 일정)"""
+
+class PooledConnection:
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = self.last_used = time.monotonic()
+
+class MySQLPool:
+    """MySQLdb 커넥션 풀 (min/max 크기, 워밍업, 체크아웃 시 검증, 최대 수명 재활용)"""
+
+    def __init__(self, config, min_size, max_size, timeout, recycle, ping_idle, breaker_name=None, dependency='mysql'):
+        self.provider = config['provider']
+        self.breaker = CircuitBreaker(breaker_name or f'mysql:{self.provider}', dependency)
+        self.params = {
+            'host': config['mysql_host'],
+            'user': config['mysql_user'],
+            'passwd': config['mysql_password'],
+            'db': config['mysql_db'],
+            'port': config.get('mysql_port', 3306),
+            'charset': 'utf8mb4',
+            'connect_timeout': 5,
+            # 트랜잭션 스냅샷이 풀에 남아 오래된 데이터를 읽지 않도록 autocommit 사용
+            'autocommit': True,
+            'cursorclass': type('PooledCursor', (BreakerCursor,), {'breaker': self.breaker})
+        }
+        self.stream_cursorclass = type('PooledSSCursor', (BreakerSSCursor,), {'breaker': self.breaker})
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_idle = ping_idle
+        self.idle = deque()
+        self.size = 0  # 열려 있는 연결 수 (사용 중 + 대기)
+        self.in_use = 0
+        self.closed = False
+        self.cond = threading.Condition()
+        self.stats = {
+            'checkouts': 0, 'waits': 0, 'wait_time_total_ms': 0.0, 'wait_time_max_ms': 0.0,
+            'timeouts': 0, 'connects': 0, 'connect_errors': 0, 'recycled': 0, 'validation_failures': 0
+        }
+
+    def _connect(self):
+        try:
+            conn = MySQLdb.connect(**self.params)
+        except Exception as e:
+            self.stats['connect_errors'] += 1
+            if classify_dependency_error(e) == 'mysql':
+                e.dependency = self.breaker.dependency
+                self.breaker.record_failure()
+            raise
+        self.stats['connects'] += 1
+        self.breaker.record_success()
+        return PooledConnection(conn)
+
+    def _close(self, entry):
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    def warmup(self):
+        """min_size 만큼 연결을 미리 생성"""
+        created = []
+        for _ in range(self.min_size):
+            with self.cond:
+                if self.size >= self.min_size:
+                    break
+                self.size += 1
+            try:
+                created.append(self._connect())
+            except Exception as e:
+                with self.cond:
+                    self.size -= 1
+                logger.error(f"MySQL pool warmup failed for {self.provider}: {e}")
+                break
+        with self.cond:
+            self.idle.extend(created)
+            self.cond.notify_all()
+        logger.info(f"MySQL pool warmed up for {self.provider}: {len(created)} connections")
+
+    def acquire(self):
+        # DB 장애로 서킷이 열려 있으면 연결/대기 없이 즉시 실패
+        self.breaker.before_call()
+        started = time.monotonic()
+        deadline = started + self.timeout
+        entry = None
+        waited = False
+        with self.cond:
+            while True:
+                if self.closed:
+                    raise PoolTimeoutError(f"MySQL pool for {self.provider} is closed")
+                if self.idle:
+                    entry = self.idle.pop()  # LIFO: 최근 사용한 연결을 재사용
+                    break
+                if self.size < self.max_size:
+                    self.size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats['timeouts'] += 1
+                    raise PoolTimeoutError(f"Timed out waiting for MySQL connection ({self.provider})")
+                waited = True
+                self.cond.wait(remaining)
+            self.in_use += 1
+            self.stats['checkouts'] += 1
+            if waited:
+                wait_ms = (time.monotonic() - started) * 1000
+                self.stats['waits'] += 1
+                self.stats['wait_time_total_ms'] += wait_ms
+                self.stats['wait_time_max_ms'] = max(self.stats['wait_time_max_ms'], wait_ms)
+
+        try:
+            if entry is not None:
+                entry = self._validate(entry)
+            if entry is None:
+                entry = self._connect()
+        except Exception:
+            with self.cond:
+                self.size -= 1
+                self.in_use -= 1
+                self.cond.notify()
+            raise
+        return entry
+
+    def _validate(self, entry):
+        """수명이 지난 연결은 버리고, 오래 쉰 연결은 ping으로 확인 (실패 시 None)"""
+        now = time.monotonic()
+        if now - entry.created_at > self.recycle:
+            self.stats['recycled'] += 1
+            self._close(entry)
+            return None
+        if now - entry.last_used > self.ping_idle:
+            try:
+                entry.conn.ping()
+            except Exception:
+                self.stats['validation_failures'] += 1
+                self._close(entry)
+                return None
+        return entry
+
+    def release(self, entry, discard=False):
+        broken = discard or not getattr(entry.conn, 'open', True)
+        with self.cond:
+            self.in_use -= 1
+            if self.closed or broken:
+                self.size -= 1
+            else:
+                entry.last_used = time.monotonic()
+                self.idle.append(entry)
+                entry = None
+            self.cond.notify()
+        if entry is not None:
+            self._close(entry)
+
+    def check(self):
+        """헬스체크: 풀 연결로 ping (새 연결을 만들지 않음)"""
+        entry = self.acquire()
+        try:
+            entry.conn.ping()
+            entry.last_used = time.monotonic()
+        except Exception:
+            self.breaker.record_failure()
+            self.release(entry, discard=True)
+            return False
+        self.breaker.record_success()
+        self.release(entry)
+        return True
+
+    def close(self):
+        """대기 연결을 닫고, 사용 중인 연결은 반환 시 닫는다"""
+        with self.cond:
+            self.closed = True
+            idle, self.idle = list(self.idle), deque()
+            self.size -= len(idle)
+            self.cond.notify_all()
+        for entry in idle:
+            self._close(entry)
+
+    def get_stats(self):
+        with self.cond:
+            stats = dict(self.stats, size=self.size, in_use=self.in_use, idle=len(self.idle),
+                         min_size=self.min_size, max_size=self.max_size, provider=self.provider)
+        stats['utilization'] = round(stats['in_use'] / self.max_size, 4) if self.max_size else 0.0
+        stats['wait_time_avg_ms'] = round(stats['wait_time_total_ms'] / stats['waits'], 2) if stats['waits'] else 0.0
+        return stats
+
+def create_mysql_pool(config, warmup=True, min_size=None, max_size=None, **kwargs):
+    pool = MySQLPool(
+        config,
+        min_size=app.config['MYSQL_POOL_MIN'] if min_size is None else min_size,
+        max_size=app.config['MYSQL_POOL_MAX'] if max_size is None else max_size,
+        timeout=app.config['MYSQL_POOL_TIMEOUT'],
+        recycle=app.config['MYSQL_POOL_RECYCLE'],
+        ping_idle=app.config['MYSQL_POOL_PING_IDLE'],
+        **kwargs
+    )
+    if warmup:
+        pool.warmup()
+    return pool
+
+class Replica:
+    __slots__ = ('host', 'pool', 'healthy', 'lag', 'checked_at', 'error')
+
+    def __init__(self, host, pool):
+        self.host = host
+        self.pool = pool
+        self.healthy = False
+        self.lag = None
+        self.checked_at = None
+        self.error = None
+
+class ReplicaSet:
+    """읽기 전용 레플리카 풀 묶음 (복제 지연 측정 + 라운드 로빈 선택)
+
+    지연이 max_lag 이하인 레플리카만 읽기에 쓰고, 없으면 호출 측이 primary를 사용한다.
+    지연 측정(SHOW REPLICA STATUS)에는 REPLICATION CLIENT 권한이 필요하다.
+    """
+
+    def __init__(self, config, hosts, max_lag):
+        self.provider = config['provider']
+        self.max_lag = max_lag
+        self.replicas = []
+        for host in hosts:
+            name, _, port = host.partition(':')
+            replica_config = dict(config, mysql_host=name, mysql_port=int(port) if port else config.get('mysql_port', 3306))
+            pool = create_mysql_pool(
+                replica_config, warmup=False, min_size=0, max_size=app.config['REPLICA_POOL_MAX'],
+                breaker_name=f'mysql-replica:{host}', dependency='mysql_replica'
+            )
+            self.replicas.append(Replica(host, pool))
+        self.counter = itertools.count()
+        self.stats = {'reads': 0, 'fallbacks': 0}
+
+    def _measure_lag(self, pool):
+        """복제 지연(초) 조회, 복제가 멈췄으면 None"""
+        entry = pool.acquire()
+        try:
+            cursor = entry.conn.cursor()
+            try:
+                try:
+                    cursor.execute("SHOW REPLICA STATUS")
+                except MySQLdb.ProgrammingError:
+                    cursor.execute("SHOW SLAVE STATUS")  # MySQL 8.0.22 이전
+                row = cursor.fetchone()
+                columns = [column[0] for column in cursor.description or ()]
+            finally:
+                cursor.close()
+        except Exception:
+            pool.release(entry, discard=True)
+            raise
+        pool.release(entry)
+        if row is None:
+            return 0.0  # 복제 설정이 없는 서버 (읽기 전용 사본 등)
+        status = dict(zip(columns, row))
+        lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+        return None if lag is None else float(lag)
+
+    def check(self):
+        for replica in self.replicas:
+            was_healthy = replica.healthy
+            try:
+                replica.lag = self._measure_lag(replica.pool)
+                replica.error = None if replica.lag is not None else 'replication stopped'
+            except Exception as e:
+                replica.lag = None
+                replica.error = str(e)
+            replica.healthy = replica.lag is not None and replica.lag <= self.max_lag
+            replica.checked_at = time.time()
+            if replica.healthy != was_healthy:
+                if replica.healthy:
+                    logger.info(f"Replica {replica.host} ({self.provider}) is serving reads, lag {replica.lag}s")
+                else:
+                    logger.warning(f"Replica {replica.host} ({self.provider}) removed from reads: "
+                                   f"{replica.error or f'lag {replica.lag}s'}")
+
+    def choose(self):
+        """읽기에 쓸 레플리카 (건강하고 지연이 허용 범위인 것 중 라운드 로빈), 없으면 None"""
+        candidates = [replica for replica in self.replicas if replica.healthy]
+        if not candidates:
+            return None
+        return candidates[next(self.counter) % len(candidates)]
+
+    def close(self):
+        for replica in self.replicas:
+            replica.pool.close()
+
+    def get_stats(self):
+        return dict(self.stats, max_lag=self.max_lag, replicas=[{
+            'host': replica.host,
+            'healthy': replica.healthy,
+            'lag': replica.lag,
+            'checked_at': replica.checked_at,
+            'error': replica.error,
+            'circuit': replica.pool.breaker.get_state(),
+            'pool': replica.pool.get_stats()
+        } for replica in self.replicas])
+
+def create_replica_set(config, check=True):
+    """설정에 mysql_replicas가 있으면 레플리카 묶음 생성 (check면 첫 지연 측정까지 수행), 없으면 None"""
+    hosts = parse_replica_hosts(config.get('mysql_replicas'))
+    if not hosts:
+        return None
+    replicas = ReplicaSet(config, hosts, app.config['REPLICA_MAX_LAG'])
+    if check:
+        replicas.check()
+    return replicas
+
+class PooledMySQL:
+    """Flask-MySQLdb와 같은 mysql.connection 인터페이스를 풀 기반으로 제공
+
+    요청(앱 컨텍스트)당 연결 하나를 빌려 쓰고 teardown에서 반환한다.
+    레플리카가 있으면 read_connection은 레플리카 연결을 따로 빌린다.
+    """
+
+    def __init__(self, app_instance, pool, replicas=None):
+        self.pool = pool
+        self.replicas = replicas
+        self.swap_lock = threading.Lock()
+        app_instance.teardown_appcontext(self.teardown)
+
+    def _primary_entry(self):
+        entry = g.get('_mysql_entry')
+        if entry is None:
+            pool = self.pool
+            entry = pool.acquire()
+            g._mysql_entry = entry
+            g._mysql_pool = pool
+        return entry, g._mysql_pool
+
+    def _read_entry(self):
+        entry = g.get('_mysql_read_entry')
+        if entry is not None:
+            return entry, g._mysql_read_pool
+        replicas = self.replicas
+        replica = replicas.choose() if replicas is not None and not self.recently_wrote() else None
+        if replica is None:
+            return self._primary_entry()
+        try:
+            entry = replica.pool.acquire()
+        except Exception as e:
+            replicas.stats['fallbacks'] += 1
+            logger.warning(f"Replica {replica.host} unavailable, reading from primary: {e}")
+            return self._primary_entry()
+        replicas.stats['reads'] += 1
+        g._mysql_read_entry = entry
+        g._mysql_read_pool = replica.pool
+        return entry, replica.pool
+
+    def recently_wrote(self):
+        """이번 요청 또는 READ_YOUR_WRITES_WINDOW 안에 이 세션이 primary에 썼는지"""
+        if not has_request_context():
+            return False
+        if g.get('_mysql_wrote'):
+            return True
+        last_write_at = session.get('_last_write_at')
+        return last_write_at is not None and time.time() - last_write_at < app.config['READ_YOUR_WRITES_WINDOW']
+
+    @property
+    def connection(self):
+        """primary 연결 (쓰기, 쓰기 직전 읽기)"""
+        return self._primary_entry()[0].conn
+
+    @property
+    def read_connection(self):
+        """읽기 전용 조회용 연결 (레플리카 우선, 없거나 최근에 쓴 세션이면 primary)"""
+        return self._read_entry()[0].conn
+
+    def stream_cursor(self, read=False):
+        """요청 연결의 서버 측 커서 (결과를 모두 읽거나 close하기 전에는 같은 연결로 다른 쿼리 불가)"""
+        entry, pool = self._read_entry() if read else self._primary_entry()
+        return entry.conn.cursor(pool.stream_cursorclass)
+
+    def teardown(self, exception):
+        for entry_key, pool_key in (('_mysql_entry', '_mysql_pool'), ('_mysql_read_entry', '_mysql_read_pool')):
+            entry = g.pop(entry_key, None)
+            pool = g.pop(pool_key, None)
+            if entry is not None:
+                pool.release(entry, discard=exception is not None)
+
+    def swap_pool(self, new_pool):
+        """새 풀로 교체 후 이전 풀 정리 (사용 중인 연결은 반환 시 닫힘)"""
+        with self.swap_lock:
+            old_pool, self.pool = self.pool, new_pool
+        old_pool.close()
+
+    def swap_replicas(self, new_replicas):
+        with self.swap_lock:
+            old_replicas, self.replicas = self.replicas, new_replicas
+        if old_replicas is not None:
+            old_replicas.close()
+
+mysql = PooledMySQL(app, create_mysql_pool(active_config, warmup=not DEFER_STARTUP),
+                    create_replica_set(active_config, check=not DEFER_STARTUP))
+cloud_provider.active = Backends(active_config, mysql.pool, app.config['SESSION_REDIS'].client, mysql.replicas)
+
+@app.after_request
+def remember_session_write(response):
+    """레플리카 사용 중 primary에 쓴 세션은 마지막 쓰기 시각을 기록 (read-your-writes)"""
+    if mysql.replicas is not None and g.get('_mysql_wrote'):
+        session['_last_write_at'] = time.time()
+    return response
+
+# 시크릿 교체(rotation) 반영: 바뀐 항목만 다시 설정
+def apply_rotated_config(new_config, changed):
+    active = cloud_provider.active
+    # 새 자격 증명으로 워밍업한 풀/클라이언트만 만들어 교체
+    pool = create_mysql_pool(new_config) if changed & set(MYSQL_CONFIG_FIELDS) else active.pool
+    replicas = create_replica_set(new_config) if changed & set(MYSQL_REPLICA_FIELDS) else active.replicas
+    if changed & set(REDIS_CONFIG_FIELDS):
+        redis_client = cloud_provider.create_redis_client(new_config, socket_connect_timeout=5)
+    else:
+        redis_client = active.redis
+    cloud_provider.activate(Backends(new_config, pool, redis_client, replicas), app, mysql)
+    if 'flask_secret' in changed:
+        app.secret_key = new_config['flask_secret']
+    logger.info(f"Applied rotated {new_config['provider']} secret: {', '.join(sorted(changed))}")
+
+cloud_provider.rotation_listeners.append(apply_rotated_config)
+
+# 게시판 페이지네이션 설정
+app.config['BOARD_PAGE_SIZE'] = int(os.getenv('BOARD_PAGE_SIZE', '20'))
+app.config['BOARD_MAX_PAGE_SIZE'] = int(os.getenv('BOARD_MAX_PAGE_SIZE', '100'))
+
+# 게시판 페이지 캐시 설정 (SESSION_REDIS 사용)
+app.config['BOARD_CACHE_ENABLED'] = os.getenv('BOARD_CACHE_ENABLED', 'true').lower() == 'true'
+app.config['BOARD_CACHE_TTL'] = int(os.getenv('BOARD_CACHE_TTL', '60'))
+
+# 게시판 스트리밍 렌더링 (서버 측 커서 + 템플릿 스트리밍, 페이지 캐시는 사용하지 않음)
+app.config['BOARD_STREAMING'] = os.getenv('BOARD_STREAMING', 'false').lower() == 'true'
+app.config['BOARD_STREAM_BUFFER'] = int(os.getenv('BOARD_STREAM_BUFFER', '64'))  # 템플릿 조각 몇 개씩 묶어 보낼지
 
 # Flask-Login 설정
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
 
-# 사용자 클래스
+# 사용자 캐시 설정
+app.config['USER_CACHE_TTL'] = int(os.getenv('USER_CACHE_TTL', '300'))
+app.config['USER_CACHE_SIZE'] = int(os.getenv('USER_CACHE_SIZE', '10000'))
+
+# 사용자 클래스 (비밀번호 해시는 보관하지 않음)
 class User(UserMixin):
-    def __init__(self, id, username, password):
+    def __init__(self, id, username):
         self.id = id
         self.username = username
-        self.password = password
+
+class UserCache:
+    """load_user용 프로세스 내 캐시 (TTL + LRU, id/username만 보관)
+
+    다른 워커의 변경은 TTL 안에 반영된다.
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry and entry[1] > now:
+                self.entries.move_to_end(user_id)
+                self.stats['hits'] += 1
+                return entry[0]
+            if entry:
+                del self.entries[user_id]
+            self.stats['misses'] += 1
+            return None
+
+    def set(self, user_id, username):
+        with self.lock:
+            self.entries[user_id] = (username, time.monotonic() + self.ttl)
+            self.entries.move_to_end(user_id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            if self.entries.pop(str(user_id), None) is not None:
+                self.stats['invalidations'] += 1
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats, size=len(self.entries))
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['ttl'] = self.ttl
+        stats['max_size'] = self.max_size
+        return stats
+
+user_cache = UserCache(app.config['USER_CACHE_TTL'], app.config['USER_CACHE_SIZE'])
+
+# 비밀번호 해시 설정 (해시/검증은 전용 프로세스 풀에서 수행, WORKERS=0 이면 요청 스레드에서 직접 수행)
+app.config['PASSWORD_HASH_METHOD'] = os.getenv('PASSWORD_HASH_METHOD', 'scrypt')
+app.config['PASSWORD_HASH_WORKERS'] = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+app.config['PASSWORD_HASH_QUEUE'] = int(os.getenv('PASSWORD_HASH_QUEUE', '8'))  # 워커 외 대기 가능 작업 수
+app.config['PASSWORD_HASH_TIMEOUT'] = float(os.getenv('PASSWORD_HASH_TIMEOUT', '5'))
+
+class PasswordHasherBusy(Exception):
+    """해시 풀 대기열이 가득 찼거나 제한 시간 안에 결과를 받지 못함"""
+
+class PasswordHasher:
+    """scrypt 해시/검증을 제한된 프로세스 풀에서 실행
+
+    해시 계산이 GIL을 잡고 있지 않도록 별도 프로세스에서 수행하고,
+    처리 중 + 대기 작업이 max_pending을 넘으면 기다리지 않고 PasswordHasherBusy를 낸다.
+    """
+
+    def __init__(self, method, workers, queue_size, timeout):
+        self.method = method
+        self.workers = workers
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(workers + queue_size) if workers else None
+        self.executor = None
+        self.pid = None
+        self.lock = threading.Lock()
+        # 'scrypt' -> 'scrypt:32768:8:1' 처럼 기본 파라미터가 채워진 접두어 (요청 스레드에서 해시를 계산하지 않음)
+        self.hash_prefix = password_hash_prefix(method)
+        self.stats = {'submitted': 0, 'rejected': 0, 'timeouts': 0, 'rehashed': 0}
+
+    def _get_executor(self):
+        # 프로세스 풀은 워커마다 한 번 생성 (gunicorn 등에서 fork된 워커는 자기 풀을 새로 만든다)
+        if self.pid != os.getpid():
+            with self.lock:
+                if self.pid != os.getpid():
+                    self.executor = self._create_executor()
+                    self.pid = os.getpid()
+        return self.executor
+
+    def _create_executor(self):
+        """fork가 안전하면 fork, 아니면 spawn 풀 (둘 다 쓸 수 없으면 None: 요청 스레드에서 직접 계산)"""
+        # fork는 다른 스레드가 없을 때만 안전하다 (잡혀 있던 락이 자식에 그대로 복제됨).
+        # 평소에는 start_worker()가 스레드를 띄우기 전에 start()로 풀을 만든다
+        running = [t.name for t in threading.enumerate() if t is not threading.current_thread()]
+        if not running and 'fork' in multiprocessing.get_all_start_methods():
+            return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('fork'))
+        if __name__ == '__main__':
+            # spawn 자식은 __main__을 다시 import하므로 python app.py로 실행 중이면 부트스트랩 전체가 재실행된다
+            logger.error(f"Threads already running ({', '.join(running)}), hashing passwords in request threads")
+            return None
+        # 작업 함수는 werkzeug.security의 함수이므로 spawn 자식은 app.py를 import하지 않는다
+        logger.warning(f"Threads already running ({', '.join(running)}), starting password hash pool with spawn")
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def start(self):
+        """백그라운드 스레드를 띄우기 전에 풀의 자식 프로세스를 미리 fork"""
+        executor = self._get_executor() if self.workers else None
+        if executor is not None:
+            # fork 컨텍스트의 풀은 첫 작업 제출 때 자식을 모두 만든다
+            executor.submit(os.getpid).result()
+
+    def _run(self, func, *args):
+        executor = self._get_executor() if self.workers else None
+        if executor is None:
+            return func(*args)
+        if not self.slots.acquire(blocking=False):
+            self.stats['rejected'] += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+        try:
+            future = executor.submit(func, *args)
+        except Exception:
+            self.slots.release()
+            raise
+        self.stats['submitted'] += 1
+        future.add_done_callback(lambda _: self.slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            self.stats['timeouts'] += 1
+            raise PasswordHasherBusy("Password hashing timed out")
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """저장된 해시의 방식/파라미터가 현재 설정(PASSWORD_HASH_METHOD)과 다른지 확인"""
+        return pwhash.split('$', 1)[0] != self.hash_prefix
+
+    def get_stats(self):
+        return dict(self.stats, method=self.method, workers=self.workers, timeout=self.timeout)
+
+password_hasher = PasswordHasher(
+    app.config['PASSWORD_HASH_METHOD'],
+    app.config['PASSWORD_HASH_WORKERS'],
+    app.config['PASSWORD_HASH_QUEUE'],
+    app.config['PASSWORD_HASH_TIMEOUT']
+)
+
+# 헬스 모니터 설정
+app.config['HEALTH_CHECK_INTERVAL'] = int(os.getenv('HEALTH_CHECK_INTERVAL', '30'))
+# 스냅샷이 이보다 오래되면 모니터가 멈춘 것으로 보고 readiness 실패 (초)
+app.config['HEALTH_SNAPSHOT_MAX_AGE'] = float(os.getenv(
+    'HEALTH_SNAPSHOT_MAX_AGE', str(app.config['HEALTH_CHECK_INTERVAL'] * 3)))
+# 헬스 점검 리더 선출: 범위(host: 호스트당 / fleet: 전체) 안에서 한 워커만 점검하고 결과를 Redis로 공유
+app.config['HEALTH_LEADER_ELECTION'] = os.getenv('HEALTH_LEADER_ELECTION', 'true').lower() == 'true'
+app.config['HEALTH_LEADER_SCOPE'] = os.getenv('HEALTH_LEADER_SCOPE', 'host')
+# 리스 유지 시간 (초): 리더는 매 점검 주기마다 갱신하고, 리더가 죽으면 만료 후 다른 워커가 이어받는다
+app.config['HEALTH_LEADER_TTL'] = float(os.getenv(
+    'HEALTH_LEADER_TTL', str(app.config['HEALTH_CHECK_INTERVAL'] * 1.5)))
+
+# 헬스 상태 스냅샷 (불변 객체를 통째로 교체하므로 읽기에 락이 필요 없음)
+# checks: {'mysql': {'ok': bool, 'latency_ms': float}, 'redis': {...}}
+HealthSnapshot = namedtuple('HealthSnapshot', ['provider', 'healthy', 'checks', 'checked_at', 'switched_at'])
+
+def redis_subscribe_forever(redis_proxy, channel, on_message):
+    """채널 구독 루프 (스레드용): 메시지를 JSON으로 풀어 on_message에 전달
+
+    프로바이더 전환으로 Redis 클라이언트가 바뀌면 새 클라이언트로 다시 구독한다.
+    """
+    while True:
+        client = redis_proxy.client
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(channel)
+            try:
+                while client is redis_proxy.client:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        on_message(json.loads(message['data']))
+            finally:
+                pubsub.close()
+        except Exception as e:
+            logger.warning(f"Redis subscription to {channel} failed: {e}")
+            time.sleep(5)
+
+class HealthLeaderElection:
+    """Redis 리스(SET NX PX) 기반 헬스 점검 리더 선출과 스냅샷 공유
+
+    리더만 백엔드를 점검해 스냅샷을 채널에 발행하고(최신 값은 키에도 저장),
+    나머지 워커는 구독해 반영한다. Redis를 쓸 수 없으면 각 워커가 직접 점검한다.
+    Lua 스크립트 대신 WATCH/MULTI로 갱신하므로 fakeredis('embedded')에서도 동작한다.
+    """
+
+    def __init__(self, redis_proxy, scope, ttl, enabled=True):
+        self.redis_proxy = redis_proxy
+        self.scope = socket.gethostname() if scope == 'host' else scope
+        self.key = f'health:leader:{self.scope}'
+        self.snapshot_key = f'health:snapshot:{self.scope}'
+        self.channel = f'health:snapshots:{self.scope}'
+        self.ttl_ms = int(ttl * 1000)
+        self.enabled = enabled
+        self.is_leader = not enabled
+        self.token = None
+        self.error_logged = False
+        self.stats = {'acquired': 0, 'lost': 0, 'errors': 0, 'published': 0, 'received': 0}
+
+    def start(self, on_snapshot):
+        """워커 프로세스마다 토큰을 새로 만들고 구독 스레드 시작 (fork 이후 호출)"""
+        self.token = f'{socket.gethostname()}:{os.getpid()}:{os.urandom(4).hex()}'
+        if self.enabled:
+            threading.Thread(target=redis_subscribe_forever, args=(self.redis_proxy, self.channel, lambda data: self._receive(data, on_snapshot)),
+                             name='health-subscriber', daemon=True).start()
+
+    def campaign(self):
+        """리스 획득/갱신 -> 이번 주기에 이 워커가 점검할지 여부"""
+        if not self.enabled:
+            return True
+        client = self.redis_proxy.client
+        try:
+            leader = (self.is_leader and self._renew(client)) or bool(
+                client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+        except Exception as e:
+            self.stats['errors'] += 1
+            if not self.error_logged:
+                logger.warning(f"Health leader election unavailable, probing locally: {e}")
+                self.error_logged = True
+            return True
+        self.error_logged = False
+        if leader != self.is_leader:
+            self.stats['acquired' if leader else 'lost'] += 1
+            logger.info(f"Health prober leadership {'acquired' if leader else 'lost'} ({self.scope}, pid {os.getpid()})")
+        self.is_leader = leader
+        return leader
+
+    def _renew(self, client):
+        with client.pipeline() as pipe:
+            try:
+                pipe.watch(self.key)
+                holder = pipe.get(self.key)
+                if holder is None or (holder.decode() if isinstance(holder, bytes) else holder) != self.token:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.pexpire(self.key, self.ttl_ms)
+                pipe.execute()
+                return True
+            except redis.exceptions.WatchError:
+                return False
+
+    def publish(self, snapshot, clients=()):
+        """스냅샷 공유 (전환 직후에는 이전 Redis에도 보내 아직 옮기지 않은 워커가 따라오게 한다)"""
+        message = json.dumps(dict(snapshot._asdict(), leader=self.token))
+        for client in (self.redis_proxy.client, *clients):
+            try:
+                client.set(self.snapshot_key, message, px=self.ttl_ms * 2)
+                client.publish(self.channel, message)
+                self.stats['published'] += 1
+            except Exception as e:
+                logger.warning(f"Health snapshot publish failed: {e}")
+
+    def latest(self):
+        """마지막으로 공유된 스냅샷 (없으면 None)"""
+        raw = self.redis_proxy.client.get(self.snapshot_key)
+        return self._decode(json.loads(raw)) if raw is not None else None
+
+    def _decode(self, data):
+        data.pop('leader', None)
+        return HealthSnapshot(**data)
+
+    def _receive(self, data, on_snapshot):
+        if data.get('leader') == self.token:
+            return
+        self.stats['received'] += 1
+        on_snapshot(self._decode(data))
+
+    def get_stats(self):
+        return dict(self.stats, enabled=self.enabled, scope=self.scope, is_leader=self.is_leader, token=self.token)
+
+class HealthMonitor:
+    """백그라운드 스레드 하나가 현재 프로바이더를 점검하고 스냅샷을 갱신
+
+    요청 경로에서는 snapshot 속성만 읽으므로 점검 비용이 요청 지연에 포함되지 않는다.
+    """
+
+    def __init__(self, provider, app_instance, mysql_instance, interval, election):
+        self.provider = provider
+        self.app = app_instance
+        self.mysql = mysql_instance
+        self.interval = interval
+        self.election = election
+        self.snapshot = HealthSnapshot(provider.current_provider, True, {}, time.time(), None)
+        self.wake_event = threading.Event()
+        self.local_check = False
+        self.thread = None
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.election.start(self.apply_shared_snapshot)
+            self.thread = threading.Thread(target=self.run, name='health-monitor', daemon=True)
+            self.thread.start()
+            # 첫 주기를 기다리지 않고 바로 리더 선출/점검해 readiness 스냅샷을 채운다
+            self.wake_event.set()
+
+    def is_alive(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def is_ready(self, snapshot, max_age):
+        """스냅샷 기준 준비 상태 (점검 실패 또는 스냅샷이 max_age보다 오래됨 -> False)"""
+        return snapshot.healthy and time.time() - snapshot.checked_at <= max_age
+
+    def request_check(self):
+        """다음 주기를 기다리지 않고 즉시 점검 요청 (이 워커의 연결 장애이므로 리더가 아니어도 직접 점검)"""
+        self.local_check = True
+        self.wake_event.set()
+
+    def apply_shared_snapshot(self, snapshot):
+        """리더가 공유한 스냅샷 반영 (리더가 프로바이더를 전환했으면 따라 전환)"""
+        if self.election.is_leader:
+            return
+        if snapshot.provider != self.provider.current_provider:
+            logger.info(f"Health leader reports provider {snapshot.provider}, following")
+            if not self.provider.follow_provider(self.app, self.mysql, snapshot.provider):
+                self.request_check()
+                return
+        self.snapshot = snapshot
+        self.provider.last_health_check = snapshot.checked_at
+
+    def _timed(self, name, check, config):
+        start = time.perf_counter()
+        ok = check(config)
+        elapsed = time.perf_counter() - start
+        HEALTH_PROBE_LATENCY.labels(name, str(bool(ok)).lower()).observe(elapsed)
+        return {'ok': ok, 'latency_ms': round(elapsed * 1000, 2)}
+
+    def _check_database(self, config):
+        try:
+            return self.mysql.pool.check()
+        except Exception as e:
+            logger.error(f"Database pool check failed for {config['provider']}: {e}")
+            return False
+    
+    def check_and_publish(self):
+        """점검 후 DB 장애면 전환하고, 리더면 결과를 다른 워커에 공유"""
+        redis_before = self.election.redis_proxy.client
+        snapshot = self.probe()
+        if not snapshot.checks['mysql']['ok']:
+            logger.warning(f"Current {snapshot.provider} database connection failed, attempting failover")
+            if self.provider.switch_provider(self.app, self.mysql):
+                self.snapshot = self.snapshot._replace(switched_at=time.time())
+                snapshot = self.probe()
+        if self.election.is_leader and self.election.enabled:
+            redis_after = self.election.redis_proxy.client
+            self.election.publish(snapshot, (redis_before,) if redis_before is not redis_after else ())
+
+    def probe(self):
+        """현재 설정으로 DB/Redis 연결을 점검하고 스냅샷 갱신"""
+        config = self.provider.current_config
+        checks = {
+            # 현재 프로바이더 DB는 새 연결 대신 풀 연결로 확인
+            'mysql': self._timed('mysql', self._check_database, config),
+            'redis': self._timed('redis', self.provider.test_redis_connection, config)
+        }
+        snapshot = HealthSnapshot(
+            provider=self.provider.current_provider,
+            healthy=all(check['ok'] for check in checks.values()),
+            checks=checks,
+            checked_at=time.time(),
+            switched_at=self.snapshot.switched_at
+        )
+        self.snapshot = snapshot
+        self.provider.last_health_check = snapshot.checked_at
+        return snapshot
+
+    def run(self):
+        while True:
+            self.wake_event.wait(self.interval)
+            self.wake_event.clear()
+            local_check, self.local_check = self.local_check, False
+            try:
+                if self.election.campaign() or local_check:
+                    self.check_and_publish()
+                elif not self.snapshot.checks or time.time() - self.snapshot.checked_at > self.interval * 2:
+                    # 시작 직후이거나 발행을 놓쳤으면 저장된 최신 스냅샷을 읽는다
+                    snapshot = self.election.latest()
+                    if snapshot is not None:
+                        self.apply_shared_snapshot(snapshot)
+            except Exception as e:
+                logger.error(f"Health check failed: {e}")
+            try:
+                self.provider.refresh_standby()
+            except Exception as e:
+                logger.error(f"Standby refresh failed: {e}")
+
+health_leader = HealthLeaderElection(
+    app.config['SESSION_REDIS'],
+    app.config['HEALTH_LEADER_SCOPE'],
+    app.config['HEALTH_LEADER_TTL'],
+    enabled=app.config['HEALTH_LEADER_ELECTION']
+)
+health_monitor = HealthMonitor(cloud_provider, app, mysql, app.config['HEALTH_CHECK_INTERVAL'], health_leader)
+# DB/Redis 서킷이 열리면 다음 주기를 기다리지 않고 점검 (필요 시 failover)
+circuit_open_listeners.append(
+    lambda breaker: breaker.dependency != 'mysql_replica' and health_monitor.request_check())
 
 # 헬스체크 데코레이터
 def health_check_wrapper(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # 30초마다 헬스체크 수행
-        current_time = time.time()
-        if current_time - cloud_provider.last_health_check > 30:
-            try:
-                # 현재 설정으로 연결 테스트
-                if not cloud_provider.test_database_connection(cloud_provider.current_config):
-                    logger.warning(f"Current {cloud_provider.current_config['provider']} database connection failed, attempting failover")
-                    
-                    # 프로바이더 전환 시도
-                    if cloud_provider.switch_provider(app, mysql):
-                        flash(f'Switched to {cloud_provider.current_provider} due to connection issues', 'info')
-                        
-                cloud_provider.last_health_check = current_time
-                
-            except Exception as e:
-                logger.error(f"Health check failed: {e}")
+        # 백그라운드 모니터가 갱신한 스냅샷만 확인 (요청 경로에서 연결 테스트 없음)
+        snapshot = health_monitor.snapshot
+        backends = cloud_provider.active
+        # 전환 알림은 이미 세션이 있는 요청에만 (비로그인 새 요청에 세션/쿠키를 만들지 않음 -> Redis 호출 0회 유지)
+        has_session = app.config['SESSION_COOKIE_NAME'] in request.cookies
+        if has_session and snapshot.switched_at and time.time() - snapshot.switched_at < health_monitor.interval * 2:
+            if session.get('_failover_seen') != snapshot.switched_at:
+                session['_failover_seen'] = snapshot.switched_at
+                flash(f'Switched to {snapshot.provider} due to connection issues', 'info')
         
         try:
             return f(*args, **kwargs)
         except Exception as e:
             logger.error(f"Route execution failed: {e}")
-            # 데이터베이스 오류인 경우 대체 설정 시도
-            if any(keyword in str(e).lower() for keyword in ["database", "mysql", "connection", "redis"]):
-                try:
-                    if cloud_provider.switch_provider(app, mysql):
+            # DB/Redis 연결 장애인 경우 대체 설정 시도 (예외 타입으로 분류)
+            if classify_dependency_error(e) in ('mysql', 'redis'):
+                # 대기 연결이 있으면 요청 안에서 포인터 교체로 한 번만 전환하고,
+                # 그 외에는 백그라운드 모니터에 점검을 요청한다 (요청은 재연결을 기다리지 않음)
+                if cloud_provider.failover_to_standby(app, mysql, backends):
+                    if has_session:
                         flash(f'Switched to {cloud_provider.current_provider} due to connection issues', 'warning')
-                        return redirect(request.url)
-                except Exception as switch_error:
-                    logger.error(f"Emergency failover failed: {switch_error}")
+                    return redirect(request.url)
+                health_monitor.request_check()
             raise e
     
     return decorated_function
@@ -356,13 +1968,18 @@ def health_check_wrapper(f):
 # 사용자 로드 함수
 @login_manager.user_loader
 def load_user(user_id):
+    user_id = str(user_id)
+    username = user_cache.get(user_id)
+    if username is not None:
+        return User(id=int(user_id), username=username)
     try:
-        cursor = mysql.connection.cursor()
-        cursor.execute("SELECT * FROM users WHERE id = %s", (user_id,))
+        cursor = mysql.read_connection.cursor()
+        cursor.execute("SELECT id, username FROM users WHERE id = %s", (user_id,))
         user = cursor.fetchone()
         cursor.close()
         if user:
-            return User(id=user[0], username=user[1], password=user[2])
+            user_cache.set(user_id, user[1])
+            return User(id=user[0], username=user[1])
         return None
     except Exception as e:
         logger.error(f"User load failed: {e}")
@@ -390,19 +2007,35 @@ def register():
             return render_template('register.html')
         
         try:
-            hashed_password = generate_password_hash(password)
+            hashed_password = password_hasher.hash(password)
             cursor = mysql.connection.cursor()
             cursor.execute("INSERT INTO users (username, password) VALUES (%s, %s)", (username, hashed_password))
             mysql.connection.commit()
             cursor.close()
             flash('Registration successful. Please log in.', 'success')
             return redirect(url_for('login'))
+        except PasswordHasherBusy as e:
+            logger.warning(f"Registration rejected: {e}")
+            flash('Server is busy. Please try again shortly.', 'error')
+            return render_template('register.html'), 503, {'Retry-After': '1'}
         except Exception as e:
             logger.error(f"Registration failed: {e}")
             flash('Registration failed. Username may already exist.', 'error')
     
     return render_template('register.html')
 
+def rehash_password(user_id, password):
+    """해시 설정이 바뀐 경우 로그인 성공 시 현재 설정으로 다시 저장 (실패해도 로그인은 진행)"""
+    try:
+        new_hash = password_hasher.hash(password)
+        cursor = mysql.connection.cursor()
+        cursor.execute("UPDATE users SET password = %s WHERE id = %s", (new_hash, user_id))
+        mysql.connection.commit()
+        cursor.close()
+        password_hasher.stats['rehashed'] += 1
+    except Exception as e:
+        logger.warning(f"Password rehash failed for user {user_id}: {e}")
+
 @app.route('/login', methods=['GET', 'POST'])
 @health_check_wrapper
 def login():
@@ -416,16 +2049,24 @@ def login():
         
         try:
             cursor = mysql.connection.cursor()
-            cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
+            cursor.execute("SELECT id, username, password FROM users WHERE username = %s", (username,))
             user = cursor.fetchone()
             cursor.close()
             
-            if user and check_password_hash(user[2], password):
-                login_user(User(id=user[0], username=user[1], password=user[2]))
+            if user and password_hasher.verify(user[2], password):
+                if password_hasher.needs_rehash(user[2]):
+                    rehash_password(user[0], password)
+                # 로그인 시 캐시를 최신 값으로 갱신
+                user_cache.set(str(user[0]), user[1])
+                login_user(User(id=user[0], username=user[1]))
                 next_page = request.args.get('next')
                 return redirect(next_page or url_for('dashboard'))
             else:
                 flash('Invalid username or password.', 'error')
+        except PasswordHasherBusy as e:
+            logger.warning(f"Login rejected: {e}")
+            flash('Server is busy. Please try again shortly.', 'error')
+            return render_template('login.html'), 503, {'Retry-After': '1'}
         except Exception as e:
             logger.error(f"Login failed: {e}")
             flash('Login failed due to system error.', 'error')
@@ -456,25 +2097,203 @@ def dashboard():
         aws_status='🟡 Standby'
     )
 
+# 게시판 커서 페이지네이션 (created_at, id 기준 keyset, 커서/쿼리 형식은 board_common)
+def get_board_page_size():
+    """요청 파라미터(per_page)와 설정값으로 페이지 크기 결정"""
+    page_size = request.args.get('per_page', app.config['BOARD_PAGE_SIZE'], type=int)
+    return clamp_page_size(page_size, app.config['BOARD_MAX_PAGE_SIZE'])
+
+def fetch_board_page(cursor, page_size, next_cursor=None, prev_cursor=None):
+    """게시글 한 페이지 조회 -> (posts, prev_cursor, next_cursor)
+
+    next_cursor가 주어지면 그보다 오래된 글, prev_cursor가 주어지면 그보다 최신 글을
+    idx_created_at 인덱스 순서대로 page_size + 1개만 읽어 다음 페이지 존재 여부를 판단한다.
+    본문은 목록에 필요한 길이(BOARD_EXCERPT_LENGTH + 1)만 가져온다.
+    """
+    newer = decode_board_cursor(prev_cursor) if not next_cursor else None
+    older = decode_board_cursor(next_cursor)
+
+    if newer:
+        # 이전(더 최신) 페이지: 오름차순으로 읽은 뒤 뒤집는다
+        cursor.execute(*newer_board_page_query(page_size, newer))
+        page = newer_board_page(list(cursor.fetchall()), page_size)
+        if page:
+            return page
+        older = None  # 더 최신 글이 없으면 첫 페이지로
+
+    cursor.execute(*older_board_page_query(page_size, older))
+    return older_board_page(list(cursor.fetchall()), page_size, older)
+
+class BoardCache:
+    """Redis 게시판 페이지 캐시 (read-through, 버전 키로 무효화)
+
+    페이지 키에 board:version 값을 포함시켜, 글 작성/수정/삭제 시 INCR 한 번으로
+    이전 페이지들을 모두 무효화한다. 이전 버전 키는 TTL로 자연 소멸한다.
+    """
+
+    def __init__(self, app_instance):
+        self.app = app_instance
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0, 'bytes_stored': 0, 'errors': 0}
+
+    @property
+    def redis(self):
+        # 프로바이더 전환 시 RedisProxy가 가리키는 클라이언트가 바뀐다
+        return self.app.config['SESSION_REDIS']
+
+    def _count(self, name, amount=1):
+        with self.lock:
+            self.stats[name] += amount
+
+    def get_page(self, page_size, next_cursor, prev_cursor, loader):
+        """캐시된 페이지 반환, 없으면 loader()로 조회 후 저장"""
+        if not self.app.config['BOARD_CACHE_ENABLED']:
+            return loader()
+
+        key = None
+        try:
+            version = int(self.redis.get(BOARD_CACHE_VERSION_KEY) or 0)
+            key = board_cache_key(version, page_size, next_cursor, prev_cursor)
+            raw = self.redis.get(key)
+            if raw is not None:
+                self._count('hits')
+                return deserialize_board_page(raw)
+        except Exception as e:
+            logger.warning(f"Board cache read failed: {e}")
+            self._count('errors')
+
+        self._count('misses')
+        page = loader()
+        if key is not None:
+            try:
+                raw = serialize_board_page(page)
+                self.redis.setex(key, self.app.config['BOARD_CACHE_TTL'], raw)
+                self._count('bytes_stored', len(raw))
+            except Exception as e:
+                logger.warning(f"Board cache write failed: {e}")
+                self._count('errors')
+        return page
+
+    def invalidate(self):
+        """게시글 변경 시 버전 증가로 모든 캐시 페이지 무효화"""
+        try:
+            self.redis.incr(BOARD_CACHE_VERSION_KEY)
+            self._count('invalidations')
+        except Exception as e:
+            logger.warning(f"Board cache invalidation failed: {e}")
+            self._count('errors')
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['enabled'] = self.app.config['BOARD_CACHE_ENABLED']
+        stats['ttl'] = self.app.config['BOARD_CACHE_TTL']
+        return stats
+
+board_cache = BoardCache(app)
+
+class BoardPageStream:
+    """서버 측 커서 결과를 행 단위로 템플릿에 넘기는 게시판 페이지
+
+    템플릿의 {% if page.posts %} 를 위해 첫 행만 미리 읽고, 이전/다음 페이지 커서는
+    반복이 끝난 뒤(목록 아래 페이지 링크를 렌더링할 때) 계산된다.
+    """
+
+    def __init__(self, cursor, page_size, older):
+        self.cursor = cursor
+        self.page_size = page_size
+        self.older = older
+        self.first = self.last = None
+        self.has_more = False
+        self.pending = cursor.fetchone()
+
+    @property
+    def posts(self):
+        return self
+
+    def __bool__(self):
+        return self.pending is not None
+
+    def __iter__(self):
+        count = 0
+        try:
+            while self.pending is not None:
+                if count == self.page_size:
+                    self.has_more = True
+                    break
+                row = self.pending
+                count += 1
+                if self.first is None:
+                    self.first = row
+                self.last = row
+                self.pending = self.cursor.fetchone()
+                yield row
+        finally:
+            self.cursor.close()
+
+    @property
+    def prev_cursor(self):
+        return encode_board_cursor(self.first[3], self.first[0]) if self.older and self.first else None
+
+    @property
+    def next_cursor(self):
+        return encode_board_cursor(self.last[3], self.last[0]) if self.has_more else None
+
+def stream_buffered_template(template_name, buffer_size, **context):
+    """stream_template과 같되 작은 조각을 buffer_size개씩 묶어 보낸다 (청크/압축 flush 횟수 감소)"""
+    app.update_template_context(context)
+    stream = app.jinja_env.get_template(template_name).stream(context)
+    stream.enable_buffering(buffer_size)
+    return stream_with_context(stream)
+
+def stream_board(page_size, next_cursor):
+    """첫 페이지/이전 글 페이지를 서버 측 커서로 읽으며 바로 렌더링해 전송"""
+    cursor = mysql.stream_cursor(read=True)
+    try:
+        older = decode_board_cursor(next_cursor)
+        cursor.execute(*older_board_page_query(page_size, older))
+        page = BoardPageStream(cursor, page_size, older)
+    except Exception:
+        cursor.close()
+        raise
+    # 본문은 save_session 이후에 렌더링되므로 flash 메시지는 지금 꺼내야 세션에서 제거된 상태로 저장된다
+    messages = get_flashed_messages(with_categories=True)
+    return Response(stream_buffered_template(
+        'board.html', app.config['BOARD_STREAM_BUFFER'],
+        page=page, per_page=page_size if 'per_page' in request.args else None,
+        flashed_messages=messages
+    ), mimetype='text/html')
+
 @app.route('/board')
 @login_required
 @health_check_wrapper
 def board():
+    page_size = get_board_page_size()
+    next_cursor = request.args.get('next')
+    prev_cursor = request.args.get('prev')
+
+    def load_page():
+        # 캐시 채우기는 primary에서 (지연된 레플리카 페이지가 무효화 직후 TTL 동안 캐시되지 않도록)
+        connection = mysql.connection if app.config['BOARD_CACHE_ENABLED'] else mysql.read_connection
+        cursor = connection.cursor()
+        try:
+            return fetch_board_page(cursor, page_size, next_cursor=next_cursor, prev_cursor=prev_cursor)
+        finally:
+            cursor.close()
+
     try:
-        cursor = mysql.connection.cursor()
-        cursor.execute("""
-            SELECT p.id, p.title, p.content, p.created_at, u.username 
-            FROM posts p 
-            JOIN users u ON p.author_id = u.id 
-            ORDER BY p.created_at DESC
-        """)
-        posts = cursor.fetchall()
-        cursor.close()
-        return render_template('board.html', posts=posts)
+        # 최신 글 방향(prev) 페이지는 역순으로 읽어 뒤집어야 하므로 스트리밍하지 않는다
+        if app.config['BOARD_STREAMING'] and not prev_cursor:
+            return stream_board(page_size, next_cursor)
+        page = BoardPage(*board_cache.get_page(page_size, next_cursor, prev_cursor, load_page))
+        return render_template('board.html', page=page,
+                               per_page=page_size if 'per_page' in request.args else None)
     except Exception as e:
         logger.error(f"Board loading failed: {e}")
         flash('Failed to load posts.', 'error')
-        return render_template('board.html', posts=[])
+        return render_template('board.html', page=BoardPage([], None, None))
 
 @app.route('/post/new', methods=['GET', 'POST'])
 @login_required
@@ -496,6 +2315,7 @@ def new_post():
             )
             mysql.connection.commit()
             cursor.close()
+            board_cache.invalidate()
             flash('Post created successfully!', 'success')
             return redirect(url_for('board'))
         except Exception as e:
@@ -504,18 +2324,261 @@ def new_post():
     
     return render_template('new_post.html')
 
+# 응답 압축 설정 (brotli 패키지가 없으면 gzip만 사용)
+app.config['COMPRESSION_ENABLED'] = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+app.config['COMPRESSION_MIN_SIZE'] = int(os.getenv('COMPRESSION_MIN_SIZE', '500'))  # 이보다 작은 응답은 압축하지 않음 (바이트)
+app.config['COMPRESSION_GZIP_LEVEL'] = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+app.config['COMPRESSION_BROTLI_QUALITY'] = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'application/javascript',
+    'application/json', 'image/svg+xml', 'text/event-stream'
+}
+
+class StreamCompressor:
+    """gzip/brotli 공통 인터페이스: compress(chunk, flush) / finish()"""
+
+    def __init__(self, encoding, level):
+        self.encoding = encoding
+        if encoding == 'br':
+            self.compressor = brotli.Compressor(quality=level)
+        else:
+            # wbits=31: gzip 헤더/트레일러 포함
+            self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data, flush=False):
+        if self.encoding == 'br':
+            out = self.compressor.process(data)
+            return out + self.compressor.flush() if flush else out
+        out = self.compressor.compress(data)
+        return out + self.compressor.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self):
+        if self.encoding == 'br':
+            return self.compressor.finish()
+        return self.compressor.flush()
+
+def compress_bytes(data, encoding, level):
+    compressor = StreamCompressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+class CompressionStats:
+    """인코딩별 압축 전/후 바이트와 CPU 시간"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def record(self, encoding, bytes_in, bytes_out, cpu_seconds):
+        with self.lock:
+            entry = self.stats.setdefault(encoding, {'responses': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_ms': 0.0})
+            entry['responses'] += 1
+            entry['bytes_in'] += bytes_in
+            entry['bytes_out'] += bytes_out
+            entry['cpu_ms'] += cpu_seconds * 1000
+        COMPRESSION_BYTES.labels(encoding, 'in').inc(bytes_in)
+        COMPRESSION_BYTES.labels(encoding, 'out').inc(bytes_out)
+        COMPRESSION_CPU.labels(encoding).observe(cpu_seconds)
+
+    def get_stats(self):
+        with self.lock:
+            stats = {encoding: dict(entry) for encoding, entry in self.stats.items()}
+        for entry in stats.values():
+            entry['ratio'] = round(entry['bytes_out'] / entry['bytes_in'], 4) if entry['bytes_in'] else 0.0
+            entry['cpu_ms_avg'] = round(entry['cpu_ms'] / entry['responses'], 3) if entry['responses'] else 0.0
+            entry['cpu_ms'] = round(entry['cpu_ms'], 3)
+        return stats
+
+compression_stats = CompressionStats()
+
+def negotiate_encoding():
+    """Accept-Encoding에서 사용할 인코딩 선택 (br > gzip), 없으면 None"""
+    accept = request.accept_encodings
+    if brotli is not None and accept['br']:
+        return 'br'
+    if accept['gzip']:
+        return 'gzip'
+    return None
+
+def compression_level(encoding):
+    if encoding == 'br':
+        return app.config['COMPRESSION_BROTLI_QUALITY']
+    return app.config['COMPRESSION_GZIP_LEVEL']
+
+def compress_stream(chunks, encoding, charset):
+    """스트리밍 응답: 청크마다 flush해서 클라이언트가 바로 렌더링할 수 있게 한다"""
+    compressor = StreamCompressor(encoding, compression_level(encoding))
+    bytes_in = bytes_out = 0
+    cpu_seconds = 0.0
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode(charset)
+            if not chunk:
+                continue
+            started = time.thread_time()
+            out = compressor.compress(chunk, flush=True)
+            cpu_seconds += time.thread_time() - started
+            bytes_in += len(chunk)
+            bytes_out += len(out)
+            yield out
+        out = compressor.finish()
+        bytes_out += len(out)
+        yield out
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+        compression_stats.record(encoding, bytes_in, bytes_out, cpu_seconds)
+
+@app.after_request
+def compress_response(response):
+    """HTML/JSON 등 응답 압축 (정적 파일은 미리 압축된 버전을 사용하므로 제외)"""
+    if (not app.config['COMPRESSION_ENABLED']
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding, response.charset)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < app.config['COMPRESSION_MIN_SIZE']:
+            return response
+        started = time.thread_time()
+        compressed = compress_bytes(data, encoding, compression_level(encoding))
+        compression_stats.record(encoding, len(data), len(compressed), time.thread_time() - started)
+        if len(compressed) >= len(data):
+            return response
+        response.set_data(compressed)
+
+    response.headers['Content-Encoding'] = encoding
+    # 압축된 표현은 바이트가 다르므로 weak ETag로 변경 (If-None-Match는 weak 비교)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+def load_prebuilt_variant(path, encoding, source_data):
+    """빌드 단계에서 만든 압축 파일을 읽는다 (없거나 원본이 바뀌어 내용이 다르면 None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        encoded = f.read()
+    try:
+        if encoding == 'br':
+            decoded = brotli.decompress(encoded)
+        else:
+            decoded = zlib.decompress(encoded, 16 + zlib.MAX_WBITS)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable precompressed asset {path}: {e}")
+        return None
+    if decoded != source_data:
+        logger.warning(f"Ignoring stale precompressed asset {path} (source changed)")
+        return None
+    return encoded
+
+# 정적 파일 fingerprint (내용 해시를 파일명에 넣어 1년 immutable 캐시, manifest 형식은 board_common)
+def precompress_assets(static_folder, manifest):
+    """시작 시 정적 파일을 최고 압축률로 미리 압축 -> {'css/base.css': {'gzip': bytes, 'br': bytes}}
+
+    빌드 단계에서 만든 <파일>.gz / <파일>.br 이 있고 풀었을 때 원본과 같으면 그대로 사용한다.
+    """
+    variants = {}
+    for logical in manifest:
+        mimetype = mimetypes.guess_type(logical)[0]
+        if mimetype not in COMPRESSIBLE_MIMETYPES:
+            continue
+        full_path = os.path.join(static_folder, logical)
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        encoded = {}
+        for encoding, suffix in (('gzip', '.gz'), ('br', '.br')):
+            if encoding == 'br' and brotli is None:
+                continue
+            prebuilt = load_prebuilt_variant(full_path + suffix, encoding, data)
+            if prebuilt is not None:
+                encoded[encoding] = prebuilt
+            else:
+                encoded[encoding] = compress_bytes(data, encoding, 11 if encoding == 'br' else 9)
+        variants[logical] = encoded
+    return variants
+
+asset_manifest = build_asset_manifest(app.static_folder)
+asset_variants = precompress_assets(app.static_folder, asset_manifest)
+# 해시 파일명 -> 원본 경로
+asset_sources = {hashed: logical for logical, hashed in asset_manifest.items()}
+ASSET_MANIFEST_FINGERPRINT = manifest_fingerprint(asset_manifest)
+
+@app.template_global()
+def asset_url(path):
+    """템플릿에서 정적 파일 참조: {{ asset_url('css/base.css') }}"""
+    return url_for('asset', filename=asset_manifest.get(path, path))
+
+@app.route('/assets/<path:filename>')
+def asset(filename):
+    """fingerprint된 정적 파일 (현재 해시와 일치할 때만 immutable 캐시)"""
+    source = asset_sources.get(filename)
+    if source is not None:
+        encoding = negotiate_encoding() if app.config['COMPRESSION_ENABLED'] else None
+        variant = asset_variants.get(source, {}).get(encoding)
+        if variant is not None:
+            response = Response(variant, mimetype=mimetypes.guess_type(source)[0])
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(f"{filename}-{encoding}")
+            response.cache_control.max_age = ASSET_MAX_AGE
+            response.make_conditional(request)
+        else:
+            response = send_from_directory(app.static_folder, source, max_age=ASSET_MAX_AGE)
+        response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+    # 배포 중 이전/다음 버전 HTML이 다른 해시를 요청하면 현재 파일을 캐시 없이 제공
+    logical = unhashed_asset_path(filename)
+    if logical not in asset_manifest:
+        abort(404)
+    response = send_from_directory(app.static_folder, logical, max_age=0)
+    response.cache_control.no_cache = True
+    return response
+
+# 게시글 조건부 GET (ETag / Last-Modified)
+VIEW_POST_TEMPLATE_FINGERPRINT = template_fingerprint(app, ASSET_MANIFEST_FINGERPRINT, 'base.html', 'view_post.html')
+
 @app.route('/post/<int:id>')
 @login_required
 @health_check_wrapper
 def view_post(id):
     try:
-        cursor = mysql.connection.cursor()
-        cursor.execute("""
-            SELECT p.id, p.title, p.content, p.created_at, u.username, p.author_id
-            FROM posts p 
-            JOIN users u ON p.author_id = u.id 
-            WHERE p.id = %s
-        """, (id,))
+        cursor = mysql.read_connection.cursor()
+        # 본문 없이 메타데이터만 먼저 조회
+        cursor.execute(POST_META_QUERY, (id,))
+        meta = cursor.fetchone()
+
+        if not meta:
+            cursor.close()
+            flash('Post not found.', 'error')
+            return redirect(url_for('board'))
+
+        updated_at, author_id, author_name = meta
+        etag = make_post_etag(VIEW_POST_TEMPLATE_FINGERPRINT, id, updated_at, author_id, author_name, current_user.id)
+        # 표시할 flash 메시지가 남아 있으면 304로 응답하지 않는다
+        if not session.get('_flashes') and is_not_modified(request, etag, updated_at):
+            cursor.close()
+            return set_post_cache_headers(make_response('', 304), etag, updated_at)
+
+        cursor.execute(POST_VIEW_QUERY, (id,))
         post = cursor.fetchone()
         cursor.close()
         
@@ -523,7 +2586,9 @@ def view_post(id):
             flash('Post not found.', 'error')
             return redirect(url_for('board'))
         
-        return render_template('view_post.html', post=post)
+        etag = make_post_etag(VIEW_POST_TEMPLATE_FINGERPRINT, post[0], post[6], post[5], post[4], current_user.id)
+        response = make_response(render_template('view_post.html', post=post))
+        return set_post_cache_headers(response, etag, post[6])
     except Exception as e:
         logger.error(f"Post viewing failed: {e}")
         flash('Failed to load post.', 'error')
@@ -556,6 +2621,7 @@ def edit_post(id):
             )
             mysql.connection.commit()
             cursor.close()
+            board_cache.invalidate()
             flash('Post updated successfully!', 'success')
             return redirect(url_for('view_post', id=id))
         
@@ -582,6 +2648,7 @@ def delete_post(id):
         cursor.execute("DELETE FROM posts WHERE id = %s", (id,))
         mysql.connection.commit()
         cursor.close()
+        board_cache.invalidate()
         flash('Post deleted successfully!', 'success')
         return redirect(url_for('board'))
     except Exception as e:
@@ -596,6 +2663,72 @@ def logout():
     flash('You have been logged out.', 'info')
     return redirect(url_for('login'))
 
+# 게시글 JSON API (모바일 클라이언트용, 필드/쿼리/직렬화는 board_common)
+def json_response(data, status=200):
+    return Response(dumps_json(data), status=status, mimetype='application/json')
+
+def api_etag_response(etag, body=None):
+    """ETag가 일치하면 304, 아니면 직렬화된 JSON body 응답 (사용자별 데이터이므로 private)"""
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+    else:
+        response = Response(body, mimetype='application/json')
+    return set_private_etag(response, etag)
+
+@app.route('/api/posts')
+@login_required
+@health_check_wrapper
+def api_posts():
+    """게시글 목록: ?limit=&cursor=&fields= (created_at, id 기준 최신순 커서 페이지네이션)"""
+    fields = parse_post_fields(request.args.get('fields'), POST_LIST_FIELDS, POST_LIST_DEFAULT_FIELDS)
+    if fields is None:
+        return json_response({'error': f"fields must be a subset of: {', '.join(POST_LIST_FIELDS)}"}, 400)
+    limit = clamp_page_size(request.args.get('limit', app.config['BOARD_PAGE_SIZE'], type=int),
+                            app.config['BOARD_MAX_PAGE_SIZE'])
+    cursor_value = request.args.get('cursor')
+    older = decode_board_cursor(cursor_value)
+    if cursor_value and not older:
+        return json_response({'error': 'invalid cursor'}, 400)
+
+    cursor = mysql.read_connection.cursor()
+    cursor.execute(*post_list_query(fields, limit, older))
+    rows = cursor.fetchall()
+    cursor.close()
+
+    # 목록은 직렬화 결과 해시를 ETag로 사용 (변경이 없으면 304로 본문 전송 생략)
+    body = post_list_body(rows, fields, limit)
+    return api_etag_response(hashlib.sha1(body).hexdigest(), body)
+
+@app.route('/api/posts/<int:id>')
+@login_required
+@health_check_wrapper
+def api_post(id):
+    """게시글 상세: ?fields= (기본 전체 필드)"""
+    fields = parse_post_fields(request.args.get('fields'), POST_API_FIELDS, POST_DETAIL_DEFAULT_FIELDS)
+    if fields is None:
+        return json_response({'error': f"fields must be a subset of: {', '.join(POST_API_FIELDS)}"}, 400)
+
+    cursor = mysql.read_connection.cursor()
+    # 본문 없이 메타데이터만 먼저 조회해 304면 content를 읽지 않는다
+    cursor.execute(POST_API_META_QUERY, (id,))
+    meta = cursor.fetchone()
+    if not meta:
+        cursor.close()
+        return json_response({'error': 'post not found'}, 404)
+
+    updated_at, author_name = meta
+    etag = post_detail_etag(id, updated_at, author_name, fields)
+    if request.if_none_match.contains_weak(etag):
+        cursor.close()
+        return api_etag_response(etag)
+
+    cursor.execute(post_detail_query(fields), (id,))
+    row = cursor.fetchone()
+    cursor.close()
+    if not row:
+        return json_response({'error': 'post not found'}, 404)
+    return api_etag_response(etag, dumps_json(dict(zip(fields, row))))
+
 @app.route('/api/session-info')
 @login_required
 @health_check_wrapper
@@ -629,37 +2762,251 @@ def session_info_api():
     except Exception as e:
         return jsonify({'error': 'Session info unavailable', 'message': str(e)}), 500
 
+def cloud_status_payload():
+    return build_cloud_status(
+        cloud_provider,
+        standby_ready=cloud_provider.standby_ready(),
+        circuits={name: breaker.get_state() for name, breaker in circuit_breakers.items()},
+        health_leader=health_leader.get_stats()
+    )
+
 @app.route('/api/cloud-status')
 def cloud_status_api():
     """클라우드 제공업체 상태 API"""
     from flask import jsonify
     
+    return jsonify(cloud_status_payload())
+
+# 클라우드 상태 푸시 (SSE) 설정
+app.config['STATUS_STREAM_MAX_CLIENTS'] = int(os.getenv('STATUS_STREAM_MAX_CLIENTS', '500'))  # 워커당 동시 연결 수
+app.config['STATUS_STREAM_KEEPALIVE'] = float(os.getenv('STATUS_STREAM_KEEPALIVE', '20'))  # 프록시 유휴 타임아웃 방지용 주석 전송 주기 (초)
+
+class StatusBroadcaster:
+    """프로바이더 전환 이벤트를 Redis pub/sub으로 모든 워커에 퍼뜨리고 SSE 연결들에 전달
+
+    워커마다 Redis 구독은 하나뿐이고, 대기 중인 SSE 연결의 비용은 큐 하나다.
+    전환한 워커 자신의 연결에는 Redis를 거치지 않고 바로 전달한다(전환 중 재구독으로 놓치지 않도록).
+    """
+
+    CHANNEL = STATUS_CHANNEL
+
+    def __init__(self, redis_proxy, max_clients):
+        self.redis_proxy = redis_proxy
+        self.max_clients = max_clients
+        self.clients = set()
+        self.lock = threading.Lock()
+        self.origin = None
+        self.stats = {'connected': 0, 'rejected': 0, 'published': 0, 'delivered': 0, 'dropped': 0}
+
+    def start(self):
+        self.origin = f'{socket.gethostname()}:{os.getpid()}'
+        threading.Thread(target=redis_subscribe_forever, args=(self.redis_proxy, self.CHANNEL, self._receive),
+                         name='status-subscriber', daemon=True).start()
+
+    def subscribe(self):
+        """연결별 이벤트 큐 (동시 연결 수를 넘으면 None)"""
+        with self.lock:
+            if len(self.clients) >= self.max_clients:
+                self.stats['rejected'] += 1
+                return None
+            events = queue.Queue(maxsize=16)
+            self.clients.add(events)
+            self.stats['connected'] += 1
+        return events
+
+    def unsubscribe(self, events):
+        with self.lock:
+            self.clients.discard(events)
+
+    def publish(self, event, data):
+        self._deliver(sse_message(event, data))
+        try:
+            self.redis_proxy.client.publish(self.CHANNEL, json.dumps({'origin': self.origin, 'event': event, 'data': data}))
+            self.stats['published'] += 1
+        except Exception as e:
+            logger.warning(f"Status event publish failed: {e}")
+
+    def _receive(self, message):
+        if message.get('origin') != self.origin:
+            self._deliver(sse_message(message['event'], message['data']))
+
+    def _deliver(self, message):
+        with self.lock:
+            clients = list(self.clients)
+        for events in clients:
+            try:
+                events.put_nowait(message)
+                self.stats['delivered'] += 1
+            except queue.Full:
+                self.stats['dropped'] += 1  # 읽지 않는 연결은 건너뜀
+
+    def get_stats(self):
+        return dict(self.stats, clients=len(self.clients), max_clients=self.max_clients, pid=os.getpid())
+
+status_broadcaster = StatusBroadcaster(app.config['SESSION_REDIS'], app.config['STATUS_STREAM_MAX_CLIENTS'])
+
+def announce_switch(last_switch):
+    """전환을 결정한 프로세스만 'switch' 이벤트 발행 (따라 전환한 워커는 이미 받은 알림을 중복 발행하지 않음)"""
+    if not last_switch['followed']:
+        status_broadcaster.publish('switch', cloud_status_payload())
+
+cloud_provider.switch_listeners.append(announce_switch)
+
+@app.route('/api/cloud-status/stream')
+def cloud_status_stream():
+    """클라우드 상태 SSE: 연결 즉시 현재 상태, 이후 프로바이더 전환 시 바로 전송 (폴링 대체)"""
+    events = status_broadcaster.subscribe()
+    if events is None:
+        response = json_response({'error': 'Too many status streams'}, 503)
+        response.headers['Retry-After'] = '30'
+        return response
+    initial = 'retry: 5000\n' + sse_message('status', cloud_status_payload())
+    keepalive = app.config['STATUS_STREAM_KEEPALIVE']
+
+    def generate():
+        try:
+            yield initial
+            while True:
+                try:
+                    yield events.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+        finally:
+            status_broadcaster.unsubscribe(events)
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Accel-Buffering'] = 'no'  # nginx 등 프록시 버퍼링 비활성화
+    return response
+
+@app.route('/api/status-stream-stats')
+def status_stream_stats_api():
+    """클라우드 상태 SSE 연결 통계 API (워커 프로세스별)"""
+    from flask import jsonify
+
+    return jsonify(status_broadcaster.get_stats())
+
+@app.route('/api/cache-stats')
+def cache_stats_api():
+    """게시판/사용자 캐시, 세션 저장 통계 API (워커 프로세스별)"""
+    from flask import jsonify
+
     return jsonify({
-        'current_provider': cloud_provider.current_provider,
-        'gcp_available': cloud_provider.gcp_available,
-        'aws_available': cloud_provider.aws_available,
-        'last_health_check': cloud_provider.last_health_check,
-        'timestamp': time.time()
+        'board': board_cache.get_stats(),
+        'users': user_cache.get_stats(),
+        'sessions': app.session_interface.get_stats() if app.config['SESSION_COMPACT'] else None,
+        'pid': os.getpid()
     })
 
+@app.route('/api/compression-stats')
+def compression_stats_api():
+    """응답 압축 통계 API: 인코딩별 압축률, CPU 시간 (워커 프로세스별)"""
+    from flask import jsonify
+
+    return jsonify({
+        'dynamic': compression_stats.get_stats(),
+        'assets': {
+            logical: {'identity': os.path.getsize(os.path.join(app.static_folder, logical)),
+                      **{encoding: len(data) for encoding, data in encoded.items()}}
+            for logical, encoded in asset_variants.items()
+        },
+        'brotli_available': brotli is not None,
+        'pid': os.getpid()
+    })
+
+@app.route('/api/password-hash-stats')
+def password_hash_stats_api():
+    """비밀번호 해시 풀 통계 API (워커 프로세스별)"""
+    from flask import jsonify
+
+    return jsonify(dict(password_hasher.get_stats(), pid=os.getpid()))
+
+@app.route('/api/db-pool-stats')
+def db_pool_stats_api():
+    """MySQL 커넥션 풀 통계 API (워커 프로세스별)"""
+    from flask import jsonify
+
+    replicas = mysql.replicas
+    return jsonify(dict(mysql.pool.get_stats(), pid=os.getpid(),
+                        replicas=replicas.get_stats() if replicas is not None else None))
+
+# 로드밸런서/오리진 프로브용 엔드포인트: 백그라운드 모니터의 스냅샷만 읽고 요청마다 DB/Redis I/O를 하지 않는다
+def probe_response(data, status):
+    response = json_response(data, status)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+@app.route('/livez')
+def livez():
+    """liveness: 프로세스와 헬스 모니터 스레드가 살아 있는지 (백엔드 장애와 무관, 재시작 판단용)"""
+    if not health_monitor.is_alive():
+        return probe_response({'status': 'dead', 'reason': 'health monitor stopped', 'pid': os.getpid()}, 503)
+    return probe_response({'status': 'alive', 'pid': os.getpid()}, 200)
+
+@app.route('/readyz')
+def readyz():
+    """readiness: 마지막 점검의 의존성별 상태와 지연 (트래픽 수신 여부 판단용)"""
+    snapshot = health_monitor.snapshot
+    ready = health_monitor.is_ready(snapshot, app.config['HEALTH_SNAPSHOT_MAX_AGE'])
+    return probe_response({
+        'status': 'ready' if ready else 'not_ready',
+        'provider': snapshot.provider,
+        'checks': snapshot.checks,
+        'checked_at': snapshot.checked_at,
+        'age_s': round(time.time() - snapshot.checked_at, 3),
+        'pid': os.getpid()
+    }, 200 if ready else 503)
+
 @app.route('/healthz')
 def health_check():
-    """헬스체크 엔드포인트"""
-    try:
-        # 데이터베이스 연결 확인
-        cursor = mysql.connection.cursor()
-        cursor.execute("SELECT 1")
-        cursor.close()
-        
-        status = {
-            'status': 'healthy',
-            'provider': cloud_provider.current_provider,
-            'timestamp': time.time()
-        }
-        return status, 200
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {'status': 'unhealthy', 'error': str(e)}, 503
+    """헬스체크 엔드포인트 (readiness와 같은 스냅샷 기준, timestamp는 마지막 점검 시각)"""
+    snapshot = health_monitor.snapshot
+    ready = health_monitor.is_ready(snapshot, app.config['HEALTH_SNAPSHOT_MAX_AGE'])
+    status = {
+        'status': 'healthy' if ready else 'unhealthy',
+        'provider': snapshot.provider,
+        'checks': snapshot.checks,
+        'timestamp': snapshot.checked_at
+    }
+    return status, 200 if ready else 503
+
+# 요청 계측 (/metrics 자체는 제외)
+@app.before_request
+def start_request_metrics():
+    if request.endpoint == 'metrics':
+        return
+    g._metrics_started = time.perf_counter()
+    g._metrics_endpoint = request.endpoint or 'unknown'
+    REQUESTS_IN_FLIGHT.labels(g._metrics_endpoint).inc()
+
+@app.after_request
+def record_response_status(response):
+    g._metrics_status = response.status_code
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exception):
+    started = g.pop('_metrics_started', None)
+    if started is None:
+        return
+    endpoint = g._metrics_endpoint
+    # 처리되지 않은 예외로 after_request가 호출되지 않으면 500으로 기록
+    status = g.pop('_metrics_status', 500)
+    REQUEST_LATENCY.labels(endpoint, request.method, str(status)).observe(time.perf_counter() - started)
+    REQUESTS_IN_FLIGHT.labels(endpoint).dec()
+    DB_QUERIES_PER_REQUEST.labels(endpoint).observe(g.pop('_metrics_db_queries', 0))
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus 텍스트 형식 메트릭 (멀티 프로세스 모드에서는 모든 워커 합산)"""
+    if prometheus_client is None:
+        return 'prometheus_client not installed\n', 503, {'Content-Type': 'text/plain; charset=utf-8'}
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = prometheus_client.CollectorRegistry()
+        prometheus_multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), 200, {'Content-Type': prometheus_client.CONTENT_TYPE_LATEST}
 
 # 정기적인 헬스체크를 위한 백그라운드 스레드
 def background_health_check():
@@ -667,13 +3014,52 @@ def background_health_check():
     while True:
         try:
             time.sleep(60)  # 60초마다 체크 (부하 감소)
-            cloud_provider.get_active_config()
+            # 시크릿 조회와 새 연결 테스트는 헬스 리더만 수행 (다른 워커는 공유된 스냅샷으로 따라 전환)
+            if not health_leader.is_leader:
+                continue
+            new_config = cloud_provider.get_active_config()
+            # 선택된 프로바이더가 실제 사용 중인 것과 다르면 전환
+            if new_config['provider'] != cloud_provider.active.config['provider']:
+                cloud_provider.switch_provider(app, mysql, new_config)
         except Exception as e:
             logger.error(f"Background health check failed: {e}")
 
-# 백그라운드 헬스체크 스레드 시작
-health_thread = threading.Thread(target=background_health_check, daemon=True)
-health_thread.start()
+def replica_lag_monitor():
+    """활성 레플리카의 복제 지연을 주기적으로 측정 (읽기 라우팅 대상 갱신)"""
+    while True:
+        time.sleep(app.config['REPLICA_CHECK_INTERVAL'])
+        replicas = mysql.replicas
+        if replicas is None:
+            continue
+        try:
+            replicas.check()
+        except Exception as e:
+            logger.error(f"Replica lag check failed: {e}")
+
+def start_worker():
+    """워커 프로세스 시작 작업: (미뤘다면) 풀 워밍업과 레플리카 지연 측정, 백그라운드 스레드 시작
+
+    DEFER_STARTUP이면 pre-fork 서버가 fork 이후 워커마다 호출한다 (스레드와 연결은 fork로 복제되면 안 됨).
+    """
+    if DEFER_STARTUP:
+        # master에서 만든 시크릿 API 클라이언트(gRPC 채널 등)는 fork 후 재사용하지 않는다
+        cloud_provider.secret_clients.clear()
+        mysql.pool.warmup()
+        if mysql.replicas is not None:
+            mysql.replicas.check()
+    # 해시 프로세스 풀은 다른 스레드가 모두 끝났거나 시작되기 전에 fork한다
+    cloud_provider.join_bootstrap_checks()
+    password_hasher.start()
+    cloud_provider.start_secret_refresh()
+    threading.Thread(target=background_health_check, name='provider-check', daemon=True).start()
+    threading.Thread(target=replica_lag_monitor, name='replica-lag-monitor', daemon=True).start()
+    health_monitor.start()
+    status_broadcaster.start()
+    logger.info(f"Worker {os.getpid()} started with {cloud_provider.current_provider} configuration")
+
+# 백그라운드 헬스체크 스레드 시작 (DEFER_STARTUP이면 서버의 post-fork 훅에서 시작)
+if not DEFER_STARTUP:
+    start_worker()
 
 # 애플리케이션 에러 핸들러
 @app.errorhandler(404)
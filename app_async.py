@@ -0,0 +1,1457 @@
+"""ASGI 버전 게시판 애플리케이션 (Quart + aiomysql + redis.asyncio)
+
+app.py와 같은 라우트, 템플릿, Redis 세션 형식을 async로 구현한다. 요청이 MySQL/Redis/시크릿 API를
+기다리는 동안 워커 스레드를 점유하지 않으므로, 이벤트 루프 하나가 느린 클라이언트와 SSE 연결을
+수천 개까지 처리한다 (동시 쿼리 수는 MYSQL_POOL_MAX로 제한되고 나머지 요청은 연결을 async로 기다린다).
+
+- 실행: python serve.py --mode asgi (gunicorn + UvicornWorker), 개발용은 python app_async.py
+- 패키지: requirements_async.txt (Quart 0.18은 Flask 2.3과 blinker 버전이 충돌하므로 별도 가상환경, Python 3.9+)
+- 세션 직렬화, 게시판 커서/캐시 키, ETag, 상태 이벤트 형식은 app.py와 함께 board_common에서 가져오므로
+  배포 중 두 버전을 섞어 쓸 수 있다. 이 파일에는 async I/O(aiomysql, redis.asyncio, 시크릿 API)만 둔다.
+- 읽기 레플리카, 웜 스탠바이, 헬스 리더 선출, 응답 압축, /metrics는 app.py에만 있다.
+"""
+from quart import Quart, request, render_template, redirect, url_for, flash, session, make_response, g, Response, abort, send_from_directory, jsonify
+from quart.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+from werkzeug.security import generate_password_hash, check_password_hash
+from itsdangerous import Signer, BadSignature
+import aiomysql
+import redis.asyncio as aioredis
+import asyncio
+import socket
+import json
+import hashlib
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from functools import wraps
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from board_common import (
+    config_from_gcp_secret, config_from_aws_secret, load_local_config,
+    probe_ec2_metadata, probe_gcp_metadata, hostname_suggests_aws, build_cloud_status, STATUS_CHANNEL, sse_message,
+    CompactSessionSerializer, session_identifier, password_hash_prefix, BoardPage, decode_board_cursor, clamp_page_size,
+    newer_board_page_query, older_board_page_query, newer_board_page, older_board_page,
+    BOARD_CACHE_VERSION_KEY, board_cache_key, serialize_board_page, deserialize_board_page,
+    POST_META_QUERY, POST_VIEW_QUERY, template_fingerprint, make_post_etag, is_not_modified,
+    set_private_etag, set_post_cache_headers, dumps_json, POST_API_FIELDS, POST_LIST_FIELDS,
+    POST_LIST_DEFAULT_FIELDS, POST_DETAIL_DEFAULT_FIELDS, POST_API_META_QUERY, parse_post_fields,
+    post_list_query, post_list_body, post_detail_query, post_detail_etag,
+    ASSET_MAX_AGE, build_asset_manifest, manifest_fingerprint, unhashed_asset_path
+)
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 환경 변수로 우선순위 결정 (GCP: primary, AWS: secondary)
+PREFERRED_CLOUD = os.getenv('PREFERRED_CLOUD', 'GCP')  # GCP, AWS 또는 LOCAL
+
+# LOCAL 프로바이더 설정 파일 (JSON, GCP 시크릿과 같은 키). 없으면 환경 변수 사용
+LOCAL_CONFIG_FILE = os.getenv('LOCAL_CONFIG_FILE')
+
+# 프로바이더 점검 전체 제한 시간 (초), 메타데이터 감지 제한 시간 (초)
+BOOTSTRAP_TIMEOUT = float(os.getenv('BOOTSTRAP_TIMEOUT', '8'))
+METADATA_PROBE_TIMEOUT = float(os.getenv('METADATA_PROBE_TIMEOUT', '2'))
+
+# 시크릿 캐시 TTL (초)
+SECRET_CACHE_TTL = int(os.getenv('SECRET_CACHE_TTL', '300'))
+
+class AsyncCloudProvider:
+    """클라우드 제공업체별 설정 관리 (시크릿 조회, 연결 테스트, 환경 감지를 이벤트 루프에서 동시에 수행)"""
+
+    def __init__(self):
+        # LOCAL 모드에서는 클라우드 시크릿/메타데이터를 전혀 사용하지 않는다
+        self.gcp_available = PREFERRED_CLOUD != 'LOCAL'
+        self.aws_available = PREFERRED_CLOUD != 'LOCAL'
+        self.current_provider = PREFERRED_CLOUD
+        self.last_health_check = time.time()
+        self.current_config = None
+        self.last_check_timings = {}
+        # 프로바이더별 시크릿 캐시: {'config', 'fetched_at'}
+        self.secret_cache = {}
+        self.secret_clients = {}
+        # asyncio 락은 이벤트 루프 안에서 처음 사용할 때 만든다 (워커의 루프에 묶이도록)
+        self.secret_locks = {}
+        self.switch_lock = None
+        # 프로바이더 전환 후 호출: listener(last_switch)
+        self.switch_listeners = []
+        self.active = None
+        self.last_switch = None
+
+    def _secret_client(self, provider):
+        """시크릿 API 클라이언트 재사용 (GCP는 async gRPC 클라이언트, AWS는 boto3)"""
+        client = self.secret_clients.get(provider)
+        if client is None:
+            # import를 함수 안에서 수행하여 다른 클라우드 환경에서 오류 방지
+            if provider == 'GCP':
+                from google.cloud import secretmanager
+                client = secretmanager.SecretManagerServiceAsyncClient()
+            else:
+                import boto3
+                session_aws = boto3.session.Session()
+                client = session_aws.client('secretsmanager', region_name="us-east-2")
+            self.secret_clients[provider] = client
+        return client
+
+    async def _fetch_gcp_secret(self):
+        """GCP Secret Manager에서 최신 시크릿 조회"""
+        client = self._secret_client('GCP')
+        name = client.secret_version_path("hifrodo-05", "project-secrets", "latest")
+        response = await client.access_secret_version(request={"name": name})
+        return config_from_gcp_secret(json.loads(response.payload.data.decode("UTF-8")))
+
+    async def _fetch_aws_secret(self):
+        """AWS Secrets Manager에서 최신 시크릿 조회 (boto3는 async API가 없어 스레드에서 호출)"""
+        client = self._secret_client('AWS')
+        response = await asyncio.to_thread(client.get_secret_value, SecretId='flask/app')
+        return config_from_aws_secret(json.loads(response['SecretString']))
+
+    def get_local_config(self):
+        """로컬 MySQL/Redis 설정 (LOCAL_CONFIG_FILE 또는 환경 변수)"""
+        return load_local_config(LOCAL_CONFIG_FILE)
+
+    async def get_config(self, provider):
+        """프로바이더 설정 로드 (시크릿은 TTL 동안 캐시, 동시에 들어온 조회는 API 호출 하나를 공유)"""
+        if provider == 'LOCAL':
+            return self.get_local_config()
+        entry = self.secret_cache.get(provider)
+        if entry and time.time() - entry['fetched_at'] < SECRET_CACHE_TTL:
+            return entry['config']
+        lock = self.secret_locks.setdefault(provider, asyncio.Lock())
+        async with lock:
+            entry = self.secret_cache.get(provider)
+            if entry and time.time() - entry['fetched_at'] < SECRET_CACHE_TTL:
+                return entry['config']
+            try:
+                fetch = self._fetch_gcp_secret if provider == 'GCP' else self._fetch_aws_secret
+                config = await fetch()
+            except Exception as e:
+                logger.error(f"{provider} config load failed: {e}")
+                # 시크릿 API 장애 중에는 만료된 캐시라도 사용
+                return entry['config'] if entry else None
+            self.secret_cache[provider] = {'config': config, 'fetched_at': time.time()}
+            return config
+
+    async def test_database_connection(self, config):
+        """데이터베이스 연결 테스트"""
+        if not config:
+            return False
+        try:
+            connection = await aiomysql.connect(
+                host=config['mysql_host'],
+                user=config['mysql_user'],
+                password=config['mysql_password'],
+                db=config['mysql_db'],
+                port=config.get('mysql_port', 3306),
+                connect_timeout=5
+            )
+            connection.close()
+            return True
+        except Exception as e:
+            logger.error(f"Database connection test failed for {config['provider']}: {e}")
+            return False
+
+    def create_redis_client(self, config, **options):
+        """프로바이더별 Redis 클라이언트 생성 (GCP/LOCAL은 SSL 없이, AWS는 SSL 사용)"""
+        if config['provider'] == 'LOCAL':
+            if config['redis_host'] == 'embedded':
+                # 외부 Redis 없이 실행 (벤치마크/오프라인 개발용)
+                import fakeredis
+                return fakeredis.aioredis.FakeRedis(server=self._embedded_redis_server())
+            return aioredis.Redis(host=config['redis_host'], port=config.get('redis_port', 6379), **options)
+        if config['provider'] == 'GCP':
+            return aioredis.Redis(host=config['redis_host'], port=6379, **options)
+        return aioredis.Redis(
+            host=config['redis_host'],
+            port=6379,
+            ssl=True,
+            ssl_cert_reqs=None,
+            **options
+        )
+
+    def _embedded_redis_server(self):
+        if getattr(self, 'embedded_redis_server', None) is None:
+            import fakeredis
+            self.embedded_redis_server = fakeredis.FakeServer()
+        return self.embedded_redis_server
+
+    async def test_redis_connection(self, config):
+        """Redis 연결 테스트"""
+        if not config:
+            return False
+        client = self.create_redis_client(config, socket_connect_timeout=5)
+        try:
+            await client.ping()
+            return True
+        except Exception as e:
+            logger.error(f"Redis connection test failed for {config['provider']}: {e}")
+            return False
+        finally:
+            await client.aclose()
+
+    async def _timed(self, timings, name, coro):
+        """coro 실행 시간을 timings[name]에 ms 단위로 기록"""
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[name] = (time.perf_counter() - started) * 1000
+
+    async def _check_provider(self, provider, timings):
+        """설정 로드 후 DB/Redis 연결을 동시에 테스트 -> 정상이면 config, 아니면 None"""
+        config = await self._timed(timings, f'{provider}.secret', self.get_config(provider))
+        if not config:
+            return None
+        db_ok, redis_ok = await asyncio.gather(
+            self._timed(timings, f'{provider}.mysql', self.test_database_connection(config)),
+            self._timed(timings, f'{provider}.redis', self.test_redis_connection(config))
+        )
+        return config if db_ok and redis_ok else None
+
+    async def get_active_config(self):
+        """활성 설정 반환 (AWS 환경에서는 AWS 우선)
+
+        환경 감지와 프로바이더별 점검을 동시에 수행하며 BOOTSTRAP_TIMEOUT 안에 끝낸다.
+        """
+        started = time.perf_counter()
+        timings = {}
+        try:
+            return await asyncio.wait_for(self._select_active_config(timings), BOOTSTRAP_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise Exception(f"Provider check timed out (BOOTSTRAP_TIMEOUT={BOOTSTRAP_TIMEOUT}s)")
+        finally:
+            timings['total'] = (time.perf_counter() - started) * 1000
+            self.last_check_timings = timings
+            logger.info("Provider check timings: " + ", ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items()))
+
+    def _use(self, config):
+        self.current_provider = config['provider']
+        self.current_config = config
+        return config
+
+    async def _select_active_config(self, timings):
+        if PREFERRED_CLOUD == 'LOCAL':
+            # 로컬 모드: 메타데이터 감지와 클라우드 폴백 없이 로컬 설정만 점검
+            local_config = await self._check_provider('LOCAL', timings)
+            if not local_config:
+                raise Exception("LOCAL configuration unavailable (check MYSQL_*/REDIS_* or LOCAL_CONFIG_FILE)")
+            logger.info("Using LOCAL configuration")
+            return self._use(local_config)
+
+        checks = {}
+
+        def start_check(provider):
+            if provider not in checks:
+                checks[provider] = asyncio.ensure_future(self._check_provider(provider, timings))
+            return checks[provider]
+
+        try:
+            # 콜드 스타트에서는 환경 감지와 동시에 두 프로바이더 점검을 시작한다
+            if self.current_config is None:
+                if PREFERRED_CLOUD == 'GCP' and self.gcp_available:
+                    start_check('GCP')
+                if self.aws_available:
+                    start_check('AWS')
+
+            running_on_aws = await self._timed(timings, 'detect', self._detect_aws_environment())
+
+            if running_on_aws:
+                logger.info("Detected AWS environment, prioritizing AWS configuration")
+                if self.aws_available:
+                    aws_config = await start_check('AWS')
+                    if aws_config:
+                        self.gcp_available = False  # GCP를 standby 상태로 설정
+                        logger.info("Using AWS configuration")
+                        return self._use(aws_config)
+                    logger.error("AWS configuration failed")
+                    self.aws_available = False
+                raise Exception("AWS configuration unavailable in AWS environment")
+
+            logger.info("Detected GCP environment, prioritizing GCP configuration")
+            if PREFERRED_CLOUD == 'GCP' and self.gcp_available or 'GCP' in checks:
+                gcp_config = await start_check('GCP')
+                if gcp_config:
+                    self.aws_available = True  # 대기 상태로 표시
+                    logger.info("Using GCP configuration")
+                    return self._use(gcp_config)
+                logger.warning("GCP health check failed, falling back to AWS")
+                self.gcp_available = False
+
+            if self.aws_available or 'AWS' in checks:
+                aws_config = await start_check('AWS')
+                if aws_config:
+                    logger.info("Using AWS configuration (FAILOVER)")
+                    return self._use(aws_config)
+                logger.error("AWS health check also failed")
+                self.aws_available = False
+
+            raise Exception("Both GCP and AWS are unavailable")
+        finally:
+            # 선택에 쓰이지 않은 점검은 기다리지 않는다
+            for task in checks.values():
+                task.cancel()
+
+    async def _detect_aws_environment(self):
+        """AWS 환경에서 실행 중인지 감지 (메타데이터 조회는 시작/전환 시에만 하므로 스레드에서 수행)"""
+        if os.getenv('AWS_EXECUTION_ENV') or os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+            return True
+
+        # EC2 / GCP 메타데이터를 동시에 확인하고 먼저 확인된 쪽을 사용
+        ec2_task = asyncio.ensure_future(asyncio.to_thread(probe_ec2_metadata, METADATA_PROBE_TIMEOUT))
+        gcp_task = asyncio.ensure_future(asyncio.to_thread(probe_gcp_metadata, METADATA_PROBE_TIMEOUT))
+        pending = {ec2_task, gcp_task}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + METADATA_PROBE_TIMEOUT + 0.5
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=max(0, deadline - loop.time()),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            if ec2_task in done and ec2_task.result():
+                return True
+            if gcp_task in done and gcp_task.result():
+                return False
+
+        # 호스트명으로 판단 (최후 수단), 기본값은 GCP (기존 동작 유지)
+        return hostname_suggests_aws()
+
+    async def build_backends(self, config):
+        """설정으로 aiomysql 풀(MYSQL_POOL_MIN개 미리 연결)과 Redis 클라이언트를 만든다"""
+        pool = await aiomysql.create_pool(
+            host=config['mysql_host'],
+            user=config['mysql_user'],
+            password=config['mysql_password'],
+            db=config['mysql_db'],
+            port=config.get('mysql_port', 3306),
+            charset='utf8mb4',
+            connect_timeout=5,
+            # 트랜잭션 스냅샷이 풀에 남아 오래된 데이터를 읽지 않도록 autocommit 사용
+            autocommit=True,
+            minsize=MYSQL_POOL_MIN,
+            maxsize=MYSQL_POOL_MAX,
+            pool_recycle=MYSQL_POOL_RECYCLE
+        )
+        return Backends(config, pool, self.create_redis_client(config, socket_connect_timeout=5))
+
+    async def switch_provider(self, new_config=None):
+        """프로바이더 전환 (새 연결을 먼저 만든 뒤 교체, 동시에 한 번만 수행)
+
+        new_config가 없으면 현재 프로바이더 장애로 보고 get_active_config로 다시 선택한다.
+        """
+        if self.switch_lock is None:
+            self.switch_lock = asyncio.Lock()
+        if self.switch_lock.locked():
+            logger.info("Provider switch already in progress")
+            return False
+        async with self.switch_lock:
+            previous = self.active
+            started = time.perf_counter()
+            try:
+                if new_config is None:
+                    new_config = await self.get_active_config()
+                if not new_config or new_config['provider'] == previous.config['provider']:
+                    # get_active_config가 바꾼 선택 값을 실제 사용 중인 설정으로 되돌림
+                    self._use(previous.config)
+                    return False
+                backends = await self.build_backends(new_config)
+            except Exception as e:
+                logger.error(f"Provider switch failed: {e}")
+                self._use(previous.config)
+                return False
+
+            self.active = backends
+            self._use(backends.config)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.last_switch = {
+                'from': previous.config['provider'],
+                'to': backends.config['provider'],
+                'warm_standby': False,
+                'duration_ms': round(elapsed_ms, 3),
+                'timestamp': time.time()
+            }
+            logger.info(f"Switched from {previous.config['provider']} to {backends.config['provider']} in {elapsed_ms:.2f}ms")
+            for listener in self.switch_listeners:
+                try:
+                    listener(self.last_switch)
+                except Exception as e:
+                    logger.error(f"Provider switch listener failed: {e}")
+            # 이전 풀은 진행 중인 요청이 연결을 반납한 뒤 닫힌다
+            await previous.close()
+            return True
+
+class Backends:
+    """프로바이더 하나의 연결 묶음 (설정, aiomysql 풀, Redis 클라이언트)"""
+
+    def __init__(self, config, pool, redis_client):
+        self.config = config
+        self.pool = pool
+        self.redis = redis_client
+
+    async def close(self):
+        self.pool.close()
+        await self.pool.wait_closed()
+        await self.redis.aclose()
+
+# MySQL 커넥션 풀 설정 (워커 프로세스별, 이 수를 넘는 동시 쿼리는 연결 반납을 async로 기다림)
+MYSQL_POOL_MIN = int(os.getenv('MYSQL_POOL_MIN', '2'))
+MYSQL_POOL_MAX = int(os.getenv('MYSQL_POOL_MAX', '10'))
+MYSQL_POOL_TIMEOUT = float(os.getenv('MYSQL_POOL_TIMEOUT', '5'))  # 연결 대기 최대 시간 (초)
+MYSQL_POOL_RECYCLE = int(os.getenv('MYSQL_POOL_RECYCLE', '1800'))  # 연결 최대 수명 (초)
+
+# 전역 클라우드 프로바이더 인스턴스 (연결은 워커의 이벤트 루프가 시작될 때 만든다)
+cloud_provider = AsyncCloudProvider()
+
+# Quart 앱 설정
+app = Quart(__name__)
+app.config['SESSION_KEY_PREFIX'] = 'session:'
+# 변경이 없어도 이 시간(초)이 지나면 다시 저장해 Redis TTL을 연장
+app.config['SESSION_REFRESH_INTERVAL'] = int(os.getenv('SESSION_REFRESH_INTERVAL', '3600'))
+# 게시판 페이지 크기 (per_page 파라미터 허용 범위)
+app.config['BOARD_PAGE_SIZE'] = int(os.getenv('BOARD_PAGE_SIZE', '20'))
+app.config['BOARD_MAX_PAGE_SIZE'] = int(os.getenv('BOARD_MAX_PAGE_SIZE', '100'))
+app.config['BOARD_CACHE_ENABLED'] = os.getenv('BOARD_CACHE_ENABLED', 'true').lower() == 'true'
+app.config['BOARD_CACHE_TTL'] = int(os.getenv('BOARD_CACHE_TTL', '60'))
+app.config['USER_CACHE_TTL'] = int(os.getenv('USER_CACHE_TTL', '300'))
+app.config['USER_CACHE_SIZE'] = int(os.getenv('USER_CACHE_SIZE', '10000'))
+app.config['PASSWORD_HASH_METHOD'] = os.getenv('PASSWORD_HASH_METHOD', 'scrypt')
+app.config['PASSWORD_HASH_WORKERS'] = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+app.config['PASSWORD_HASH_QUEUE'] = int(os.getenv('PASSWORD_HASH_QUEUE', '8'))
+app.config['PASSWORD_HASH_TIMEOUT'] = float(os.getenv('PASSWORD_HASH_TIMEOUT', '5'))
+app.config['HEALTH_CHECK_INTERVAL'] = int(os.getenv('HEALTH_CHECK_INTERVAL', '30'))
+app.config['HEALTH_SNAPSHOT_MAX_AGE'] = float(os.getenv(
+    'HEALTH_SNAPSHOT_MAX_AGE', str(app.config['HEALTH_CHECK_INTERVAL'] * 3)))
+app.config['STATUS_STREAM_MAX_CLIENTS'] = int(os.getenv('STATUS_STREAM_MAX_CLIENTS', '5000'))  # 워커당 동시 연결 수
+app.config['STATUS_STREAM_KEEPALIVE'] = float(os.getenv('STATUS_STREAM_KEEPALIVE', '20'))
+
+class RedisSession(CallbackDict, SessionMixin):
+    """Redis에 저장되는 서버 측 세션 (sid는 서명된 쿠키 값)"""
+
+    def __init__(self, initial=None, sid=None, stored_value=None, written_at=0):
+        def on_update(self):
+            self.modified = True
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.stored_value = stored_value
+        self.written_at = written_at
+        self.modified = False
+
+class AsyncRedisSessionInterface(SessionInterface):
+    """app.py(Flask-Session + CompactRedisSessionInterface)와 같은 키, 직렬화, 쿠키 서명을 쓰는 async 세션
+
+    WSGI/ASGI 버전이 함께 배포되어 있어도 로그인 세션이 유지된다.
+    쿠키가 없으면 Redis를 읽지 않고, 바뀌지 않은 세션은 refresh_interval 전까지 다시 쓰지 않는다.
+    """
+
+    def __init__(self, provider, key_prefix, refresh_interval):
+        self.provider = provider
+        self.key_prefix = key_prefix
+        self.refresh_interval = refresh_interval
+        self.serializer = CompactSessionSerializer()
+        self.stats = {'reads': 0, 'misses': 0, 'writes': 0, 'skipped_writes': 0, 'deletes': 0}
+
+    def _signer(self, app_instance):
+        # Flask-Session(use_signer)과 같은 salt/키 유도 방식
+        return Signer(app_instance.secret_key, salt='flask-session', key_derivation='hmac')
+
+    def _new_session(self):
+        return RedisSession(sid=str(uuid.uuid4()))
+
+    async def open_session(self, app_instance, request_obj):
+        cookie = request_obj.cookies.get(self.get_cookie_name(app_instance))
+        if not cookie:
+            return self._new_session()
+        try:
+            sid = self._signer(app_instance).unsign(cookie).decode()
+        except BadSignature:
+            return self._new_session()
+
+        self.stats['reads'] += 1
+        value = await self.provider.active.redis.get(self.key_prefix + sid)
+        if value is not None:
+            try:
+                data, written_at = self.serializer.loads(value)
+                return RedisSession(data, sid=sid, stored_value=value, written_at=written_at)
+            except Exception as e:
+                logger.warning(f"Session decode failed, starting new session: {e}")
+        self.stats['misses'] += 1
+        return RedisSession(sid=sid)
+
+    async def save_session(self, app_instance, session_obj, response):
+        cookie_name = self.get_cookie_name(app_instance)
+        domain = self.get_cookie_domain(app_instance)
+        path = self.get_cookie_path(app_instance)
+        redis_client = self.provider.active.redis
+        if not session_obj:
+            # 저장된 적 있는 세션이 비워진 경우에만 삭제 (새 빈 세션은 아무것도 하지 않음)
+            if session_obj.stored_value is not None or session_obj.modified:
+                await redis_client.delete(self.key_prefix + session_obj.sid)
+                self.stats['deletes'] += 1
+                response.delete_cookie(cookie_name, domain=domain, path=path)
+            return
+
+        now = int(time.time())
+        if session_obj.stored_value is not None and now - session_obj.written_at < self.refresh_interval:
+            if self.serializer.dumps(dict(session_obj), session_obj.written_at) == session_obj.stored_value:
+                self.stats['skipped_writes'] += 1
+                return
+
+        value = self.serializer.dumps(dict(session_obj), now)
+        await redis_client.setex(self.key_prefix + session_obj.sid,
+                                 int(app_instance.permanent_session_lifetime.total_seconds()), value)
+        self.stats['writes'] += 1
+        if session_obj.stored_value is not None and not self.should_set_cookie(app_instance, session_obj):
+            return
+
+        response.set_cookie(
+            cookie_name, self._signer(app_instance).sign(session_obj.sid.encode()).decode(),
+            expires=self.get_expiration_time(app_instance, session_obj),
+            httponly=self.get_cookie_httponly(app_instance),
+            domain=domain, path=path,
+            secure=self.get_cookie_secure(app_instance),
+            samesite=self.get_cookie_samesite(app_instance)
+        )
+
+    def get_stats(self):
+        return dict(self.stats, serializer=self.serializer.name, refresh_interval=self.refresh_interval)
+
+app.session_interface = AsyncRedisSessionInterface(
+    cloud_provider, app.config['SESSION_KEY_PREFIX'], app.config['SESSION_REFRESH_INTERVAL'])
+
+class DatabaseUnavailable(Exception):
+    """제한 시간(MYSQL_POOL_TIMEOUT) 안에 풀에서 연결을 받지 못함"""
+
+class db_cursor:
+    """활성 풀에서 연결을 빌려 커서 제공: async with db_cursor() as cursor"""
+
+    async def __aenter__(self):
+        self.pool = cloud_provider.active.pool
+        try:
+            self.conn = await asyncio.wait_for(self.pool.acquire(), MYSQL_POOL_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise DatabaseUnavailable(f"No MySQL connection available within {MYSQL_POOL_TIMEOUT}s")
+        self.cursor = await self.conn.cursor()
+        return self.cursor
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cursor.close()
+        self.pool.release(self.conn)
+
+# 사용자 (Flask-Login과 같은 세션 키: _user_id, _fresh, _id)
+class User:
+    is_authenticated = True
+
+    def __init__(self, id, username):
+        self.id = id
+        self.username = username
+
+class AnonymousUser:
+    is_authenticated = False
+    id = None
+    username = None
+
+class UserCache:
+    """user_id -> username 프로세스 내 캐시 (TTL, 최대 크기 제한)"""
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, user_id):
+        entry = self.entries.get(user_id)
+        if entry is None or entry[1] < time.monotonic():
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return entry[0]
+
+    def set(self, user_id, username):
+        self.entries[user_id] = (username, time.monotonic() + self.ttl)
+        self.entries.move_to_end(user_id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def get_stats(self):
+        return dict(self.stats, size=len(self.entries), ttl=self.ttl)
+
+user_cache = UserCache(app.config['USER_CACHE_TTL'], app.config['USER_CACHE_SIZE'])
+
+async def load_user(user_id):
+    username = user_cache.get(user_id)
+    if username is not None:
+        return User(id=int(user_id), username=username)
+    try:
+        async with db_cursor() as cursor:
+            await cursor.execute("SELECT id, username FROM users WHERE id = %s", (user_id,))
+            user = await cursor.fetchone()
+        if user:
+            user_cache.set(user_id, user[1])
+            return User(id=user[0], username=user[1])
+        return None
+    except Exception as e:
+        logger.error(f"User load failed: {e}")
+        return None
+
+def create_identifier():
+    """Flask-Login의 세션 식별자(_id)와 같은 값 (형식은 board_common.session_identifier)"""
+    return session_identifier(request.headers, request.remote_addr)
+
+def login_user(user):
+    session['_user_id'] = str(user.id)
+    session['_fresh'] = True
+    session['_id'] = create_identifier()
+    g.user = user
+
+def logout_user():
+    for key in ('_user_id', '_fresh', '_id', '_remember_seconds'):
+        session.pop(key, None)
+    g.user = AnonymousUser()
+
+@app.before_request
+async def load_current_user():
+    g.user = AnonymousUser()
+    user_id = session.get('_user_id')
+    if user_id is not None:
+        g.user = await load_user(user_id) or g.user
+
+@app.context_processor
+def inject_current_user():
+    return {'current_user': g.get('user') or AnonymousUser()}
+
+def login_required(f):
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        if not g.user.is_authenticated:
+            await flash('Please log in to access this page.', 'message')
+            return redirect(url_for('login', next=request.full_path.rstrip('?')))
+        return await f(*args, **kwargs)
+    return decorated_function
+
+class PasswordHasherBusy(Exception):
+    """처리 중 + 대기 작업이 가득 찼거나 제한 시간 안에 결과를 받지 못함"""
+
+class PasswordHasher:
+    """scrypt 해시/검증을 제한된 스레드 풀에서 실행 (hashlib이 계산 중 GIL을 놓으므로 이벤트 루프가 멈추지 않음)"""
+
+    def __init__(self, method, workers, queue_size, timeout):
+        self.method = method
+        self.workers = max(1, workers)
+        self.max_pending = self.workers + queue_size
+        self.timeout = timeout
+        self.pending = 0
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hash')
+        # 설정 문자열에서 바로 계산 (이벤트 루프에서 scrypt를 돌리지 않도록)
+        self.hash_prefix = password_hash_prefix(method)
+        self.stats = {'submitted': 0, 'rejected': 0, 'timeouts': 0, 'rehashed': 0}
+
+    async def _run(self, func, *args):
+        if self.pending >= self.max_pending:
+            self.stats['rejected'] += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+        self.pending += 1
+        self.stats['submitted'] += 1
+        future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        future.add_done_callback(lambda _: setattr(self, 'pending', self.pending - 1))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            raise PasswordHasherBusy("Password hashing timed out")
+
+    async def hash(self, password):
+        return await self._run(generate_password_hash, password, self.method)
+
+    async def verify(self, pwhash, password):
+        return await self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        return pwhash.split('$', 1)[0] != self.hash_prefix
+
+    def get_stats(self):
+        return dict(self.stats, pending=self.pending, method=self.method, workers=self.workers, timeout=self.timeout)
+
+password_hasher = PasswordHasher(
+    app.config['PASSWORD_HASH_METHOD'],
+    app.config['PASSWORD_HASH_WORKERS'],
+    app.config['PASSWORD_HASH_QUEUE'],
+    app.config['PASSWORD_HASH_TIMEOUT']
+)
+
+@app.route('/')
+async def index():
+    return redirect(url_for('login'))
+
+@app.route('/register', methods=['GET', 'POST'])
+async def register():
+    if request.method == 'POST':
+        form = await request.form
+        username = form['username']
+        password = form['password']
+
+        # 입력 검증
+        if not username or not password:
+            await flash('Username and password are required.', 'error')
+            return await render_template('register.html')
+
+        if len(password) < 6:
+            await flash('Password must be at least 6 characters long.', 'error')
+            return await render_template('register.html')
+
+        try:
+            hashed_password = await password_hasher.hash(password)
+            async with db_cursor() as cursor:
+                await cursor.execute("INSERT INTO users (username, password) VALUES (%s, %s)", (username, hashed_password))
+            await flash('Registration successful. Please log in.', 'success')
+            return redirect(url_for('login'))
+        except PasswordHasherBusy as e:
+            logger.warning(f"Registration rejected: {e}")
+            await flash('Server is busy. Please try again shortly.', 'error')
+            return await render_template('register.html'), 503, {'Retry-After': '1'}
+        except Exception as e:
+            logger.error(f"Registration failed: {e}")
+            await flash('Registration failed. Username may already exist.', 'error')
+
+    return await render_template('register.html')
+
+async def rehash_password(user_id, password):
+    """해시 설정이 바뀐 경우 로그인 성공 시 현재 설정으로 다시 저장 (실패해도 로그인은 진행)"""
+    try:
+        new_hash = await password_hasher.hash(password)
+        async with db_cursor() as cursor:
+            await cursor.execute("UPDATE users SET password = %s WHERE id = %s", (new_hash, user_id))
+        password_hasher.stats['rehashed'] += 1
+    except Exception as e:
+        logger.warning(f"Password rehash failed for user {user_id}: {e}")
+
+@app.route('/login', methods=['GET', 'POST'])
+async def login():
+    if request.method == 'POST':
+        form = await request.form
+        username = form['username']
+        password = form['password']
+
+        if not username or not password:
+            await flash('Username and password are required.', 'error')
+            return await render_template('login.html')
+
+        try:
+            async with db_cursor() as cursor:
+                await cursor.execute("SELECT id, username, password FROM users WHERE username = %s", (username,))
+                user = await cursor.fetchone()
+
+            if user and await password_hasher.verify(user[2], password):
+                if password_hasher.needs_rehash(user[2]):
+                    await rehash_password(user[0], password)
+                user_cache.set(str(user[0]), user[1])
+                login_user(User(id=user[0], username=user[1]))
+                next_page = request.args.get('next')
+                return redirect(next_page or url_for('dashboard'))
+            else:
+                await flash('Invalid username or password.', 'error')
+        except PasswordHasherBusy as e:
+            logger.warning(f"Login rejected: {e}")
+            await flash('Server is busy. Please try again shortly.', 'error')
+            return await render_template('login.html'), 503, {'Retry-After': '1'}
+        except Exception as e:
+            logger.error(f"Login failed: {e}")
+            await flash('Login failed due to system error.', 'error')
+
+    return await render_template('login.html')
+
+@app.route('/dashboard')
+@login_required
+async def dashboard():
+    server_name = socket.gethostname()
+    try:
+        # gethostbyname은 루프를 막으므로 루프의 resolver 사용
+        addresses = await asyncio.get_running_loop().getaddrinfo(server_name, None, family=socket.AF_INET)
+        server_ip = addresses[0][4][0]
+    except Exception:
+        server_ip = 'Unknown'
+
+    return await render_template(
+        'dashboard_dr.html',
+        current_user=g.user,
+        client_ip=request.remote_addr,
+        server_name=server_name,
+        server_ip=server_ip,
+        xff=request.headers.get('X-Forwarded-For', 'Not Available'),
+        current_provider=cloud_provider.current_provider,
+        gcp_status='🟢 Online' if cloud_provider.gcp_available else '🔴 Offline',
+        aws_status='🟡 Standby'
+    )
+
+# 게시판 커서 페이지네이션 (created_at, id 기준 keyset, 커서/쿼리 형식은 board_common)
+def get_board_page_size():
+    """요청 파라미터(per_page)와 설정값으로 페이지 크기 결정"""
+    page_size = request.args.get('per_page', app.config['BOARD_PAGE_SIZE'], type=int)
+    return clamp_page_size(page_size, app.config['BOARD_MAX_PAGE_SIZE'])
+
+async def fetch_board_page(cursor, page_size, next_cursor=None, prev_cursor=None):
+    """게시글 한 페이지 조회 -> (posts, prev_cursor, next_cursor)
+
+    next_cursor가 주어지면 그보다 오래된 글, prev_cursor가 주어지면 그보다 최신 글을
+    page_size + 1개만 읽어 다음 페이지 존재 여부를 판단한다.
+    """
+    newer = decode_board_cursor(prev_cursor) if not next_cursor else None
+    older = decode_board_cursor(next_cursor)
+
+    if newer:
+        # 이전(더 최신) 페이지: 오름차순으로 읽은 뒤 뒤집는다
+        await cursor.execute(*newer_board_page_query(page_size, newer))
+        page = newer_board_page(list(await cursor.fetchall()), page_size)
+        if page:
+            return page
+        older = None  # 더 최신 글이 없으면 첫 페이지로
+
+    await cursor.execute(*older_board_page_query(page_size, older))
+    return older_board_page(list(await cursor.fetchall()), page_size, older)
+
+class BoardCache:
+    """Redis 게시판 페이지 캐시 (app.py BoardCache와 같은 키/형식이라 두 버전이 캐시와 무효화를 공유)"""
+
+    def __init__(self, app_instance, provider):
+        self.app = app_instance
+        self.provider = provider
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0, 'errors': 0}
+
+    async def get_page(self, page_size, next_cursor, prev_cursor, loader):
+        """캐시된 페이지 반환, 없으면 await loader()로 조회 후 저장"""
+        if not self.app.config['BOARD_CACHE_ENABLED']:
+            return await loader()
+
+        redis_client = self.provider.active.redis
+        key = None
+        try:
+            version = int(await redis_client.get(BOARD_CACHE_VERSION_KEY) or 0)
+            key = board_cache_key(version, page_size, next_cursor, prev_cursor)
+            raw = await redis_client.get(key)
+            if raw is not None:
+                self.stats['hits'] += 1
+                return deserialize_board_page(raw)
+        except Exception as e:
+            logger.warning(f"Board cache read failed: {e}")
+            self.stats['errors'] += 1
+
+        self.stats['misses'] += 1
+        page = await loader()
+        if key is not None:
+            try:
+                await redis_client.setex(key, self.app.config['BOARD_CACHE_TTL'], serialize_board_page(page))
+            except Exception as e:
+                logger.warning(f"Board cache write failed: {e}")
+                self.stats['errors'] += 1
+        return page
+
+    async def invalidate(self):
+        """게시글 변경 시 버전 증가로 모든 캐시 페이지 무효화"""
+        try:
+            await self.provider.active.redis.incr(BOARD_CACHE_VERSION_KEY)
+            self.stats['invalidations'] += 1
+        except Exception as e:
+            logger.warning(f"Board cache invalidation failed: {e}")
+            self.stats['errors'] += 1
+
+    def get_stats(self):
+        lookups = self.stats['hits'] + self.stats['misses']
+        return dict(self.stats, hit_ratio=round(self.stats['hits'] / lookups, 4) if lookups else 0.0,
+                    enabled=self.app.config['BOARD_CACHE_ENABLED'], ttl=self.app.config['BOARD_CACHE_TTL'])
+
+board_cache = BoardCache(app, cloud_provider)
+
+def remember_write():
+    """게시글을 쓴 세션은 마지막 쓰기 시각을 기록 (read-your-writes)
+
+    같은 세션을 app.py 워커가 받아도 READ_YOUR_WRITES_WINDOW 동안 레플리카 대신 primary에서 읽는다.
+    """
+    session['_last_write_at'] = time.time()
+
+@app.route('/board')
+@login_required
+async def board():
+    page_size = get_board_page_size()
+    next_cursor = request.args.get('next')
+    prev_cursor = request.args.get('prev')
+
+    async def load_page():
+        async with db_cursor() as cursor:
+            return await fetch_board_page(cursor, page_size, next_cursor=next_cursor, prev_cursor=prev_cursor)
+
+    try:
+        page = BoardPage(*await board_cache.get_page(page_size, next_cursor, prev_cursor, load_page))
+        return await render_template('board.html', page=page,
+                                     per_page=page_size if 'per_page' in request.args else None)
+    except Exception as e:
+        logger.error(f"Board loading failed: {e}")
+        await flash('Failed to load posts.', 'error')
+        return await render_template('board.html', page=BoardPage([], None, None))
+
+@app.route('/post/new', methods=['GET', 'POST'])
+@login_required
+async def new_post():
+    if request.method == 'POST':
+        form = await request.form
+        title = form['title']
+        content = form['content']
+
+        if not title or not content:
+            await flash('Title and content are required.', 'error')
+            return await render_template('new_post.html')
+
+        try:
+            async with db_cursor() as cursor:
+                await cursor.execute(
+                    "INSERT INTO posts (title, content, author_id, created_at) VALUES (%s, %s, %s, %s)",
+                    (title, content, g.user.id, datetime.now())
+                )
+            remember_write()
+            await board_cache.invalidate()
+            await flash('Post created successfully!', 'success')
+            return redirect(url_for('board'))
+        except Exception as e:
+            logger.error(f"Post creation failed: {e}")
+            await flash('Failed to create post.', 'error')
+
+    return await render_template('new_post.html')
+
+# 정적 파일: app.py와 같은 해시 파일명 (/assets/<이름>.<hash>.<확장자>, immutable 캐시)
+asset_manifest = build_asset_manifest(app.static_folder)
+asset_sources = {hashed: logical for logical, hashed in asset_manifest.items()}
+ASSET_MANIFEST_FINGERPRINT = manifest_fingerprint(asset_manifest)
+
+@app.template_global()
+def asset_url(path):
+    """템플릿에서 정적 파일 참조: {{ asset_url('css/base.css') }}"""
+    return url_for('asset', filename=asset_manifest.get(path, path))
+
+@app.route('/assets/<path:filename>')
+async def asset(filename):
+    """fingerprint된 정적 파일 (현재 해시와 일치할 때만 immutable 캐시)"""
+    source = asset_sources.get(filename)
+    if source is not None:
+        response = await send_from_directory(app.static_folder, source, cache_timeout=ASSET_MAX_AGE)
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+    # 배포 중 이전/다음 버전 HTML이 다른 해시를 요청하면 현재 파일을 캐시 없이 제공
+    logical = unhashed_asset_path(filename)
+    if logical not in asset_manifest:
+        abort(404)
+    response = await send_from_directory(app.static_folder, logical, cache_timeout=0)
+    response.cache_control.no_cache = True
+    return response
+
+# 게시글 조건부 GET (ETag / Last-Modified)
+VIEW_POST_TEMPLATE_FINGERPRINT = template_fingerprint(app, ASSET_MANIFEST_FINGERPRINT, 'base.html', 'view_post.html')
+
+@app.route('/post/<int:id>')
+@login_required
+async def view_post(id):
+    try:
+        async with db_cursor() as cursor:
+            # 본문 없이 메타데이터만 먼저 조회
+            await cursor.execute(POST_META_QUERY, (id,))
+            meta = await cursor.fetchone()
+
+            if not meta:
+                await flash('Post not found.', 'error')
+                return redirect(url_for('board'))
+
+            updated_at, author_id, author_name = meta
+            etag = make_post_etag(VIEW_POST_TEMPLATE_FINGERPRINT, id, updated_at, author_id, author_name, g.user.id)
+            # 표시할 flash 메시지가 남아 있으면 304로 응답하지 않는다
+            if not session.get('_flashes') and is_not_modified(request, etag, updated_at):
+                return set_post_cache_headers(await make_response('', 304), etag, updated_at)
+
+            await cursor.execute(POST_VIEW_QUERY, (id,))
+            post = await cursor.fetchone()
+
+        if not post:
+            await flash('Post not found.', 'error')
+            return redirect(url_for('board'))
+
+        etag = make_post_etag(VIEW_POST_TEMPLATE_FINGERPRINT, post[0], post[6], post[5], post[4], g.user.id)
+        response = await make_response(await render_template('view_post.html', post=post))
+        return set_post_cache_headers(response, etag, post[6])
+    except Exception as e:
+        logger.error(f"Post viewing failed: {e}")
+        await flash('Failed to load post.', 'error')
+        return redirect(url_for('board'))
+
+@app.route('/post/<int:id>/edit', methods=['GET', 'POST'])
+@login_required
+async def edit_post(id):
+    try:
+        async with db_cursor() as cursor:
+            await cursor.execute("SELECT id, title, content, author_id, created_at FROM posts WHERE id = %s", (id,))
+            post = await cursor.fetchone()
+
+            if not post or post[3] != g.user.id:
+                await flash('You can only edit your own posts.', 'error')
+                return redirect(url_for('board'))
+
+            if request.method == 'POST':
+                form = await request.form
+                title = form['title']
+                content = form['content']
+
+                if not title or not content:
+                    await flash('Title and content are required.', 'error')
+                    return await render_template('edit_post.html', post=post)
+
+                await cursor.execute(
+                    "UPDATE posts SET title = %s, content = %s WHERE id = %s",
+                    (title, content, id)
+                )
+                remember_write()
+                await board_cache.invalidate()
+                await flash('Post updated successfully!', 'success')
+                return redirect(url_for('view_post', id=id))
+
+        return await render_template('edit_post.html', post=post)
+    except Exception as e:
+        logger.error(f"Post editing failed: {e}")
+        await flash('Failed to edit post.', 'error')
+        return redirect(url_for('board'))
+
+@app.route('/post/<int:id>/delete', methods=['POST'])
+@login_required
+async def delete_post(id):
+    try:
+        async with db_cursor() as cursor:
+            await cursor.execute("SELECT author_id FROM posts WHERE id = %s", (id,))
+            post = await cursor.fetchone()
+
+            if not post or post[0] != g.user.id:
+                await flash('You can only delete your own posts.', 'error')
+                return redirect(url_for('board'))
+
+            await cursor.execute("DELETE FROM posts WHERE id = %s", (id,))
+        remember_write()
+        await board_cache.invalidate()
+        await flash('Post deleted successfully!', 'success')
+        return redirect(url_for('board'))
+    except Exception as e:
+        logger.error(f"Post deletion failed: {e}")
+        await flash('Failed to delete post.', 'error')
+        return redirect(url_for('board'))
+
+@app.route('/logout')
+@login_required
+async def logout():
+    logout_user()
+    await flash('You have been logged out.', 'info')
+    return redirect(url_for('login'))
+
+# 게시글 JSON API (모바일 클라이언트용, app.py와 같은 파라미터/응답 형식)
+def json_response(data, status=200):
+    return Response(dumps_json(data), status=status, mimetype='application/json')
+
+async def api_etag_response(etag, body=None):
+    """ETag가 일치하면 304, 아니면 직렬화된 JSON body 응답 (사용자별 데이터이므로 private)"""
+    if request.if_none_match.contains_weak(etag):
+        response = await make_response('', 304)
+    else:
+        response = Response(body, mimetype='application/json')
+    return set_private_etag(response, etag)
+
+@app.route('/api/posts')
+@login_required
+async def api_posts():
+    """게시글 목록: ?limit=&cursor=&fields= (created_at, id 기준 최신순 커서 페이지네이션)"""
+    fields = parse_post_fields(request.args.get('fields'), POST_LIST_FIELDS, POST_LIST_DEFAULT_FIELDS)
+    if fields is None:
+        return json_response({'error': f"fields must be a subset of: {', '.join(POST_LIST_FIELDS)}"}, 400)
+    limit = clamp_page_size(request.args.get('limit', app.config['BOARD_PAGE_SIZE'], type=int),
+                            app.config['BOARD_MAX_PAGE_SIZE'])
+    cursor_value = request.args.get('cursor')
+    older = decode_board_cursor(cursor_value)
+    if cursor_value and not older:
+        return json_response({'error': 'invalid cursor'}, 400)
+
+    async with db_cursor() as cursor:
+        await cursor.execute(*post_list_query(fields, limit, older))
+        rows = await cursor.fetchall()
+
+    body = post_list_body(rows, fields, limit)
+    return await api_etag_response(hashlib.sha1(body).hexdigest(), body)
+
+@app.route('/api/posts/<int:id>')
+@login_required
+async def api_post(id):
+    """게시글 상세: ?fields= (기본 전체 필드)"""
+    fields = parse_post_fields(request.args.get('fields'), POST_API_FIELDS, POST_DETAIL_DEFAULT_FIELDS)
+    if fields is None:
+        return json_response({'error': f"fields must be a subset of: {', '.join(POST_API_FIELDS)}"}, 400)
+
+    async with db_cursor() as cursor:
+        # 본문 없이 메타데이터만 먼저 조회해 304면 content를 읽지 않는다
+        await cursor.execute(POST_API_META_QUERY, (id,))
+        meta = await cursor.fetchone()
+        if not meta:
+            return json_response({'error': 'post not found'}, 404)
+
+        updated_at, author_name = meta
+        etag = post_detail_etag(id, updated_at, author_name, fields)
+        if request.if_none_match.contains_weak(etag):
+            return await api_etag_response(etag)
+
+        await cursor.execute(post_detail_query(fields), (id,))
+        row = await cursor.fetchone()
+    if not row:
+        return json_response({'error': 'post not found'}, 404)
+    return await api_etag_response(etag, dumps_json(dict(zip(fields, row))))
+
+@app.route('/api/session-info')
+@login_required
+async def session_info_api():
+    try:
+        return jsonify({
+            'user_id': g.user.id,
+            'username': g.user.username,
+            'session_id': session.get('_id', 'N/A'),
+            'user_session_id': session.get('_user_id', 'N/A'),
+            'fresh_login': session.get('_fresh', False),
+            'is_authenticated': g.user.is_authenticated,
+            'login_timestamp': time.time(),
+            'session_keys': list(session.keys()),
+            'request_info': {
+                'ip': request.remote_addr,
+                'user_agent': str(request.user_agent),
+                'url': request.url
+            },
+            'cloud_provider': {
+                'current': cloud_provider.current_provider,
+                'gcp_available': cloud_provider.gcp_available,
+                'aws_available': cloud_provider.aws_available
+            }
+        })
+    except Exception as e:
+        return jsonify({'error': 'Session info unavailable', 'message': str(e)}), 500
+
+def cloud_status_payload():
+    return build_cloud_status(cloud_provider, standby_ready=False)
+
+@app.route('/api/cloud-status')
+async def cloud_status_api():
+    """클라우드 제공업체 상태 API"""
+    return jsonify(cloud_status_payload())
+
+class StatusBroadcaster:
+    """프로바이더 전환 이벤트를 Redis pub/sub(app.py와 같은 채널)으로 퍼뜨리고 SSE 연결들에 전달
+
+    워커마다 구독 태스크는 하나이고, 대기 중인 SSE 연결의 비용은 asyncio 큐 하나다.
+    """
+
+    CHANNEL = STATUS_CHANNEL
+
+    def __init__(self, provider, max_clients):
+        self.provider = provider
+        self.max_clients = max_clients
+        self.clients = set()
+        self.origin = None
+        self.task = None
+        self.stats = {'connected': 0, 'rejected': 0, 'published': 0, 'delivered': 0, 'dropped': 0}
+
+    def start(self):
+        self.origin = f'{socket.gethostname()}:{os.getpid()}'
+        self.task = asyncio.ensure_future(self.listen())
+
+    async def listen(self):
+        """활성 Redis 채널 구독 (프로바이더 전환으로 클라이언트가 바뀌면 다시 구독)"""
+        while True:
+            client = self.provider.active.redis
+            try:
+                async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    while client is self.provider.active.redis:
+                        message = await pubsub.get_message(timeout=1.0)
+                        if message is not None:
+                            self._receive(json.loads(message['data']))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Redis subscription to {self.CHANNEL} failed: {e}")
+                await asyncio.sleep(5)
+
+    def subscribe(self):
+        """연결별 이벤트 큐 (동시 연결 수를 넘으면 None)"""
+        if len(self.clients) >= self.max_clients:
+            self.stats['rejected'] += 1
+            return None
+        events = asyncio.Queue(maxsize=16)
+        self.clients.add(events)
+        self.stats['connected'] += 1
+        return events
+
+    def unsubscribe(self, events):
+        self.clients.discard(events)
+
+    async def publish(self, event, data):
+        self._deliver(sse_message(event, data))
+        try:
+            await self.provider.active.redis.publish(
+                self.CHANNEL, json.dumps({'origin': self.origin, 'event': event, 'data': data}))
+            self.stats['published'] += 1
+        except Exception as e:
+            logger.warning(f"Status event publish failed: {e}")
+
+    def _receive(self, message):
+        if message.get('origin') != self.origin:
+            self._deliver(sse_message(message['event'], message['data']))
+
+    def _deliver(self, message):
+        for events in list(self.clients):
+            try:
+                events.put_nowait(message)
+                self.stats['delivered'] += 1
+            except asyncio.QueueFull:
+                self.stats['dropped'] += 1  # 읽지 않는 연결은 건너뜀
+
+    def get_stats(self):
+        return dict(self.stats, clients=len(self.clients), max_clients=self.max_clients, pid=os.getpid())
+
+status_broadcaster = StatusBroadcaster(cloud_provider, app.config['STATUS_STREAM_MAX_CLIENTS'])
+cloud_provider.switch_listeners.append(
+    lambda last_switch: asyncio.ensure_future(status_broadcaster.publish('switch', cloud_status_payload())))
+
+@app.route('/api/cloud-status/stream')
+async def cloud_status_stream():
+    """클라우드 상태 SSE: 연결 즉시 현재 상태, 이후 프로바이더 전환 시 바로 전송"""
+    events = status_broadcaster.subscribe()
+    if events is None:
+        response = json_response({'error': 'Too many status streams'}, 503)
+        response.headers['Retry-After'] = '30'
+        return response
+    initial = 'retry: 5000\n' + sse_message('status', cloud_status_payload())
+    keepalive = app.config['STATUS_STREAM_KEEPALIVE']
+
+    async def generate():
+        try:
+            yield initial.encode('utf-8')
+            while True:
+                try:
+                    message = await asyncio.wait_for(events.get(), keepalive)
+                except asyncio.TimeoutError:
+                    message = ': keepalive\n\n'
+                yield message.encode('utf-8')
+        finally:
+            status_broadcaster.unsubscribe(events)
+
+    response = await make_response(generate())
+    response.mimetype = 'text/event-stream'
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Accel-Buffering'] = 'no'  # nginx 등 프록시 버퍼링 비활성화
+    response.timeout = None  # Quart 기본 응답 제한 시간(RESPONSE_TIMEOUT) 없이 유지
+    return response
+
+@app.route('/api/status-stream-stats')
+async def status_stream_stats_api():
+    """클라우드 상태 SSE 연결 통계 API (워커 프로세스별)"""
+    return jsonify(status_broadcaster.get_stats())
+
+@app.route('/api/cache-stats')
+async def cache_stats_api():
+    """게시판/사용자 캐시, 세션 저장 통계 API (워커 프로세스별)"""
+    return jsonify({
+        'board': board_cache.get_stats(),
+        'users': user_cache.get_stats(),
+        'sessions': app.session_interface.get_stats(),
+        'pid': os.getpid()
+    })
+
+@app.route('/api/password-hash-stats')
+async def password_hash_stats_api():
+    """비밀번호 해시 풀 통계 API (워커 프로세스별)"""
+    return jsonify(dict(password_hasher.get_stats(), pid=os.getpid()))
+
+@app.route('/api/db-pool-stats')
+async def db_pool_stats_api():
+    """MySQL 커넥션 풀 통계 API (워커 프로세스별)"""
+    pool = cloud_provider.active.pool
+    return jsonify({
+        'provider': cloud_provider.active.config['provider'],
+        'size': pool.size,
+        'idle': pool.freesize,
+        'in_use': pool.size - pool.freesize,
+        'min_size': pool.minsize,
+        'max_size': pool.maxsize,
+        'pid': os.getpid()
+    })
+
+# 헬스 상태 스냅샷 (app.py와 같은 필드, 요청 경로에서는 읽기만 함)
+HealthSnapshot = namedtuple('HealthSnapshot', ['provider', 'healthy', 'checks', 'checked_at', 'switched_at'])
+
+class HealthMonitor:
+    """백그라운드 태스크 하나가 현재 프로바이더의 풀/Redis를 점검하고 스냅샷을 갱신 (DB 장애면 전환)"""
+
+    def __init__(self, provider, interval):
+        self.provider = provider
+        self.interval = interval
+        self.snapshot = HealthSnapshot(provider.current_provider, True, {}, time.time(), None)
+        self.wake_event = None
+        self.task = None
+
+    def start(self):
+        self.wake_event = asyncio.Event()
+        self.task = asyncio.ensure_future(self.run())
+        # 첫 주기를 기다리지 않고 바로 점검해 readiness 스냅샷을 채운다
+        self.wake_event.set()
+
+    def is_alive(self):
+        return self.task is not None and not self.task.done()
+
+    def is_ready(self, snapshot, max_age):
+        """스냅샷 기준 준비 상태 (점검 실패 또는 스냅샷이 max_age보다 오래됨 -> False)"""
+        return snapshot.healthy and time.time() - snapshot.checked_at <= max_age
+
+    async def _timed(self, check):
+        start = time.perf_counter()
+        ok = await check()
+        return {'ok': ok, 'latency_ms': round((time.perf_counter() - start) * 1000, 2)}
+
+    async def _check_database(self):
+        try:
+            async with db_cursor() as cursor:
+                await asyncio.wait_for(cursor.execute("SELECT 1"), 5)
+            return True
+        except Exception as e:
+            logger.error(f"Database pool check failed for {self.provider.current_provider}: {e}")
+            return False
+
+    async def _check_redis(self):
+        try:
+            return bool(await asyncio.wait_for(self.provider.active.redis.ping(), 5))
+        except Exception as e:
+            logger.error(f"Redis check failed for {self.provider.current_provider}: {e}")
+            return False
+
+    async def probe(self):
+        """현재 연결로 DB/Redis를 동시에 점검하고 스냅샷 갱신"""
+        mysql_check, redis_check = await asyncio.gather(self._timed(self._check_database), self._timed(self._check_redis))
+        checks = {'mysql': mysql_check, 'redis': redis_check}
+        self.snapshot = HealthSnapshot(
+            provider=self.provider.current_provider,
+            healthy=all(check['ok'] for check in checks.values()),
+            checks=checks,
+            checked_at=time.time(),
+            switched_at=self.snapshot.switched_at
+        )
+        self.provider.last_health_check = self.snapshot.checked_at
+        return self.snapshot
+
+    async def run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.wake_event.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self.wake_event.clear()
+            try:
+                snapshot = await self.probe()
+                if not snapshot.checks['mysql']['ok']:
+                    logger.warning(f"Current {snapshot.provider} database connection failed, attempting failover")
+                    if await self.provider.switch_provider():
+                        self.snapshot = self.snapshot._replace(switched_at=time.time())
+                        await self.probe()
+            except Exception as e:
+                logger.error(f"Health check failed: {e}")
+
+health_monitor = HealthMonitor(cloud_provider, app.config['HEALTH_CHECK_INTERVAL'])
+
+# 로드밸런서/오리진 프로브용 엔드포인트: 스냅샷만 읽고 요청마다 DB/Redis I/O를 하지 않는다
+def probe_response(data, status):
+    response = json_response(data, status)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+@app.route('/livez')
+async def livez():
+    """liveness: 프로세스와 헬스 모니터 태스크가 살아 있는지"""
+    if not health_monitor.is_alive():
+        return probe_response({'status': 'dead', 'reason': 'health monitor stopped', 'pid': os.getpid()}, 503)
+    return probe_response({'status': 'alive', 'pid': os.getpid()}, 200)
+
+@app.route('/readyz')
+async def readyz():
+    """readiness: 마지막 점검의 의존성별 상태와 지연"""
+    snapshot = health_monitor.snapshot
+    ready = health_monitor.is_ready(snapshot, app.config['HEALTH_SNAPSHOT_MAX_AGE'])
+    return probe_response({
+        'status': 'ready' if ready else 'not_ready',
+        'provider': snapshot.provider,
+        'checks': snapshot.checks,
+        'checked_at': snapshot.checked_at,
+        'age_s': round(time.time() - snapshot.checked_at, 3),
+        'pid': os.getpid()
+    }, 200 if ready else 503)
+
+@app.route('/healthz')
+async def health_check():
+    """헬스체크 엔드포인트 (readiness와 같은 스냅샷 기준, timestamp는 마지막 점검 시각)"""
+    snapshot = health_monitor.snapshot
+    ready = health_monitor.is_ready(snapshot, app.config['HEALTH_SNAPSHOT_MAX_AGE'])
+    return {
+        'status': 'healthy' if ready else 'unhealthy',
+        'provider': snapshot.provider,
+        'checks': snapshot.checks,
+        'timestamp': snapshot.checked_at
+    }, 200 if ready else 503
+
+async def background_health_check():
+    """주기적으로 프로바이더를 다시 선택하고, 사용 중인 것과 다르면 전환 (예: GCP 복구 시 복귀)"""
+    while True:
+        await asyncio.sleep(60)
+        try:
+            new_config = await cloud_provider.get_active_config()
+            if new_config['provider'] != cloud_provider.active.config['provider']:
+                await cloud_provider.switch_provider(new_config)
+        except Exception as e:
+            logger.error(f"Background health check failed: {e}")
+
+background_tasks = []
+
+@app.before_serving
+async def start_worker():
+    """워커의 이벤트 루프 시작 시 프로바이더 선택, 연결 풀 생성, 백그라운드 태스크 시작
+
+    import 시에는 연결하지 않으므로 gunicorn preload/fork 이후에도 연결과 태스크가 워커마다 만들어진다.
+    """
+    try:
+        active_config = await cloud_provider.get_active_config()
+    except Exception as e:
+        logger.critical(f"Failed to initialize any cloud provider: {e}")
+        raise
+    app.secret_key = active_config['flask_secret']
+    cloud_provider.active = await cloud_provider.build_backends(active_config)
+    health_monitor.start()
+    status_broadcaster.start()
+    background_tasks.extend([health_monitor.task, status_broadcaster.task,
+                             asyncio.ensure_future(background_health_check())])
+    logger.info(f"Worker {os.getpid()} started with {cloud_provider.current_provider} configuration (asgi)")
+
+@app.after_serving
+async def stop_worker():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    if cloud_provider.active is not None:
+        await cloud_provider.active.close()
+
+# 애플리케이션 에러 핸들러
+@app.errorhandler(404)
+async def not_found_error(error):
+    return await render_template('404.html'), 404
+
+@app.errorhandler(500)
+async def internal_error(error):
+    logger.error(f"Internal server error: {error}")
+    return await render_template('500.html'), 500
+
+if __name__ == '__main__':
+    logger.info("Starting Quart app (asgi)")
+    app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
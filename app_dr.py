@@ -260,6 +260,9 @@ except Exception as e:
 app = Flask(__name__)
 app.secret_key = active_config['flask_secret']
 
+# 공용 템플릿의 정적 파일 참조 (fingerprint 없이 기본 /static 경로 사용)
+app.jinja_env.globals['asset_url'] = lambda path: url_for('static', filename=path)
+
 # Redis 세션 설정 (클라우드별 SSL 설정)
 app.config['SESSION_TYPE'] = 'redis'
 if active_config['provider'] == 'GCP':
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""실행 모드별 처리량/지연 비교 벤치마크
+
+serve.py의 모드(dev, gthread, gevent, asgi)마다 서버를 로컬에 띄우고 speed.py와 같은 부하를 건 뒤
+결과를 한 표로 비교한다. -- 뒤의 인자는 그대로 speed.py 옵션으로 전달된다.
+asgi 모드(app_async.py)는 --asgi-python으로 requirements_async.txt를 설치한 가상환경의 파이썬을 지정한다.
+
+예)
+  python bench_serve.py --modes dev,gthread,gevent -- -c 50 -d 30 --username bench --password benchpw
+  python bench_serve.py --modes gthread,gevent --workers 4 --output modes.json -- -c 200 -d 60 --mix board=8,healthz=2
+  python bench_serve.py --modes gthread,asgi --asgi-python venv-async/bin/python -- -c 500 -d 60 --username bench --password benchpw
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import requests
+
+import speed
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def wait_ready(url, process, timeout):
+    """서버가 /readyz에 200으로 응답할 때까지 대기 (프로세스가 먼저 끝나면 False)"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            if requests.get(url + '/readyz', timeout=1).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    return False
+
+def run_mode(mode, args, speed_argv):
+    port = args.port
+    url = f'http://127.0.0.1:{port}'
+    python = args.asgi_python if mode == 'asgi' else sys.executable
+    command = [python, os.path.join(HERE, 'serve.py'), '--mode', mode, '--bind', f'127.0.0.1:{port}']
+    if args.workers and mode != 'dev':
+        command += ['--workers', str(args.workers)]
+    print(f"\n### {mode}: {' '.join(command[1:])}")
+    process = subprocess.Popen(command, cwd=HERE, stdout=subprocess.DEVNULL if args.quiet else None,
+                               stderr=subprocess.DEVNULL if args.quiet else None)
+    try:
+        if not wait_ready(url, process, args.startup_timeout):
+            print(f"  {mode} 서버가 준비되지 않아 건너뜀 (gevent 모드는 pip install gevent, "
+                  f"asgi 모드는 requirements_async.txt 필요)")
+            return None
+        speed_args = speed.parse_args(['--url', url] + speed_argv)
+        result = speed.run_benchmark(speed_args, speed_args.mix)
+        speed.print_report(result)
+        return result
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def print_summary(results):
+    print("\n" + "="*78)
+    print("=== 모드별 비교 (TOTAL) ===")
+    header = f"{'mode':<10}{'reqs':>8}{'rps':>9}{'err%':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>10}"
+    print(header)
+    print("-"*len(header))
+    baseline = None
+    for mode, result in results.items():
+        if result is None:
+            print(f"{mode:<10}{'skipped':>8}")
+            continue
+        s = result['overall']
+        change = f"  ({(s['rps'] - baseline) / baseline * 100:+.1f}% rps)" if baseline else ''
+        baseline = baseline or s['rps']
+        print(f"{mode:<10}{s['requests']:>8}{s['rps']:>9.1f}{s['error_rate'] * 100:>7.2f}%"
+              f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['max_ms']:>10.1f}{change}")
+    print("(단위: ms, 변화율은 첫 모드 대비)")
+
+def parse_args(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    speed_argv = []
+    if '--' in argv:
+        index = argv.index('--')
+        argv, speed_argv = argv[:index], argv[index + 1:]
+    parser = argparse.ArgumentParser(description="serve.py 실행 모드별 부하 테스트 비교")
+    parser.add_argument('--modes', default='dev,gthread,gevent', help="비교할 모드 (dev, gthread, gevent, asgi / 기본: dev,gthread,gevent)")
+    parser.add_argument('--port', type=int, default=5055, help="서버를 띄울 로컬 포트")
+    parser.add_argument('--workers', type=int, help="gunicorn 워커 수 (기본: serve.py 자동 설정)")
+    parser.add_argument('--startup-timeout', type=float, default=60, help="서버 준비 대기 시간 (초)")
+    parser.add_argument('--asgi-python', default=sys.executable,
+                        help="asgi 모드 서버를 실행할 파이썬 (기본: 현재 파이썬)")
+    parser.add_argument('--quiet', action='store_true', help="서버 로그 숨기기")
+    parser.add_argument('--output', help="모드별 결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+    args.modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in args.modes if mode not in ('dev', 'gthread', 'gevent', 'asgi')]
+    if unknown:
+        parser.error(f"unknown mode: {', '.join(unknown)}")
+    return args, speed_argv
+
+def main(argv=None):
+    args, speed_argv = parse_args(argv)
+    results = {}
+    for mode in args.modes:
+        results[mode] = run_mode(mode, args, speed_argv)
+    print_summary(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
+    return 0 if any(results.values()) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,424 @@
+"""app.py(WSGI)와 app_async.py(ASGI)가 함께 쓰는 I/O 없는 로직
+
+두 버전이 같은 Redis 세션/게시판 캐시/상태 이벤트 채널과 같은 URL 커서, ETag를 공유하므로
+형식은 여기서만 정의한다. DB/Redis/시크릿 API 호출은 각 앱(동기/async)에 둔다.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import socket
+import struct
+import time
+import urllib.request
+from collections import namedtuple
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 클라우드 설정 (시크릿 JSON -> 앱 설정)
+def parse_replica_hosts(value):
+    """레플리카 목록 정규화: ['host', 'host:port', ...] 또는 쉼표 구분 문자열 -> 리스트"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(',')
+    return [str(host).strip() for host in value if str(host).strip()]
+
+def config_from_gcp_secret(secret):
+    """GCP Secret Manager 시크릿(project-secrets) -> 설정"""
+    return {
+        'flask_secret': secret['flask_secret'],
+        'redis_host': secret['redis_host'],
+        'mysql_host': secret['mysql_host'],
+        'mysql_user': secret['mysql_user'],
+        'mysql_password': secret['mysql_password'],
+        'mysql_db': secret['mysql_db'],
+        'mysql_replicas': parse_replica_hosts(secret.get('mysql_replicas')),
+        'provider': 'GCP'
+    }
+
+def config_from_aws_secret(secret):
+    """AWS Secrets Manager 시크릿(flask/app, RDS 형식 키) -> 설정"""
+    return {
+        'flask_secret': secret['flask_secret'],
+        'redis_host': secret['redis_host'],
+        'mysql_host': secret['host'],
+        'mysql_user': secret['username'],
+        'mysql_password': secret['password'],
+        'mysql_db': secret['dbname'],
+        'mysql_replicas': parse_replica_hosts(secret.get('mysql_replicas')),
+        'provider': 'AWS'
+    }
+
+def load_local_config(config_file=None):
+    """로컬 MySQL/Redis 설정 (config_file JSON 또는 환경 변수), 파일을 읽지 못하면 None"""
+    if config_file:
+        try:
+            with open(config_file) as f:
+                config = json.load(f)
+        except Exception as e:
+            logger.error(f"LOCAL config file load failed: {e}")
+            return None
+    else:
+        config = {}
+    return {
+        'flask_secret': config.get('flask_secret', os.getenv('FLASK_SECRET_KEY', 'local-dev-secret')),
+        'redis_host': config.get('redis_host', os.getenv('REDIS_HOST', 'localhost')),
+        'redis_port': int(config.get('redis_port', os.getenv('REDIS_PORT', '6379'))),
+        'mysql_host': config.get('mysql_host', os.getenv('MYSQL_HOST', 'localhost')),
+        'mysql_port': int(config.get('mysql_port', os.getenv('MYSQL_PORT', '3306'))),
+        'mysql_user': config.get('mysql_user', os.getenv('MYSQL_USER', 'root')),
+        'mysql_password': config.get('mysql_password', os.getenv('MYSQL_PASSWORD', '')),
+        'mysql_db': config.get('mysql_db', os.getenv('MYSQL_DB', 'flask_board')),
+        'mysql_replicas': parse_replica_hosts(config.get('mysql_replicas', os.getenv('MYSQL_REPLICAS'))),
+        'provider': 'LOCAL'
+    }
+
+# 실행 환경 감지 (블로킹 호출이므로 async 앱은 스레드에서 실행)
+def probe_ec2_metadata(timeout):
+    """EC2 메타데이터로 AWS 환경 확인"""
+    try:
+        response = urllib.request.urlopen('http://169.254.169.254/latest/meta-data/instance-id', timeout=timeout)
+        # AWS EC2 인스턴스 ID는 i-로 시작
+        return response.read().decode('utf-8').startswith('i-')
+    except Exception:
+        return False
+
+def probe_gcp_metadata(timeout):
+    """GCP 메타데이터 서버 접근 가능 여부 확인"""
+    try:
+        req = urllib.request.Request('http://metadata.google.internal/computeMetadata/v1/instance/id')
+        req.add_header('Metadata-Flavor', 'Google')
+        urllib.request.urlopen(req, timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+def hostname_suggests_aws():
+    """호스트명으로 AWS 환경 추정 (메타데이터 확인이 모두 실패했을 때의 최후 수단)"""
+    hostname = socket.gethostname()
+    return 'amazonaws' in hostname or hostname.startswith('ip-')
+
+def build_cloud_status(provider, **extra):
+    """/api/cloud-status 응답과 SSE 상태 이벤트 본문 (버전별 추가 필드는 extra)"""
+    status = {
+        'current_provider': provider.current_provider,
+        'gcp_available': provider.gcp_available,
+        'aws_available': provider.aws_available,
+        'last_health_check': provider.last_health_check,
+        'last_switch': provider.last_switch,
+    }
+    status.update(extra)
+    status['timestamp'] = time.time()
+    return status
+
+# 클라우드 상태 이벤트 (Redis pub/sub 채널, SSE 형식)
+STATUS_CHANNEL = 'cloud-status:events'
+
+def sse_message(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+# 세션
+class CompactSessionSerializer:
+    """세션 직렬화: 1바이트 형식 태그 + 4바이트 저장 시각 + 본문 (msgpack, 없으면 JSON)
+
+    기존 pickle 세션도 읽을 수 있어 배포 시 로그아웃되지 않고, 다음 저장 때 새 형식으로 바뀐다.
+    """
+    HEADER = struct.Struct('>cI')
+    name = 'msgpack' if msgpack is not None else 'json'
+
+    def dumps(self, data, written_at):
+        if msgpack is not None:
+            return self.HEADER.pack(b'm', written_at) + msgpack.packb(data, use_bin_type=True)
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return self.HEADER.pack(b'j', written_at) + body
+
+    def loads(self, value):
+        """-> (data, written_at), pickle 세션은 written_at=0"""
+        if value[:1] == b'\x80':
+            return pickle.loads(value), 0
+        tag, written_at = self.HEADER.unpack_from(value)
+        body = value[self.HEADER.size:]
+        if tag == b'm':
+            return msgpack.unpackb(body, raw=False), written_at
+        return json.loads(body), written_at
+
+def session_identifier(headers, remote_addr):
+    """Flask-Login(0.6)의 세션 식별자(_id)와 같은 값 (IP + User-Agent 해시)
+
+    세션 보호(basic)가 두 앱 사이에서 통과하도록 bytes 표현(b'...')까지 Flask-Login과 똑같이 만든다.
+    """
+    user_agent = headers.get('User-Agent')
+    if user_agent is not None:
+        user_agent = user_agent.encode('utf-8')
+    address = headers.get('X-Forwarded-For', remote_addr)
+    if address is not None:
+        # X-Forwarded-For는 쉼표로 구분된 목록이고 첫 주소가 실제 클라이언트
+        address = address.encode('utf-8').split(b',')[0].strip()
+    return hashlib.sha512(f"{address}|{user_agent}".encode('utf8')).hexdigest()
+
+# 비밀번호 해시 방식
+def password_hash_prefix(method):
+    """PASSWORD_HASH_METHOD -> 저장된 해시의 접두어 ('scrypt' -> 'scrypt:32768:8:1')
+
+    werkzeug generate_password_hash와 같은 기본 파라미터를 채우며, 해시를 계산하지 않는다.
+    """
+    from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        n, r, p = (int(value) for value in args + ['32768', '8', '1'][len(args):])
+        return f"scrypt:{n}:{r}:{p}"
+    if name == 'pbkdf2':
+        hash_name = args[0] if args else 'sha256'
+        iterations = int(args[1]) if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return f"pbkdf2:{hash_name}:{iterations}"
+    raise ValueError(f"Unsupported password hash method: {method}")
+
+# 게시판 커서 페이지네이션 (created_at, id 기준 keyset)
+BOARD_EXCERPT_LENGTH = 150
+BOARD_CURSOR_FORMAT = '%Y%m%d%H%M%S%f'
+
+BoardPage = namedtuple('BoardPage', ['posts', 'prev_cursor', 'next_cursor'])
+
+def encode_board_cursor(created_at, post_id):
+    """(created_at, id)를 URL용 커서 문자열로 변환"""
+    return f"{created_at.strftime(BOARD_CURSOR_FORMAT)}-{post_id}"
+
+def decode_board_cursor(value):
+    """커서 문자열을 (created_at, id)로 변환, 잘못된 값이면 None"""
+    if not value:
+        return None
+    try:
+        timestamp, post_id = value.split('-', 1)
+        return datetime.strptime(timestamp, BOARD_CURSOR_FORMAT), int(post_id)
+    except ValueError:
+        return None
+
+def clamp_page_size(value, maximum):
+    return max(1, min(value, maximum))
+
+BOARD_PAGE_SELECT = f"""
+    SELECT p.id, p.title, LEFT(p.content, {BOARD_EXCERPT_LENGTH + 1}), p.created_at, u.username
+    FROM posts p
+    JOIN users u ON p.author_id = u.id
+"""
+
+def newer_board_page_query(page_size, newer):
+    """newer=(created_at, id)보다 최신 글을 오름차순으로 page_size + 1개 -> (sql, params)"""
+    created_at, post_id = newer
+    return BOARD_PAGE_SELECT + """
+        WHERE p.created_at > %s OR (p.created_at = %s AND p.id > %s)
+        ORDER BY p.created_at ASC, p.id ASC
+        LIMIT %s
+    """, (created_at, created_at, post_id, page_size + 1)
+
+def older_board_page_query(page_size, older=None):
+    """첫 페이지 또는 older=(created_at, id)보다 오래된 글을 최신순으로 page_size + 1개 -> (sql, params)"""
+    if older:
+        created_at, post_id = older
+        return BOARD_PAGE_SELECT + """
+            WHERE p.created_at < %s OR (p.created_at = %s AND p.id < %s)
+            ORDER BY p.created_at DESC, p.id DESC
+            LIMIT %s
+        """, (created_at, created_at, post_id, page_size + 1)
+    return BOARD_PAGE_SELECT + """
+        ORDER BY p.created_at DESC, p.id DESC
+        LIMIT %s
+    """, (page_size + 1,)
+
+def newer_board_page(rows, page_size):
+    """newer_board_page_query 결과 -> (posts, prev_cursor, next_cursor), 더 최신 글이 없으면 None"""
+    if not rows:
+        return None
+    has_newer = len(rows) > page_size
+    posts = rows[:page_size][::-1]
+    prev_page = encode_board_cursor(posts[0][3], posts[0][0]) if has_newer else None
+    return posts, prev_page, encode_board_cursor(posts[-1][3], posts[-1][0])
+
+def older_board_page(rows, page_size, older):
+    """older_board_page_query 결과 -> (posts, prev_cursor, next_cursor)"""
+    posts = rows[:page_size]
+    prev_page = encode_board_cursor(posts[0][3], posts[0][0]) if older and posts else None
+    next_page = encode_board_cursor(posts[-1][3], posts[-1][0]) if len(rows) > page_size else None
+    return posts, prev_page, next_page
+
+# 게시판 페이지 캐시 (키에 board:version 값을 넣어 INCR 한 번으로 전체 무효화)
+BOARD_CACHE_VERSION_KEY = 'board:version'
+BOARD_CACHE_PAGE_KEY_PREFIX = 'board:page:'
+
+def board_cache_key(version, page_size, next_cursor, prev_cursor):
+    return f"{BOARD_CACHE_PAGE_KEY_PREFIX}{version}:{page_size}:{next_cursor or ''}:{prev_cursor or ''}"
+
+def serialize_board_page(page):
+    posts, prev_page, next_page = page
+    return json.dumps({
+        'posts': [[p[0], p[1], p[2], p[3].isoformat(), p[4]] for p in posts],
+        'prev': prev_page,
+        'next': next_page
+    }, separators=(',', ':'))
+
+def deserialize_board_page(raw):
+    data = json.loads(raw)
+    posts = [(p[0], p[1], p[2], datetime.fromisoformat(p[3]), p[4]) for p in data['posts']]
+    return posts, data['prev'], data['next']
+
+# 게시글 조회 (메타데이터 먼저 조회해 304면 본문을 읽지 않는다)
+POST_META_QUERY = """
+    SELECT COALESCE(p.updated_at, p.created_at), p.author_id, u.username
+    FROM posts p
+    JOIN users u ON p.author_id = u.id
+    WHERE p.id = %s
+"""
+POST_VIEW_QUERY = """
+    SELECT p.id, p.title, p.content, p.created_at, u.username, p.author_id,
+           COALESCE(p.updated_at, p.created_at)
+    FROM posts p
+    JOIN users u ON p.author_id = u.id
+    WHERE p.id = %s
+"""
+
+# 게시글 조건부 GET (ETag / Last-Modified)
+def template_fingerprint(app_instance, manifest_fingerprint, *names):
+    """템플릿 소스 + 정적 파일 manifest 해시 (배포로 템플릿/CSS가 바뀌면 ETag도 바뀌도록)"""
+    digest = hashlib.sha1(manifest_fingerprint.encode('utf-8'))
+    for name in names:
+        source, _, _ = app_instance.jinja_loader.get_source(app_instance.jinja_env, name)
+        digest.update(source.encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+def make_post_etag(fingerprint, post_id, updated_at, author_id, author_name, viewer_id):
+    """게시글 메타데이터와 조회자 기준 strong ETag 생성
+
+    조회자에 따라 수정/삭제 버튼과 상단 메뉴가 달라지므로 viewer_id도 포함한다.
+    """
+    raw = f"{fingerprint}:{post_id}:{updated_at.isoformat()}:{author_id}:{author_name}:{viewer_id}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def is_not_modified(request_obj, etag, last_modified):
+    """If-None-Match / If-Modified-Since 요청 헤더와 비교"""
+    if request_obj.if_none_match:
+        return request_obj.if_none_match.contains_weak(etag)
+    if request_obj.if_modified_since:
+        return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= request_obj.if_modified_since
+    return False
+
+def set_private_etag(response, etag):
+    """사용자별 응답이므로 공유 캐시(CloudFront)에는 저장하지 않고 매번 ETag로 재검증"""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response
+
+def set_post_cache_headers(response, etag, last_modified):
+    response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return set_private_etag(response, etag)
+
+# 게시글 JSON API (모바일 클라이언트용)
+def dumps_json(data):
+    """빠른 JSON 직렬화 (orjson이 없으면 표준 json, datetime은 ISO 8601)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=lambda value: value.isoformat()).encode('utf-8')
+
+# fields= 로 선택 가능한 필드 -> SQL 표현식 (목록에서는 content를 제공하지 않음)
+POST_API_FIELDS = {
+    'id': 'p.id',
+    'title': 'p.title',
+    'excerpt': f'LEFT(p.content, {BOARD_EXCERPT_LENGTH})',
+    'content': 'p.content',
+    'author': 'u.username',
+    'author_id': 'p.author_id',
+    'created_at': 'p.created_at',
+    'updated_at': 'COALESCE(p.updated_at, p.created_at)',
+}
+POST_LIST_FIELDS = ('id', 'title', 'excerpt', 'author', 'author_id', 'created_at', 'updated_at')
+POST_LIST_DEFAULT_FIELDS = ('id', 'title', 'author', 'created_at')
+POST_DETAIL_DEFAULT_FIELDS = ('id', 'title', 'content', 'author', 'author_id', 'created_at', 'updated_at')
+
+POST_API_META_QUERY = """
+    SELECT COALESCE(p.updated_at, p.created_at), u.username
+    FROM posts p
+    JOIN users u ON p.author_id = u.id
+    WHERE p.id = %s
+"""
+
+def parse_post_fields(value, allowed, default):
+    """fields=id,title 파라미터 검증 -> 필드 튜플, 허용되지 않은 필드가 있으면 None"""
+    if not value:
+        return default
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+    if not fields or any(name not in allowed for name in fields):
+        return None
+    return fields
+
+def post_list_query(fields, limit, older=None):
+    """older=(created_at, id)보다 오래된 글 limit + 1개 -> (sql, params), 커서 계산용 id, created_at은 항상 조회"""
+    columns = ', '.join(['p.id', 'p.created_at'] + [POST_API_FIELDS[name] for name in fields])
+    query = f"SELECT {columns} FROM posts p JOIN users u ON p.author_id = u.id"
+    if older:
+        query += " WHERE p.created_at < %s OR (p.created_at = %s AND p.id < %s)"
+        params = (older[0], older[0], older[1], limit + 1)
+    else:
+        params = (limit + 1,)
+    query += " ORDER BY p.created_at DESC, p.id DESC LIMIT %s"
+    return query, params
+
+def post_list_body(rows, fields, limit):
+    """post_list_query 결과 -> 직렬화된 JSON (목록은 이 결과의 해시를 ETag로 사용)"""
+    page = rows[:limit]
+    next_cursor = encode_board_cursor(page[-1][1], page[-1][0]) if len(rows) > limit else None
+    return dumps_json({
+        'posts': [dict(zip(fields, row[2:])) for row in page],
+        'next_cursor': next_cursor
+    })
+
+def post_detail_query(fields):
+    columns = ', '.join(POST_API_FIELDS[name] for name in fields)
+    return f"SELECT {columns} FROM posts p JOIN users u ON p.author_id = u.id WHERE p.id = %s"
+
+def post_detail_etag(post_id, updated_at, author_name, fields):
+    return hashlib.sha1(f"{post_id}:{updated_at.isoformat()}:{author_name}:{fields}".encode('utf-8')).hexdigest()
+
+# 정적 파일 fingerprint (내용 해시를 파일명에 넣어 1년 immutable 캐시)
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+PRECOMPRESSED_SUFFIXES = ('.gz', '.br')
+
+def build_asset_manifest(static_folder):
+    """static 아래 파일별 해시 파일명 -> {'css/base.css': 'css/base.<hash>.css'}
+
+    빌드 단계에서 만든 압축본(.gz/.br)은 원본의 다른 표현이므로 manifest에 넣지 않는다.
+    """
+    manifest = {}
+    for root, _, files in os.walk(static_folder):
+        for filename in files:
+            if filename.endswith(PRECOMPRESSED_SUFFIXES):
+                continue
+            full_path = os.path.join(root, filename)
+            logical = os.path.relpath(full_path, static_folder).replace(os.sep, '/')
+            with open(full_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:12]
+            stem, ext = os.path.splitext(logical)
+            manifest[logical] = f"{stem}.{digest}{ext}"
+    return manifest
+
+def manifest_fingerprint(manifest):
+    return hashlib.sha1(json.dumps(manifest, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+def unhashed_asset_path(filename):
+    """'css/base.<hash>.css' -> 'css/base.css' (배포 중 다른 버전의 해시로 요청된 경우)"""
+    stem, ext = os.path.splitext(filename)
+    return f"{stem.rsplit('.', 1)[0]}{ext}"
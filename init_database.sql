@@ -23,9 +23,13 @@ CREATE TABLE IF NOT EXISTS posts (
     content TEXT NOT NULL,
     author_id INT NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    -- 게시글 ETag/Last-Modified의 버전 값이므로 마이크로초 단위 (같은 초 안의 수정도 구분)
+    -- 기존 DB: ALTER TABLE posts MODIFY updated_at DATETIME(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+    updated_at DATETIME(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     FOREIGN KEY (author_id) REFERENCES users(id) ON DELETE CASCADE,
-    INDEX idx_created_at (created_at DESC),
+    -- 게시판 커서 페이지네이션 (created_at, id) 정렬용
+    -- 기존 DB: ALTER TABLE posts DROP INDEX idx_created_at, ADD INDEX idx_created_at (created_at DESC, id DESC);
+    INDEX idx_created_at (created_at DESC, id DESC),
     INDEX idx_author_id (author_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
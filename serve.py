@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""프로덕션 실행기 (gunicorn 설정 겸 실행 스크립트)
+
+예)
+  python serve.py                              # CPU 수 기준 워커/스레드 자동 설정 (gthread)
+  python serve.py --mode gevent                # I/O 대기가 긴 요청/SSE 연결이 많을 때
+  python serve.py --mode asgi                  # app_async.py (Quart) + UvicornWorker (requirements_async.txt)
+  python serve.py --mode dev --bind 127.0.0.1:5000   # 기존 app.run 개발 서버 (비교용)
+  gunicorn -c serve.py app:app                 # gunicorn 설정 파일로 직접 사용
+
+- app은 master에서 한 번만 import(preload)하고, DB 풀 워밍업과 백그라운드 스레드는
+  fork 이후 워커마다 시작한다 (APP_DEFER_STARTUP, app.start_worker).
+- 워커/스레드 수는 CPU 수(컨테이너 affinity 반영)로 정하고 환경 변수로 덮어쓴다:
+  WEB_MODE, WEB_BIND, WEB_CONCURRENCY(워커), WEB_THREADS, WEB_WORKER_CONNECTIONS, WEB_TIMEOUT
+- 워커당 MySQL 풀 최대 크기는 동시 처리 수에 맞춘다 (MYSQL_POOL_MAX를 지정하지 않은 경우).
+- gthread 모드는 SSE 상태 스트림이 스레드를 점유하므로 워커당 스트림 수를 스레드 수 - 1로 제한한다
+  (STATUS_STREAM_MAX_CLIENTS, 초과한 대시보드는 503을 받고 폴링으로 전환). 대시보드가 많으면 gevent/asgi 모드 사용.
+- gevent 모드는 PyMySQL이 있으면 MySQLdb 대신 사용한다 (mysqlclient는 C 확장이라 쿼리 중 이벤트 루프가 멈춤).
+- asgi 모드는 app_async:app을 워커마다 이벤트 루프 하나로 실행한다 (연결/백그라운드 태스크는 lifespan 시작 때 생성).
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+MODES = ('gthread', 'gevent', 'asgi', 'dev')
+
+def cpu_count():
+    """사용 가능한 CPU 수 (컨테이너/affinity 제한 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+def tune(mode, cpus):
+    """모드별 기본 워커/스레드 수
+
+    gthread: 요청이 대부분 DB/Redis 대기이므로 CPU당 2 + 1 워커, 워커당 스레드 4개
+    gevent: CPU당 워커 하나가 많은 연결을 greenlet으로 처리
+    asgi: CPU당 워커 하나가 많은 연결을 이벤트 루프로 처리
+    """
+    if mode == 'asgi':
+        return {'workers': cpus, 'threads': 1, 'worker_connections': None}
+    if mode == 'gevent':
+        return {'workers': cpus, 'threads': 1,
+                'worker_connections': int(os.getenv('WEB_WORKER_CONNECTIONS', '1000'))}
+    return {'workers': cpus * 2 + 1, 'threads': 4, 'worker_connections': None}
+
+mode = os.getenv('WEB_MODE', 'gthread')
+if mode not in MODES:
+    sys.exit(f"WEB_MODE must be one of: {', '.join(MODES)}")
+sizing = tune(mode, cpu_count())
+sizing['workers'] = int(os.getenv('WEB_CONCURRENCY', sizing['workers']))
+sizing['threads'] = int(os.getenv('WEB_THREADS', sizing['threads']))
+
+def app_target(mode):
+    return 'app_async:app' if mode == 'asgi' else 'app:app'
+
+def prepare_environment():
+    """app import 전에 필요한 준비 (gunicorn 설정으로 읽힐 때만 수행)"""
+    if mode == 'asgi':
+        # app_async는 import 시 연결하지 않으므로 미룰 시작 작업이 없다
+        return
+    if mode == 'gevent':
+        # app(및 redis/threading)을 import하기 전에 패치해야 풀의 Condition, 소켓 대기가 greenlet 전환이 된다
+        from gevent import monkey
+        monkey.patch_all()
+        try:
+            import pymysql
+            pymysql.install_as_MySQLdb()
+        except ImportError:
+            print("serve.py: PyMySQL not installed, MySQL queries will block the gevent loop", file=sys.stderr)
+    os.environ.setdefault('APP_DEFER_STARTUP', 'true')
+    # 스레드마다 연결 하나 + 백그라운드 점검용 하나 (gevent는 풀이 동시 쿼리 수를 제한)
+    if mode == 'gthread':
+        os.environ.setdefault('MYSQL_POOL_MAX', str(sizing['threads'] + 1))
+        # SSE 연결은 끝날 때까지 스레드 하나를 잡으므로 일반 요청용으로 최소 한 스레드는 남긴다
+        os.environ.setdefault('STATUS_STREAM_MAX_CLIENTS', str(max(0, sizing['threads'] - 1)))
+    # 워커별 메트릭을 /metrics에서 합산 (prometheus_client가 있을 때만 의미 있음)
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='flask-board-metrics-')
+
+if __name__ != '__main__':
+    prepare_environment()
+
+# gunicorn 설정 (gunicorn -c serve.py 로 읽힘)
+wsgi_app = app_target(mode)
+chdir = os.path.dirname(os.path.abspath(__file__))  # templates/static 경로 기준
+bind = os.getenv('WEB_BIND', f"0.0.0.0:{os.getenv('PORT', '5000')}")
+worker_class = {'gevent': 'gevent', 'asgi': 'uvicorn.workers.UvicornWorker'}.get(mode, 'gthread')
+workers = sizing['workers']
+threads = sizing['threads']
+if sizing['worker_connections']:
+    worker_connections = sizing['worker_connections']
+preload_app = True
+timeout = int(os.getenv('WEB_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('WEB_KEEPALIVE', '5'))
+# 메모리 누수/단편화 대비 워커 재시작 (동시에 재시작하지 않도록 jitter)
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', '10000'))
+max_requests_jitter = max_requests // 10
+accesslog = os.getenv('WEB_ACCESS_LOG')  # 예: '-' (stdout)
+
+def when_ready(server):
+    pool_max = int(os.getenv('MYSQL_POOL_MAX', '10'))
+    connections = f", {sizing['worker_connections']} connections" if sizing['worker_connections'] else ''
+    per_worker = 'event loop' if mode == 'asgi' else f"{threads} threads"
+    server.log.info(f"Mode {mode}: {workers} workers x {per_worker}{connections}, "
+                    f"MySQL connections up to {workers * pool_max}{'' if mode == 'asgi' else ' (+ replicas)'}")
+
+def pre_fork(server, worker):
+    if mode == 'gevent':
+        # master에서 끝난 스레드(greenlet)가 정리될 기회를 줘서 워커로 복제되지 않게 한다
+        import gevent
+        gevent.sleep(0.1)
+
+def post_worker_init(worker):
+    """fork 이후 워커 초기화가 끝난 뒤 연결 워밍업과 백그라운드 스레드 시작"""
+    if mode == 'asgi':
+        return
+    import app as app_module
+    app_module.start_worker()
+
+def child_exit(server, worker):
+    """종료된 워커의 멀티 프로세스 메트릭 파일 정리 (gauge livesum 등에서 제외)"""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Flask 게시판 프로덕션 실행기 (gunicorn)")
+    parser.add_argument('--mode', choices=MODES, default=mode, help=f"워커 모드 (기본: {mode})")
+    parser.add_argument('--bind', default=bind, help=f"바인드 주소 (기본: {bind})")
+    parser.add_argument('-w', '--workers', type=int, help="워커 수 (기본: CPU 수 기준 자동)")
+    parser.add_argument('--threads', type=int, help="워커당 스레드 수 (gthread)")
+    parser.add_argument('--worker-connections', type=int, help="워커당 동시 연결 수 (gevent)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ['WEB_MODE'] = args.mode
+    os.environ['WEB_BIND'] = args.bind
+    for name, value in (('WEB_CONCURRENCY', args.workers), ('WEB_THREADS', args.threads),
+                        ('WEB_WORKER_CONNECTIONS', args.worker_connections)):
+        if value is not None:
+            os.environ[name] = str(value)
+
+    if args.mode == 'dev':
+        host, _, port = args.bind.rpartition(':')
+        from app import app
+        app.run(host=host or '0.0.0.0', port=int(port), debug=False)
+        return 0
+
+    # 위에서 정한 환경 변수로 이 파일을 gunicorn 설정으로 다시 읽는다
+    os.execvp(sys.executable, [sys.executable, '-m', 'gunicorn', '-c', os.path.abspath(__file__), app_target(args.mode)])
+
+if __name__ == '__main__':
+    sys.exit(main())
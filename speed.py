@@ -1,128 +1,359 @@
 #!/usr/bin/env python3
-import requests
-import time
+"""Flask 게시판 부하 테스트 / 응답시간 벤치마크
+
+예)
+  python speed.py --target local --username bench --password bench -c 20 -d 60 --ramp-up 10
+  python speed.py --url http://localhost:5000 --mix board=6,post=3,healthz=1 --output run1.json
+  python speed.py --target alb --username bench --password bench --compare run1.json
+
+- 워커(스레드)마다 requests.Session으로 로그인한 세션을 유지한다.
+- ramp-up 동안 워커를 나눠 시작하고, 그 구간의 요청은 통계에서 제외한다.
+- 결과는 엔드포인트별 p50/p95/p99/max, RPS, 오류율로 출력하고 --output으로 JSON 저장.
+"""
+import argparse
+import json
+import math
+import random
+import re
 import socket
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
 
 # 올바른 프로토콜 사용
 CLOUDFRONT_URL = "https://www.choiyunha.com"
 ALB_URL = "http://project-web-alb-70773185.us-east-2.elb.amazonaws.com"  # HTTP 사용
+LOCAL_URL = "http://localhost:5000"
+
+TARGETS = {'cloudfront': CLOUDFRONT_URL, 'alb': ALB_URL, 'local': LOCAL_URL}
+
+DEFAULT_MIX = 'board=50,post=35,healthz=10,login=5'
+ENDPOINTS = ('login', 'board', 'post', 'healthz')
+
+POST_LINK_PATTERN = re.compile(r'/post/(\d+)"')
 
 def check_connectivity(url, name):
     """연결 가능성 먼저 확인"""
     print(f"\n{name} 연결성 확인:")
     try:
-        if url.startswith('https://'):
-            host = url.replace('https://', '').split('/')[0]
-            port = 443
-        else:
-            host = url.replace('http://', '').split('/')[0]
-            port = 80
-        
+        parsed = urlparse(url)
+        host = parsed.hostname
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+
         # DNS 조회
         ip = socket.gethostbyname(host)
         print(f"  DNS 조회: {host} → {ip}")
-        
+
         # 포트 연결 테스트
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(10)
         result = sock.connect_ex((ip, port))
         sock.close()
-        
+
         if result == 0:
             print(f"  포트 {port} 연결: 성공")
             return True
         else:
             print(f"  포트 {port} 연결: 실패 (코드: {result})")
             return False
-            
+
     except Exception as e:
         print(f"  연결 실패: {e}")
         return False
 
-def test_url(url, name):
-    """URL 응답시간 테스트"""
-    print(f"\n{name} 성능 테스트:")
-    times = []
-    
-    for i in range(1, 6):
+def parse_mix(spec):
+    """'board=50,post=35' -> [('board', 50.0), ('post', 35.0)]"""
+    mix = []
+    for item in spec.split(','):
+        name, _, weight = item.strip().partition('=')
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint '{name}' (choose from {', '.join(ENDPOINTS)})")
         try:
-            start = time.time()
-            # SSL 검증 비활성화 및 리다이렉트 허용
-            response = requests.get(
-                url, 
-                timeout=30, 
-                allow_redirects=True,
-                verify=False,  # SSL 검증 비활성화
-                headers={'User-Agent': 'Performance-Test/1.0'}
-            )
-            end = time.time()
-            
-            elapsed_ms = (end - start) * 1000
-            times.append(elapsed_ms)
-            print(f"  Run {i}: {elapsed_ms:.2f} ms (HTTP {response.status_code})")
-            
-        except requests.exceptions.ConnectTimeout:
-            print(f"  Run {i}: 연결 타임아웃")
-        except requests.exceptions.ReadTimeout:
-            print(f"  Run {i}: 읽기 타임아웃")
-        except requests.exceptions.ConnectionError as e:
-            print(f"  Run {i}: 연결 오류 - {str(e)[:100]}...")
-        except Exception as e:
-            print(f"  Run {i}: ERROR - {str(e)[:100]}...")
-    
-    if times:
-        avg = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
-        print(f"  평균: {avg:.2f} ms")
-        print(f"  최소/최대: {min_time:.2f} / {max_time:.2f} ms")
-        print(f"  측정 성공: {len(times)}/5회")
-        return avg
-    return 0
+            weight = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight for '{name}': {weight}")
+        if weight > 0:
+            mix.append((name, weight))
+    if not mix:
+        raise argparse.ArgumentTypeError("request mix is empty")
+    return mix
 
-def main():
-    print("=== ALB vs CloudFront 성능 비교 ===")
-    print(f"CloudFront (HTTPS): {CLOUDFRONT_URL}")
-    print(f"ALB (HTTP): {ALB_URL}")
-    
-    # SSL 경고 무시
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
-    # 연결성 먼저 확인
-    cf_connected = check_connectivity(CLOUDFRONT_URL, "CloudFront")
-    alb_connected = check_connectivity(ALB_URL, "ALB")
-    
-    if not alb_connected:
-        print("\n⚠️ ALB 연결 불가 - 보안그룹이나 타겟 상태를 확인하세요")
-        return
-    
-    # 성능 테스트
-    cf_avg = test_url(CLOUDFRONT_URL, "CloudFront") if cf_connected else 0
-    alb_avg = test_url(ALB_URL, "ALB Direct") if alb_connected else 0
-    
-    print("\n" + "="*50)
-    print("=== 최종 결과 요약 ===")
-    
-    if cf_avg > 0:
-        print(f"📊 CloudFront (HTTPS): {cf_avg:.2f} ms")
-    if alb_avg > 0:
-        print(f"📊 ALB Direct (HTTP): {alb_avg:.2f} ms")
-    
-    if cf_avg > 0 and alb_avg > 0:
-        if cf_avg < alb_avg:
-            improvement = ((alb_avg - cf_avg) / alb_avg) * 100
-            print(f"✅ CloudFront가 {improvement:.1f}% 더 빠름")
-            print(f"💡 CDN 캐싱 효과로 {alb_avg - cf_avg:.2f}ms 단축")
+def percentile(sorted_values, pct):
+    """정렬된 값에서 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+class Recorder:
+    """스레드 간 공유하는 측정 결과 (엔드포인트별 응답시간, 상태 코드, 오류)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.errors = {}
+        self.status = {}
+
+    def record(self, endpoint, elapsed_ms, status_code=None, error=None):
+        with self.lock:
+            self.samples.setdefault(endpoint, []).append(elapsed_ms)
+            if error is not None:
+                key = f"{endpoint}: {error}"
+                self.errors[key] = self.errors.get(key, 0) + 1
+            else:
+                counts = self.status.setdefault(endpoint, {})
+                counts[status_code] = counts.get(status_code, 0) + 1
+
+    def summarize(self, elapsed_s):
+        with self.lock:
+            samples = {name: sorted(values) for name, values in self.samples.items()}
+            status = {name: dict(counts) for name, counts in self.status.items()}
+            errors = dict(self.errors)
+
+        def stats(values, failed):
+            count = len(values)
+            return {
+                'requests': count,
+                'rps': round(count / elapsed_s, 2) if elapsed_s else 0.0,
+                'error_rate': round(failed / count, 4) if count else 0.0,
+                'mean_ms': round(sum(values) / count, 2) if count else 0.0,
+                'p50_ms': round(percentile(values, 50), 2),
+                'p95_ms': round(percentile(values, 95), 2),
+                'p99_ms': round(percentile(values, 99), 2),
+                'max_ms': round(values[-1], 2) if values else 0.0,
+            }
+
+        endpoints = {}
+        all_values, all_failed = [], 0
+        for name, values in samples.items():
+            codes = status.get(name, {})
+            # 연결 오류와 5xx를 실패로 본다 (4xx/3xx는 애플리케이션 응답)
+            failed = sum(n for code, n in codes.items() if code >= 500)
+            failed += sum(n for key, n in errors.items() if key.startswith(f"{name}: "))
+            endpoints[name] = dict(stats(values, failed), status_codes={str(k): v for k, v in sorted(codes.items())})
+            all_values.extend(values)
+            all_failed += failed
+        all_values.sort()
+        return {'overall': stats(all_values, all_failed), 'endpoints': endpoints, 'errors': errors}
+
+class Worker(threading.Thread):
+    """가중치에 따라 엔드포인트를 골라 반복 요청하는 가상 사용자"""
+
+    def __init__(self, index, args, mix, post_ids, recorder, start_at, measure_from, stop_at):
+        super().__init__(name=f'bench-worker-{index}', daemon=True)
+        self.args = args
+        self.names = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.post_ids = post_ids
+        self.recorder = recorder
+        self.start_at = start_at
+        self.measure_from = measure_from
+        self.stop_at = stop_at
+        self.random = random.Random(args.seed + index if args.seed is not None else None)
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Performance-Test/2.0'
+        self.session.verify = not args.insecure
+
+    def login(self):
+        if not self.args.username:
+            return self.session.get(self.url('/login'), timeout=self.args.timeout, allow_redirects=False)
+        return self.session.post(
+            self.url('/login'),
+            data={'username': self.args.username, 'password': self.args.password},
+            timeout=self.args.timeout,
+            allow_redirects=False
+        )
+
+    def url(self, path):
+        return self.args.url.rstrip('/') + path
+
+    def request(self, endpoint):
+        if endpoint == 'login':
+            return self.login()
+        if endpoint == 'board':
+            path = '/board'
+        elif endpoint == 'post':
+            path = f"/post/{self.random.choice(self.post_ids)}"
         else:
-            slower = ((cf_avg - alb_avg) / alb_avg) * 100
-            print(f"⚠️ CloudFront가 {slower:.1f}% 더 느림")
-            print(f"💡 지역이나 캐시 미스로 인한 지연 가능성")
-    
-    print("\n📝 참고사항:")
-    print("  - CloudFront: HTTPS + CDN 캐싱")
-    print("  - ALB: HTTP 직접 연결")
-    print("  - 실제 사용자는 CloudFront(HTTPS)만 사용")
+            path = '/healthz'
+        return self.session.get(self.url(path), timeout=self.args.timeout, allow_redirects=False)
+
+    def run(self):
+        time.sleep(max(0.0, self.start_at - time.time()))
+        if self.args.username:
+            try:
+                self.login()
+            except requests.RequestException as e:
+                self.recorder.record('login', 0.0, error=type(e).__name__)
+
+        while True:
+            now = time.time()
+            if now >= self.stop_at:
+                break
+            endpoint = self.random.choices(self.names, self.weights)[0]
+            if endpoint == 'post' and not self.post_ids:
+                endpoint = 'board'
+            started = time.perf_counter()
+            status_code, error = None, None
+            try:
+                status_code = self.request(endpoint).status_code
+            except requests.RequestException as e:
+                error = type(e).__name__
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            # ramp-up 구간 요청은 워밍업으로 보고 통계에서 제외
+            if now >= self.measure_from:
+                self.recorder.record(endpoint, elapsed_ms, status_code, error)
+            if self.args.think_time:
+                time.sleep(self.random.uniform(0, self.args.think_time))
+
+def discover_post_ids(args):
+    """로그인 후 게시판 첫 페이지에서 게시글 ID 수집 (--post-ids 미지정 시)"""
+    if args.post_ids:
+        return args.post_ids
+    session = requests.Session()
+    session.verify = not args.insecure
+    try:
+        if args.username:
+            session.post(args.url.rstrip('/') + '/login',
+                         data={'username': args.username, 'password': args.password},
+                         timeout=args.timeout)
+        response = session.get(args.url.rstrip('/') + '/board', timeout=args.timeout)
+        if urlparse(response.url).path.rstrip('/') == '/login':
+            print("  ⚠️ 로그인 실패 또는 비로그인 - /board, /post 요청은 로그인 페이지로 리다이렉트됩니다")
+            return []
+        post_ids = sorted({int(post_id) for post_id in POST_LINK_PATTERN.findall(response.text)})
+    except requests.RequestException as e:
+        print(f"  게시글 조회 실패: {e}")
+        return []
+    print(f"  게시글 {len(post_ids)}개 발견" if post_ids else "  게시글을 찾지 못함 (post 요청은 /board로 대체)")
+    return post_ids
+
+def run_benchmark(args, mix):
+    post_ids = discover_post_ids(args) if any(name == 'post' for name, _ in mix) else []
+    recorder = Recorder()
+    begin = time.time() + 0.5
+    measure_from = begin + args.ramp_up
+    stop_at = measure_from + args.duration
+    workers = []
+    for index in range(args.concurrency):
+        # ramp-up 동안 워커를 고르게 나눠 시작
+        start_at = begin + (args.ramp_up * index / args.concurrency)
+        workers.append(Worker(index, args, mix, post_ids, recorder, start_at, measure_from, stop_at))
+    for worker in workers:
+        worker.start()
+    try:
+        while any(worker.is_alive() for worker in workers):
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        print("\n중단됨 - 지금까지의 결과를 집계합니다")
+        stop_at = time.time()
+    elapsed_s = max(0.001, min(time.time(), stop_at) - measure_from)
+
+    result = recorder.summarize(elapsed_s)
+    result['config'] = {
+        'url': args.url,
+        'concurrency': args.concurrency,
+        'duration_s': args.duration,
+        'ramp_up_s': args.ramp_up,
+        'think_time_s': args.think_time,
+        'mix': dict(mix),
+        'authenticated': bool(args.username),
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(begin)),
+        'measured_s': round(elapsed_s, 2),
+    }
+    return result
+
+def print_report(result):
+    print("\n" + "="*78)
+    print(f"=== 결과: {result['config']['url']} (동시 {result['config']['concurrency']}, "
+          f"측정 {result['config']['measured_s']}s) ===")
+    header = f"{'endpoint':<10}{'reqs':>8}{'rps':>9}{'err%':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>10}"
+    print(header)
+    print("-"*len(header))
+    rows = sorted(result['endpoints'].items()) + [('TOTAL', result['overall'])]
+    for name, s in rows:
+        print(f"{name:<10}{s['requests']:>8}{s['rps']:>9.1f}{s['error_rate'] * 100:>7.2f}%"
+              f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['max_ms']:>10.1f}")
+    print("(단위: ms)")
+    for name, s in sorted(result['endpoints'].items()):
+        print(f"  {name} 상태 코드: {s['status_codes']}")
+    if result['errors']:
+        print("\n오류:")
+        for key, count in sorted(result['errors'].items(), key=lambda item: -item[1]):
+            print(f"  {key} x{count}")
+
+def print_comparison(result, baseline_path):
+    """이전 실행(JSON)과 주요 지표 비교"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\n=== 비교: {baseline_path} ({baseline['config']['started_at']}) → 현재 ===")
+    for name in ['TOTAL'] + sorted(result['endpoints']):
+        current = result['overall'] if name == 'TOTAL' else result['endpoints'].get(name)
+        previous = baseline['overall'] if name == 'TOTAL' else baseline['endpoints'].get(name)
+        if not current or not previous:
+            continue
+        parts = []
+        for key in ('rps', 'p50_ms', 'p95_ms', 'p99_ms', 'error_rate'):
+            before, after = previous[key], current[key]
+            change = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+            parts.append(f"{key} {before}→{after} ({change})")
+        print(f"  {name:<8} " + ", ".join(parts))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Flask 게시판 부하 테스트 / 응답시간 벤치마크")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', help="대상 URL (예: http://localhost:5000)")
+    target.add_argument('--target', choices=sorted(TARGETS), default='alb', help="미리 정의된 대상 (기본: alb)")
+    parser.add_argument('-c', '--concurrency', type=int, default=10, help="동시 사용자(스레드) 수")
+    parser.add_argument('-d', '--duration', type=float, default=30, help="측정 시간 (초, ramp-up 제외)")
+    parser.add_argument('--ramp-up', type=float, default=5, help="워커를 나눠 시작하는 시간 (초)")
+    parser.add_argument('--think-time', type=float, default=0, help="요청 사이 최대 대기 시간 (초)")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"엔드포인트 가중치 (기본: {DEFAULT_MIX})")
+    parser.add_argument('--username', help="로그인할 벤치마크 계정 (없으면 비로그인 요청)")
+    parser.add_argument('--password', default='', help="벤치마크 계정 비밀번호")
+    parser.add_argument('--post-ids', type=lambda value: [int(v) for v in value.split(',')],
+                        help="조회할 게시글 ID 목록 (기본: 게시판 첫 페이지에서 수집)")
+    parser.add_argument('--timeout', type=float, default=30, help="요청 타임아웃 (초)")
+    parser.add_argument('--insecure', action='store_true', help="SSL 인증서 검증 비활성화")
+    parser.add_argument('--seed', type=int, help="요청 순서 재현용 난수 시드")
+    parser.add_argument('--output', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args(argv)
+    args.url = args.url or TARGETS[args.target]
+    if args.concurrency < 1 or args.duration <= 0 or args.ramp_up < 0:
+        parser.error("concurrency >= 1, duration > 0, ramp-up >= 0 이어야 합니다")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.insecure:
+        # SSL 경고 무시
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    print("=== Flask 게시판 부하 테스트 ===")
+    print(f"대상: {args.url}")
+    print(f"동시 {args.concurrency}, 측정 {args.duration}s, ramp-up {args.ramp_up}s, "
+          f"mix {', '.join(f'{name}={weight:g}' for name, weight in args.mix)}")
+
+    # 연결성 먼저 확인
+    if not check_connectivity(args.url, "대상"):
+        print("\n⚠️ 대상 연결 불가 - 보안그룹이나 타겟 상태를 확인하세요")
+        return 1
+
+    result = run_benchmark(args, args.mix)
+    print_report(result)
+    if args.compare:
+        print_comparison(result, args.compare)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,159 @@
+// 세션 정보를 Local Storage에 저장 (DR 정보 포함)
+function updateSessionStorage() {
+    fetch('/api/session-info')
+        .then(response => response.json())
+        .then(data => {
+            // Local Storage에 세션 정보 저장
+            localStorage.setItem('flask_session_info', JSON.stringify(data));
+            localStorage.setItem('flask_session_timestamp', new Date().toISOString());
+            
+            // DR 상태도 저장
+            if (data.cloud_provider) {
+                saveDrStatus(data.cloud_provider.current, data.cloud_provider.gcp_available, data.cloud_provider.aws_available);
+            }
+            
+            alert('🔄 Session data & DR status updated!\n\nOpen DevTools > Application > Local Storage to view');
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('❌ Failed to update session data');
+        });
+}
+
+// DR 상태를 Local Storage에 저장
+function saveDrStatus(currentProvider, gcpAvailable, awsAvailable) {
+    localStorage.setItem('dr_status', JSON.stringify({
+        current_provider: currentProvider,
+        gcp_available: gcpAvailable,
+        aws_available: awsAvailable,
+        timestamp: new Date().toISOString()
+    }));
+}
+
+// Cloud Status 확인
+function checkCloudStatus() {
+    fetch('/api/cloud-status')
+        .then(response => response.json())
+        .then(data => {
+            const message = `☁️ Cloud Provider Status\n\n` +
+                           `Current Provider: ${data.current_provider}\n` +
+                           `GCP Available: ${data.gcp_available ? '🟢 Online' : '🔴 Offline'}\n` +
+                           `AWS Available: ${data.aws_available ? '🟡 Standby' : '🔴 Offline'}\n` +
+                           `Last Check: ${new Date(data.last_health_check * 1000).toLocaleString()}`;
+            alert(message);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('❌ Failed to check cloud status');
+        });
+}
+
+// Local Storage의 세션 데이터 보기
+function viewSessionStorage() {
+    const sessionInfo = localStorage.getItem('flask_session_info');
+    const drStatus = localStorage.getItem('dr_status');
+    const timestamp = localStorage.getItem('flask_session_timestamp');
+    
+    if (sessionInfo) {
+        const data = JSON.parse(sessionInfo);
+        const dr = drStatus ? JSON.parse(drStatus) : null;
+        
+        let message = `🔍 Session Info (Updated: ${timestamp})\n\n` +
+                     `User ID: ${data.user_id}\n` +
+                     `Username: ${data.username}\n` +
+                     `Session ID: ${data.session_id}\n` +
+                     `Authenticated: ${data.is_authenticated}\n` +
+                     `Fresh Login: ${data.fresh_login}\n\n`;
+        
+        if (dr) {
+            message += `☁️ DR Status:\n` +
+                      `Current Provider: ${dr.current_provider}\n` +
+                      `GCP: ${dr.gcp_available ? 'Online' : 'Offline'}\n` +
+                      `AWS: ${dr.aws_available ? 'Online' : 'Offline'}\n\n`;
+        }
+        
+        message += `📊 Check DevTools > Application > Local Storage for full data`;
+        alert(message);
+    } else {
+        alert('⚠️ No session data found.\nClick "Update Session Storage" first.');
+    }
+}
+
+// Health Check
+function performHealthCheck() {
+    fetch('/healthz')
+        .then(response => response.json())
+        .then(data => {
+            const message = `❤️ Health Check Result\n\n` +
+                           `Status: ${data.status}\n` +
+                           `Provider: ${data.provider}\n` +
+                           `Timestamp: ${new Date(data.timestamp * 1000).toLocaleString()}`;
+            alert(message);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('❌ Health check failed');
+        });
+}
+
+// 자동으로 세션 정보 업데이트 (페이지 로드 시)
+updateSessionStorage();
+
+// 클라우드 상태 푸시 구독 (SSE): 폴링 없이 프로바이더 전환 시 바로 알림
+let notifiedProvider = null;
+
+// 상태 저장 + 전환 알림 (여러 워커/호스트가 같은 전환을 알려도 전환 대상이 바뀔 때만 한 번 표시)
+function applyCloudStatus(data) {
+    saveDrStatus(data.current_provider, data.gcp_available, data.aws_available);
+    if (notifiedProvider === null || data.current_provider === notifiedProvider) {
+        notifiedProvider = data.current_provider;
+        return;
+    }
+    notifiedProvider = data.current_provider;
+    const change = data.last_switch || {};
+    showSwitchNotice(`⚠️ Cloud Failover: switched from ${change.from} to ${data.current_provider}` +
+                     `${change.warm_standby ? ' (warm standby)' : ''} ` +
+                     `at ${new Date((change.timestamp || data.timestamp) * 1000).toLocaleString()}`);
+}
+
+// SSE를 쓸 수 없을 때 2분마다 조용히 클라우드 상태 체크
+function pollCloudStatus() {
+    setInterval(() => {
+        fetch('/api/cloud-status')
+            .then(response => response.json())
+            .then(applyCloudStatus)
+            .catch(error => console.error('Error:', error));
+    }, 2 * 60 * 1000);
+}
+
+function subscribeCloudStatus() {
+    if (!window.EventSource) {
+        pollCloudStatus();
+        return;
+    }
+    // 연결이 끊기면 브라우저가 자동으로 재연결 (서버가 retry 간격 지정)
+    const source = new EventSource('/api/cloud-status/stream');
+    source.addEventListener('error', () => {
+        // 503(워커당 스트림 수 초과) 등으로 재연결하지 않고 닫히면 폴링으로 전환
+        if (source.readyState === EventSource.CLOSED) {
+            pollCloudStatus();
+        }
+    });
+    source.addEventListener('status', event => applyCloudStatus(JSON.parse(event.data)));
+    source.addEventListener('switch', event => applyCloudStatus(JSON.parse(event.data)));
+}
+
+// 페이지 상단의 전환 알림 (모달 alert 대신 한 줄로 갱신)
+function showSwitchNotice(message) {
+    let notice = document.getElementById('switch-notice');
+    if (!notice) {
+        notice = document.createElement('div');
+        notice.id = 'switch-notice';
+        notice.className = 'alert alert-error';
+        const container = document.querySelector('.container') || document.body;
+        container.insertBefore(notice, container.firstChild);
+    }
+    notice.textContent = message;
+}
+
+subscribeCloudStatus();
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""app_async.py의 세션 식별자(_id)가 Flask-Login과 같은지 확인
+
+두 앱이 같은 Redis 세션을 쓰므로 값이 다르면 app.py의 세션 보호(basic)가
+ASGI 앱에서 로그인한 세션을 non-fresh로 바꾼다.
+
+  python test_session_identifier.py   (또는 pytest)
+"""
+from flask import Flask, request
+from flask_login.utils import _create_identifier
+
+from board_common import session_identifier
+
+CASES = [
+    {},
+    {'User-Agent': 'Mozilla/5.0'},
+    {'User-Agent': 'Mozilla/5.0 (한글 UA)'},
+    {'User-Agent': 'curl/8.0', 'X-Forwarded-For': '203.0.113.7'},
+    {'User-Agent': 'curl/8.0', 'X-Forwarded-For': '203.0.113.7, 10.0.0.2, 10.0.0.1'},
+    {'X-Forwarded-For': ''},
+]
+
+def test_session_identifier_matches_flask_login():
+    app = Flask(__name__)
+    for headers in CASES:
+        for remote_addr in ('192.0.2.10', '2001:db8::1'):
+            with app.test_request_context('/', headers=headers, environ_base={'REMOTE_ADDR': remote_addr}):
+                expected = _create_identifier()
+                actual = session_identifier(request.headers, request.remote_addr)
+            assert actual == expected, f"identifier mismatch for headers={headers} remote_addr={remote_addr}"
+
+if __name__ == '__main__':
+    test_session_identifier_matches_flask_login()
+    print("✅ session identifier matches Flask-Login")